@@ -0,0 +1,85 @@
+"""启动导入耗时预算检查
+
+使用 python -X importtime 在全新的解释器中导入启动路径上的模块，检查：
+  1. 总导入耗时（多次运行取最小值）不超过预算；
+  2. 按需加载的模块（对话框、子进程等）没有出现在启动导入图中。
+
+用法:
+    python benchmarks/check_import_time.py
+    python benchmarks/check_import_time.py --budget-ms 300 --runs 5 --top 15
+"""
+import os
+import re
+import sys
+import argparse
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STARTUP_MODULE = "scheduletime.gui.app"
+# 这些模块只能在第一次使用时导入，出现在启动导入图中即视为回归
+LAZY_MODULES = [
+    "scheduletime.gui.dialogs",
+    "scheduletime.gui.popup",
+    "subprocess",
+    "concurrent.futures",
+    "cProfile",
+    "pstats",
+]
+DEFAULT_BUDGET_MS = 400.0
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure_imports(module: str) -> Tuple[float, Dict[str, int]]:
+    # 返回顶层模块的累计导入耗时（毫秒）以及每个模块自身的耗时（微秒）
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT_DIR, capture_output=True, text=True,
+                            env=dict(os.environ, QT_QPA_PLATFORM="offscreen"))
+    if result.returncode != 0:
+        raise RuntimeError(f"导入 {module} 失败:\n{result.stderr}")
+
+    self_times: Dict[str, int] = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        self_times[name] = int(self_us)
+        if len(indent) == 1:
+            # 缩进为一个空格的是顶层导入
+            total_us += int(cumulative_us)
+    return total_us / 1000, self_times
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="启动导入耗时预算检查")
+    parser.add_argument("--module", default=STARTUP_MODULE, help="启动路径的入口模块")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="总导入耗时预算（毫秒）")
+    parser.add_argument("--runs", type=int, default=3, help="运行次数，取最小值以减少噪声")
+    parser.add_argument("--top", type=int, default=10, help="列出自身耗时最高的模块数量")
+    args = parser.parse_args(argv)
+
+    runs = [measure_imports(args.module) for _ in range(max(1, args.runs))]
+    total_ms, self_times = min(runs, key=lambda run: run[0])
+
+    print(f"{args.module} 导入耗时: {total_ms:.1f} ms（预算 {args.budget_ms:.1f} ms）")
+    for name, self_us in sorted(self_times.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {name}")
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"导入耗时 {total_ms:.1f} ms 超出预算 {args.budget_ms:.1f} ms")
+    eager = [name for name in LAZY_MODULES if name in self_times]
+    if eager:
+        failures.append(f"以下模块应按需导入，但出现在启动导入图中: {', '.join(eager)}")
+
+    for failure in failures:
+        print(f"失败: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""调度规则回放检查
+
+在模拟时钟上运行真实的调度器，回放一段时间（默认 2024 闰年全年）内的全部触发，
+并与按任务规则独立推算的触发时间逐一比较。覆盖月末（29/30/31日）、闰年 2 月 29 日、
+跨零点、夏令时切换、每周各天、任务起止日期以及错峰偏移等边界情况，任何不一致都返回非零退出码。
+
+用法:
+    python benchmarks/check_schedule_rules.py
+    python benchmarks/check_schedule_rules.py --start 2025-03-01 --days 90 --tasks 2000 --jitter 600
+    python benchmarks/check_schedule_rules.py --tz Europe/Berlin --start 2025-03-25 --days 14
+"""
+import os
+import sys
+import time
+import argparse
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+# 不需要真实窗口，使用 Qt 的离屏平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+# 2024 年 3 月 10 日 02:00 跳到 03:00，11 月 3 日 02:00 回到 01:00
+DEFAULT_TZ = "America/New_York" if hasattr(time, "tzset") else ""
+
+
+def make_edge_tasks() -> list:
+    from PyQt6.QtCore import QTime, QDate
+    from scheduletime.core import Task, TaskStatus
+
+    def make(index: int, schedule_type: str, **fields):
+        task = Task()
+        task.id = f"edge-{index}"
+        task.name = f"边界任务 {index}"
+        task.status = TaskStatus.ENABLED
+        task.schedule_type = schedule_type
+        task.start_date = QDate(1970, 1, 1)
+        task.end_date = QDate(9999, 12, 31)
+        task.enable_logging = False
+        for name, value in fields.items():
+            setattr(task, name, value)
+        return task
+
+    tasks = []
+    # 02:30 / 01:30 分别落在夏令时开始时跳过、结束时重复的那一小时
+    for daily_time in (QTime(0, 0), QTime(1, 30), QTime(2, 30), QTime(12, 30), QTime(23, 59)):
+        tasks.append(make(len(tasks), "daily", daily_time=daily_time))
+    for day in range(7):
+        tasks.append(make(len(tasks), "weekly", weekly_day=day, daily_time=QTime(0, 0)))
+    for day in (1, 15, 28, 29, 30, 31):
+        tasks.append(make(len(tasks), "monthly", monthly_day=day, daily_time=QTime(23, 59)))
+    for seconds in (599, 3600, 86400, 7 * 86400 + 1):
+        tasks.append(make(len(tasks), "interval", interval_seconds=seconds))
+    # 起止日期落在回放区间内：开始之前和结束之后都不能触发（包括结束于闰日、开始于夏令时切换当天）
+    windows = (("daily", QDate(2024, 3, 10), QDate(2024, 6, 10), {"daily_time": QTime(2, 30)}),
+               ("weekly", QDate(1970, 1, 1), QDate(2024, 1, 10), {"weekly_day": 2, "daily_time": QTime(9, 0)}),
+               ("monthly", QDate(2024, 2, 1), QDate(2024, 2, 29), {"monthly_day": 29, "daily_time": QTime(23, 59)}),
+               ("monthly", QDate(2024, 4, 1), QDate(9999, 12, 31), {"monthly_day": 31, "daily_time": QTime(0, 0)}),
+               ("interval", QDate(2024, 7, 1), QDate(2024, 7, 2), {"interval_seconds": 3600}))
+    for schedule_type, start_date, end_date, fields in windows:
+        tasks.append(make(len(tasks), schedule_type, **fields))
+        tasks[-1].start_date, tasks[-1].end_date = start_date, end_date
+    return tasks
+
+
+def make_mixed_tasks(count: int) -> list:
+    # 合成任务中的固定间隔最短 1 分钟，回放一年触发次数过多，这里统一放大为 1 小时 ~ 5 天
+    from PyQt6.QtCore import QDate
+    from run_benchmarks import make_synthetic_tasks
+
+    tasks = make_synthetic_tasks(count)
+    for task in tasks:
+        task.start_date = QDate(1970, 1, 1)
+        task.end_date = QDate(9999, 12, 31)
+        if task.schedule_type == "interval":
+            task.interval_seconds *= 60
+    return tasks
+
+
+def expected_fires(task, jitter, start: datetime, end: datetime) -> List[datetime]:
+    # 不经过调度器，直接按任务规则推算 (start, end] 内、任务起止日期之间的触发时间
+    fires = []
+    if task.schedule_type == "interval":
+        fire = jitter.first_interval_run(task, start) or start + timedelta(seconds=task.interval_seconds)
+        while fire <= end:
+            fires.append(fire)
+            fire += timedelta(seconds=task.interval_seconds)
+    else:
+        offset = jitter.offset_for(task)
+        now = start
+        while True:
+            fire = task.get_next_run_datetime(now, offset_seconds=offset)
+            if fire is None or fire > end:
+                break
+            fires.append(fire)
+            now = fire
+    first_day, last_day = task.start_date.toPyDate(), task.end_date.toPyDate()
+    return [fire for fire in fires if first_day <= fire.date() <= last_day]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from scheduletime.core import TaskStatus, ScheduleSimulator
+    from scheduletime.core.jitter import JitterSettings
+
+    parser = argparse.ArgumentParser(description="调度规则回放检查")
+    parser.add_argument("--start", default="2024-01-01", help="回放起点（YYYY-MM-DD）")
+    parser.add_argument("--days", type=int, default=366, help="回放天数")
+    parser.add_argument("--tasks", type=int, default=1000, help="额外加入的合成任务数量")
+    parser.add_argument("--jitter", type=int, default=300, help="错峰窗口（秒）")
+    parser.add_argument("--show", type=int, default=10, help="最多列出的不一致任务数量")
+    parser.add_argument("--tz", default=DEFAULT_TZ, help="回放使用的时区，默认选一个有夏令时切换的时区；留空按本地时区")
+    args = parser.parse_args(argv)
+
+    if args.tz and hasattr(time, "tzset"):
+        # 本地时间的夏令时切换只能在 POSIX 上通过 TZ 环境变量模拟
+        os.environ["TZ"] = args.tz
+        time.tzset()
+
+    start = datetime.strptime(args.start, "%Y-%m-%d")
+    end = start + timedelta(days=args.days)
+    jitter = JitterSettings(args.jitter)
+    tasks = make_edge_tasks() + make_mixed_tasks(args.tasks)
+
+    result = ScheduleSimulator(jitter).run(tasks, start, end)
+    print(f"回放 {start:%Y-%m-%d} ~ {end:%Y-%m-%d}: {len(tasks)} 个任务，{result.fire_count} 次触发，"
+          f"耗时 {result.elapsed:.2f} 秒（{result.fires_per_second:.0f} 次/秒）")
+
+    actual = {}
+    for fire, task in result.fires():
+        actual.setdefault(task.id, []).append(fire)
+
+    mismatches = []
+    for task in tasks:
+        expected = expected_fires(task, jitter, start, end) if task.status == TaskStatus.ENABLED else []
+        fires = actual.get(task.id, [])
+        if fires != expected:
+            mismatches.append((task, expected, fires))
+
+    for task, expected, fires in mismatches[:args.show]:
+        first_diff = next((i for i, (a, b) in enumerate(zip(expected, fires)) if a != b), min(len(expected), len(fires)))
+        print(f"不一致: {task.id} {task.get_schedule_description()} 预期 {len(expected)} 次，实际 {len(fires)} 次，"
+              f"第 {first_diff + 1} 次: 预期 {expected[first_diff] if first_diff < len(expected) else '-'}，"
+              f"实际 {fires[first_diff] if first_diff < len(fires) else '-'}")
+    if mismatches:
+        print(f"失败: {len(mismatches)} 个任务的触发时间与规则不一致")
+        return 1
+    print("全部任务的触发时间与规则一致")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
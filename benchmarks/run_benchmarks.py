@@ -0,0 +1,380 @@
+"""定时任务管理器热点路径基准测试
+
+构造 10 ~ 100k 个合成任务，测量持久化、调度、界面刷新和 CMD 派发等热点路径，
+并输出机器可读的 JSON 报告，便于在不同提交之间比较回归。
+
+用法:
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --sizes 10,1000 --only save_tasks,filter_tasks
+    python benchmarks/run_benchmarks.py --compare old.json new.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+# 基准测试不需要真实窗口，使用 Qt 的离屏平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+BENCHMARKS = [
+    "save_tasks",
+    "load_tasks",
+    "reschedule_all_tasks",
+    "scheduler_tick",
+    "get_next_run_time",
+    "refresh_tasks",
+    "filter_tasks",
+    "cmd_dispatch",
+    "journal_recovery",
+    "forecast_week",
+    "simulate_month",
+    "startup_minimized",
+    "startup_window",
+]
+STARTUP_TIMEOUT = 60.0
+SEARCH_QUERIES = ["备份", "cmd", "提醒", "task-4", "不存在的任务", ""]
+WORDS = ["备份", "同步", "导出", "清理", "提醒", "报表", "检查", "上传", "下载", "休息"]
+
+
+def make_synthetic_tasks(count: int, seed: int = 42) -> list:
+    from PyQt6.QtCore import QTime, QDate
+    from scheduletime.core import Task, TaskType, TaskStatus, PopupType
+
+    rng = random.Random(seed)
+    today = QDate.currentDate()
+    tasks = []
+    for i in range(count):
+        task = Task()
+        task.id = f"bench-{i}"
+        task.name = f"{rng.choice(WORDS)}{rng.choice(WORDS)} task-{i}"
+        task.description = f"合成任务 {i}"
+        task.task_type = TaskType.CMD if i % 3 == 0 else TaskType.NOTIFICATION
+        task.status = TaskStatus.ENABLED if i % 10 else TaskStatus.DISABLED
+        task.schedule_type = ("interval", "daily", "weekly", "monthly")[i % 4]
+        task.interval_seconds = rng.choice([60, 300, 1200, 3600, 7200])
+        task.daily_time = QTime(rng.randrange(24), rng.randrange(60))
+        task.weekly_day = rng.randrange(7)
+        task.monthly_day = rng.randrange(1, 29)
+        task.start_date = today.addDays(-1)
+        task.end_date = today.addYears(1)
+        task.cmd_command = f"echo bench {i}"
+        task.notification_title = f"提醒 {i}"
+        task.notification_content = f"合成提醒内容 {i}"
+        task.popup_type = PopupType.SYSTEM_TRAY.value
+        if i % 2:
+            task.last_execution = datetime.now() - timedelta(seconds=rng.randrange(3600))
+        task.enable_logging = False
+        tasks.append(task)
+    return tasks
+
+
+def measure(fn: Callable[[], Any], setup: Optional[Callable[[], Any]] = None,
+            max_rounds: int = 20, max_time: float = 2.0) -> Dict[str, float]:
+    # 至少运行一轮；在轮数或总耗时达到上限时停止
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < max_rounds:
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+        if time.perf_counter() - started > max_time:
+            break
+    return {
+        "rounds": len(timings),
+        "min": min(timings),
+        "max": max(timings),
+        "mean": statistics.mean(timings),
+        "median": statistics.median(timings),
+    }
+
+
+class BenchmarkSession:
+    def __init__(self, work_dir: str, max_time: float):
+        from PyQt6.QtWidgets import QApplication
+
+        self.work_dir = work_dir
+        self.max_time = max_time
+        self.app = QApplication.instance() or QApplication(sys.argv[:1])
+        self.dispatched = 0
+
+        # TaskManager 使用当前目录下的 tasks.json，切换到临时目录避免覆盖真实数据
+        os.chdir(work_dir)
+        from scheduletime.gui.main_window import TaskManager
+        self.manager = TaskManager()
+        self.stop_scheduler()
+
+        # 调度触发只计数，不真正执行任务
+        self.manager.scheduler.task_due.disconnect()
+        self.manager.scheduler.task_due.connect(self.on_dispatch)
+
+    def on_dispatch(self, task):
+        self.dispatched += 1
+
+    def stop_scheduler(self):
+        self.manager.scheduler.stop()
+        self.manager.countdown_timer.stop()
+        self.manager.scheduler.jobs.clear()
+
+    def use_tasks(self, tasks: list):
+        self.manager.tasks = tasks
+        self.manager.save_tasks()
+
+    def measure_startup(self, tasks: list, minimized: bool) -> Dict[str, Any]:
+        # 在子进程中冷启动应用：额外放入一个 1 秒间隔的探测任务，
+        # 记录任务加载、调度器就绪、首次触发的耗时和峰值内存
+        from scheduletime.core import TaskType, TaskStatus
+
+        startup_dir = tempfile.mkdtemp(dir=self.work_dir)
+        probe = make_synthetic_tasks(1)[0]
+        probe.id = "startup-probe"
+        probe.task_type = TaskType.NOTIFICATION
+        probe.status = TaskStatus.ENABLED
+        probe.schedule_type = "interval"
+        probe.interval_seconds = 1
+        with open(os.path.join(startup_dir, "tasks.json"), "w", encoding="utf-8") as f:
+            json.dump([probe.to_dict()] + [task.to_dict() for task in tasks], f, ensure_ascii=False)
+
+        report_path = os.path.join(startup_dir, "startup.json")
+        env = dict(os.environ, SCHEDULETIME_STARTUP_REPORT=report_path, QT_QPA_PLATFORM="offscreen")
+        args = [sys.executable, os.path.join(ROOT_DIR, "main.py")] + (["--minimized"] if minimized else [])
+
+        metrics: Dict[str, Any] = {}
+        started = time.perf_counter()
+        wall_first_fire = None
+        process = subprocess.Popen(args, cwd=startup_dir, env=env,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            while time.perf_counter() - started < STARTUP_TIMEOUT and process.poll() is None:
+                try:
+                    with open(report_path, "r", encoding="utf-8") as f:
+                        metrics = json.load(f)
+                except (OSError, ValueError):
+                    metrics = {}
+                if "first_fire_ms" in metrics:
+                    wall_first_fire = time.perf_counter() - started
+                    break
+                time.sleep(0.02)
+        finally:
+            process.kill()
+            process.wait()
+
+        if wall_first_fire is None:
+            raise RuntimeError("应用未能在超时时间内完成首次调度触发")
+        seconds = metrics["first_fire_ms"] / 1000
+        return {
+            "rounds": 1,
+            "min": seconds,
+            "max": seconds,
+            "mean": seconds,
+            "median": seconds,
+            "wall_first_fire_ms": round(wall_first_fire * 1000, 1),
+            "tasks_loaded_ms": metrics.get("tasks_loaded_ms"),
+            "scheduler_ready_ms": metrics.get("scheduler_ready_ms"),
+            "ui_built_ms": metrics.get("ui_built_ms"),
+            "peak_memory_kb": metrics.get("peak_memory_kb"),
+        }
+
+    def run(self, name: str, size: int, tasks: list) -> Dict[str, Any]:
+        manager = self.manager
+        scheduler = manager.scheduler
+        self.use_tasks(tasks)
+        ops = size
+
+        if name == "save_tasks":
+            stats = measure(manager.save_tasks, max_time=self.max_time)
+        elif name == "load_tasks":
+            stats = measure(manager.load_tasks, max_time=self.max_time)
+        elif name == "reschedule_all_tasks":
+            stats = measure(scheduler.reschedule_all, max_time=self.max_time)
+        elif name == "scheduler_tick":
+            scheduler.reschedule_all()
+            stats = measure(scheduler.tick, max_rounds=200, max_time=self.max_time)
+            scheduler.jobs.clear()
+        elif name == "get_next_run_time":
+            stats = measure(lambda: [task.get_next_run_time() for task in manager.tasks],
+                            max_time=self.max_time)
+        elif name == "refresh_tasks":
+            stats = measure(manager.refresh_tasks, max_time=self.max_time)
+        elif name == "filter_tasks":
+            manager.refresh_tasks()
+            queries = iter(SEARCH_QUERIES * 1000)
+
+            def set_query():
+                manager.search_edit.blockSignals(True)
+                manager.search_edit.setText(next(queries))
+                manager.search_edit.blockSignals(False)
+
+            stats = measure(manager.filter_tasks, setup=set_query, max_time=self.max_time)
+        elif name == "cmd_dispatch":
+            # 完整的 CMD 派发路径：保存任务文件、在执行器中运行命令并等待结果回到界面线程
+            cmd_task = next(task for task in manager.tasks if task.cmd_command)
+
+            def dispatch():
+                manager.execute_task(cmd_task)
+                while manager.executor.active_count():
+                    self.app.processEvents()
+                    time.sleep(0.001)
+
+            stats = measure(dispatch, max_rounds=10, max_time=self.max_time)
+            ops = 1
+        elif name == "journal_recovery":
+            # 先通过执行日志记录 n 次已结束的执行（最多 1 万次，每条都会 fsync）和一次未结束的执行，
+            # 再测量启动时的恢复耗时；日志会定期压缩，恢复耗时不应随执行次数增长
+            from scheduletime.storage import RunJournal
+
+            journal_path = os.path.join(self.work_dir, f"bench-{size}.wal")
+            runs = min(size, 10000)
+
+            def write_journal():
+                journal = RunJournal(journal_path)
+                journal.acknowledge([record["run_id"] for record in journal.recover()])
+                for i in range(runs):
+                    journal.start(f"run-{i}", "bench-0", "bench", "")
+                    journal.finish(f"run-{i}", "")
+                journal.start("orphan", "bench-0", "bench", "")
+
+            stats = measure(lambda: RunJournal(journal_path).recover(), setup=write_journal,
+                            max_rounds=3, max_time=self.max_time)
+            stats["journal_runs"] = runs
+            ops = 1
+        elif name == "forecast_week":
+            # 一周的负载预测：以调度器中作业的触发时间为起点，一次遍历计算每分钟触发次数和CMD占用
+            scheduler.reschedule_all()
+            durations = {task.id: 5.0 for task in manager.tasks}
+            stats = measure(lambda: scheduler.forecast(7 * 24, durations), max_rounds=20,
+                            max_time=self.max_time)
+            scheduler.jobs.clear()
+        elif name == "simulate_month":
+            # 在模拟时钟上回放 30 天的调度，吞吐量按触发次数计算；固定间隔任务一个月触发次数过多，不参与
+            from scheduletime.core import ScheduleSimulator
+
+            timed_tasks = [task for task in manager.tasks if task.schedule_type != "interval"]
+            start = datetime.now()
+            results = []
+            stats = measure(lambda: results.append(ScheduleSimulator(scheduler.jitter).run(
+                timed_tasks, start, start + timedelta(days=30), record=False)), max_rounds=3, max_time=self.max_time)
+            stats["fires"] = results[-1].fire_count
+            ops = results[-1].fire_count
+        elif name in ("startup_minimized", "startup_window"):
+            stats = self.measure_startup(tasks, minimized=name == "startup_minimized")
+            ops = 1
+        else:
+            raise ValueError(f"未知的基准测试: {name}")
+
+        stats["ops_per_sec"] = ops / stats["median"] if stats["median"] > 0 else None
+        return {"name": name, "size": size, **stats}
+
+
+def collect_metadata() -> Dict[str, Any]:
+    def git(*args):
+        try:
+            return subprocess.run(["git", *args], cwd=ROOT_DIR, capture_output=True,
+                                  text=True, check=True).stdout.strip()
+        except Exception:
+            return None
+
+    meta = {
+        "timestamp": datetime.now().isoformat(),
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(git("status", "--porcelain")),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+    try:
+        from PyQt6.QtCore import PYQT_VERSION_STR, QT_VERSION_STR
+        meta["pyqt"] = PYQT_VERSION_STR
+        meta["qt"] = QT_VERSION_STR
+    except ImportError:
+        pass
+    return meta
+
+
+def run_benchmarks(sizes: List[int], names: List[str], max_time: float) -> Dict[str, Any]:
+    results = []
+    with tempfile.TemporaryDirectory(prefix="scheduletime-bench-") as work_dir:
+        cwd = os.getcwd()
+        try:
+            session = BenchmarkSession(work_dir, max_time)
+            for size in sizes:
+                tasks = make_synthetic_tasks(size)
+                for name in names:
+                    result = session.run(name, size, tasks)
+                    results.append(result)
+                    print(f"{name:<22} n={size:<7} median={result['median'] * 1000:10.3f} ms"
+                          f"  rounds={result['rounds']}", flush=True)
+        finally:
+            os.chdir(cwd)
+    return {"meta": collect_metadata(), "results": results}
+
+
+def compare_reports(old_path: str, new_path: str, threshold: float) -> int:
+    with open(old_path, "r", encoding="utf-8") as f:
+        old = json.load(f)
+    with open(new_path, "r", encoding="utf-8") as f:
+        new = json.load(f)
+
+    old_results = {(r["name"], r["size"]): r for r in old["results"]}
+    regressions = 0
+    print(f"{'benchmark':<22} {'size':>7} {'old ms':>12} {'new ms':>12} {'ratio':>8}")
+    for result in new["results"]:
+        key = (result["name"], result["size"])
+        if key not in old_results:
+            continue
+        old_median = old_results[key]["median"]
+        ratio = result["median"] / old_median if old_median > 0 else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  <-- 回归"
+            regressions += 1
+        print(f"{key[0]:<22} {key[1]:>7} {old_median * 1000:>12.3f} {result['median'] * 1000:>12.3f}"
+              f" {ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="定时任务管理器热点路径基准测试")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="逗号分隔的任务数量列表")
+    parser.add_argument("--only", default="", help="只运行指定的基准测试（逗号分隔）")
+    parser.add_argument("--max-time", type=float, default=2.0, help="单项基准测试的时间预算（秒）")
+    parser.add_argument("--output", default="", help="JSON 报告输出路径")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="比较两份 JSON 报告")
+    parser.add_argument("--threshold", type=float, default=0.1, help="判定为回归的中位数增幅")
+    parser.add_argument("--fail-on-regression", action="store_true", help="存在回归时返回非零退出码")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        regressions = compare_reports(args.compare[0], args.compare[1], args.threshold)
+        return 1 if regressions and args.fail_on_regression else 0
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    names = [n.strip() for n in args.only.split(",") if n.strip()] or BENCHMARKS
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"未知的基准测试: {', '.join(sorted(unknown))}")
+
+    report = run_benchmarks(sizes, names, args.max_time)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"报告已写入 {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4 @@
+# 定时任务管理器
+#   core    - 任务模型、依赖图、执行器和调度器（不依赖界面控件）
+#   storage - 任务数据持久化
+#   gui     - 主窗口、表格模型和对话框（对话框按需导入）
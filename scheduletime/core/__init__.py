@@ -0,0 +1,14 @@
+from .task import Task, TaskType, PopupType, TaskStatus, OverlapPolicy, RecoveryPolicy, CatchUpPolicy
+from .graph import TaskGraph
+from .pools import ResourcePool
+from .isolation import FailureKind
+from .executor import TaskRun, TaskExecutor
+from .scheduler import TaskScheduler
+from .clock import SystemClock, SimulatedClock
+from .simulation import ScheduleSimulator, SimulationResult
+
+__all__ = [
+    "Task", "TaskType", "PopupType", "TaskStatus", "OverlapPolicy", "RecoveryPolicy", "CatchUpPolicy",
+    "TaskGraph", "ResourcePool", "FailureKind", "TaskRun", "TaskExecutor", "TaskScheduler",
+    "SystemClock", "SimulatedClock", "ScheduleSimulator", "SimulationResult",
+]
@@ -0,0 +1,223 @@
+import functools
+import heapq
+import itertools
+import random
+import time as time_module
+from datetime import date, datetime, timedelta
+from typing import Hashable, List, Optional, Set
+
+import schedule
+from PyQt6.QtCore import QDate
+
+
+class SystemClock:
+    # 真实时钟：调度器默认使用
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def today(self) -> QDate:
+        return QDate.currentDate()
+
+    def sleep(self, seconds: float):
+        time_module.sleep(seconds)
+
+
+class SimulatedClock(SystemClock):
+    # 模拟时钟：时间只在 sleep/advance_to 时前进，用于测试和回放调度规则
+    def __init__(self, start: datetime):
+        self.current = start
+
+    def now(self) -> datetime:
+        return self.current
+
+    def today(self) -> QDate:
+        return QDate(self.current.year, self.current.month, self.current.day)
+
+    def sleep(self, seconds: float):
+        self.current += timedelta(seconds=seconds)
+
+    def advance_to(self, moment: datetime):
+        if moment > self.current:
+            self.current = moment
+
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+
+class ClockJob(schedule.Job):
+    # schedule 的作业直接调用 datetime.now()，这里改为读取所属调度器的时钟。
+    # 只借用 schedule 公开的链式接口（every/day/monday/at 等）记录的 unit、interval、at_time、start_day，
+    # 下次触发时间和执行都自己实现，不依赖 schedule 的私有方法；不支持时区参数和 until，起止日期用 between
+    def __init__(self, interval: int, scheduler: Optional[schedule.Scheduler] = None):
+        super().__init__(interval, scheduler)
+        # 每月作业：按天登记，下次触发时间跳到下一个存在该日期的月份
+        self.monthly_day: Optional[int] = None
+        # 指定的首次触发时间（固定间隔任务的错峰相位）和起止日期
+        self.first_run: Optional[datetime] = None
+        self.start_date: Optional[date] = None
+        self.end_date: Optional[date] = None
+
+    def monthly(self, day: int) -> 'ClockJob':
+        self.monthly_day = day
+        return self.day
+
+    def starting_at(self, moment: datetime) -> 'ClockJob':
+        self.first_run = moment
+        return self
+
+    def between(self, start: Optional[date], end: Optional[date]) -> 'ClockJob':
+        # 早于开始日期的触发推迟到开始日期，下次触发超过结束日期时作业取消，next_run 为 None
+        self.start_date, self.end_date = start, end
+        return self
+
+    @property
+    def should_run(self) -> bool:
+        return self.next_run is not None and self.scheduler.clock.now() >= self.next_run
+
+    def do(self, job_func, *args, **kwargs):
+        self.job_func = functools.partial(job_func, *args, **kwargs)
+        self.schedule_next_run()
+        if self.next_run is not None:
+            self.scheduler.jobs.append(self)
+            self.scheduler.dirty = True
+        return self
+
+    def run(self):
+        ret = self.job_func()
+        self.last_run = self.scheduler.clock.now()
+        self.schedule_next_run()
+        if self.next_run is None:
+            return schedule.CancelJob
+        return ret
+
+    def schedule_next_run(self):
+        if self.unit not in ("seconds", "minutes", "hours", "days", "weeks"):
+            raise schedule.ScheduleValueError(f"无效的时间单位: {self.unit}")
+        if self.latest is not None:
+            if not (self.latest >= self.interval):
+                raise schedule.ScheduleError("latest 不能小于 interval")
+            interval = random.randint(self.interval, self.latest)
+        else:
+            interval = self.interval
+
+        now = self.scheduler.clock.now()
+        period = timedelta(**{self.unit: interval})
+        if self.next_run is None and self.first_run is not None:
+            next_run = self.first_run
+        elif self.next_run is not None and self.at_time is not None and interval == 1 and self.latest is None:
+            # 每日/每周作业触发后，下次触发就是上次触发时间加一个周期，不必重新对齐日期和时刻
+            next_run = self.next_run + period
+            while next_run <= now:
+                next_run += period
+        else:
+            next_run = now
+            if self.start_day is not None:
+                if self.unit != "weeks":
+                    raise schedule.ScheduleValueError("指定星期的作业单位必须是 weeks")
+                next_run += timedelta(days=(WEEKDAYS.index(self.start_day) - next_run.weekday()) % 7)
+            if self.at_time is not None:
+                next_run = self.move_to_at_time(next_run)
+            if interval != 1:
+                next_run += period
+            while next_run <= now:
+                next_run += period
+
+        next_run = self.move_to_start_date(self.move_to_monthly_day(next_run), period)
+        if self.end_date is not None and next_run.date() > self.end_date:
+            next_run = None
+        self.next_run = next_run
+
+    def move_to_at_time(self, moment: datetime) -> datetime:
+        # 与 schedule 相同：每日/每周作业对齐到时、分、秒，每小时作业只对齐分、秒
+        fields = {"second": self.at_time.second, "microsecond": 0}
+        if self.unit == "days" or self.start_day is not None:
+            fields["hour"] = self.at_time.hour
+        if self.unit in ("days", "hours") or self.start_day is not None:
+            fields["minute"] = self.at_time.minute
+        return moment.replace(**fields)
+
+    def move_to_start_date(self, moment: datetime, period: timedelta) -> datetime:
+        # 按整周期跳到开始日期当天或之后，保持触发时刻和相位不变
+        if self.start_date is None or moment.date() >= self.start_date:
+            return moment
+        start = datetime.combine(self.start_date, datetime.min.time())
+        return self.move_to_monthly_day(moment - (moment - start) // period * period)
+
+    def move_to_monthly_day(self, moment: datetime) -> datetime:
+        # 跳过没有该日期的月份（如2月30日），与 Task.get_next_run_datetime 一致
+        if self.monthly_day is None:
+            return moment
+        while moment.day != self.monthly_day:
+            moment += timedelta(days=1)
+        return moment
+
+
+class ClockScheduler(schedule.Scheduler):
+    # 按触发时间排列的最小堆：run_pending 只弹出到期的作业，不再每轮遍历全部作业；
+    # 作业增删后标记 dirty，在下次使用前重建堆
+    def __init__(self, clock: Optional[SystemClock] = None):
+        super().__init__()
+        self.clock = clock or SystemClock()
+        self.queue: List[tuple] = []
+        self.counter = itertools.count()
+        self.dirty = False
+
+    def every(self, interval: int = 1) -> ClockJob:
+        return ClockJob(interval, self)
+
+    def rebuild(self):
+        self.queue = [(job.next_run, next(self.counter), job) for job in self.jobs if job.next_run is not None]
+        heapq.heapify(self.queue)
+        self.dirty = False
+
+    def run_pending(self):
+        if self.dirty:
+            self.rebuild()
+        now = self.clock.now()
+        queue = self.queue
+        while queue and queue[0][0] <= now:
+            next_run, _, job = heapq.heappop(queue)
+            if job.next_run != next_run:
+                # 触发时间在登记后被外部修改过，按实际时间重新入堆
+                heapq.heappush(queue, (job.next_run, next(self.counter), job))
+                continue
+            if job.run() is schedule.CancelJob:
+                self.cancel_job(job)
+            if self.dirty:
+                # 作业执行中增删了作业（包括返回 CancelJob），按当前作业列表重建
+                self.rebuild()
+                queue = self.queue
+            else:
+                heapq.heappush(queue, (job.next_run, next(self.counter), job))
+
+    def clear(self, tag: Optional[Hashable] = None):
+        super().clear(tag)
+        self.dirty = True
+
+    def cancel_job(self, job: schedule.Job):
+        super().cancel_job(job)
+        self.dirty = True
+
+    def cancel_jobs(self, jobs: Set[schedule.Job]):
+        # 批量取消：一次过滤作业列表，而不是逐个 cancel_job
+        self.jobs = [job for job in self.jobs if job not in jobs]
+        self.dirty = True
+
+    def get_next_run(self, tag: Optional[Hashable] = None) -> Optional[datetime]:
+        if tag is not None:
+            return super().get_next_run(tag)
+        if self.dirty:
+            self.rebuild()
+        while self.queue and self.queue[0][2].next_run != self.queue[0][0]:
+            _, _, job = heapq.heappop(self.queue)
+            heapq.heappush(self.queue, (job.next_run, next(self.counter), job))
+        return self.queue[0][0] if self.queue else None
+
+    next_run = property(get_next_run)
+
+    @property
+    def idle_seconds(self) -> Optional[float]:
+        next_run = self.get_next_run()
+        if next_run is None:
+            return None
+        return (next_run - self.clock.now()).total_seconds()
@@ -0,0 +1,319 @@
+import os
+import threading
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from .task import Task, OverlapPolicy
+from .pools import ResourcePool
+from .metrics import timed
+from .isolation import (FailureKind, build_popen_env, classify_failure,
+                        priority_creationflags, wrap_command)
+
+
+class TaskRun:
+    def __init__(self, task: Task):
+        self.run_id = uuid.uuid4().hex
+        self.task = task
+        self.state = "queued"  # queued / waiting / running / finished / cancelled
+        self.queued_at = datetime.now()
+        self.pool: Optional[ResourcePool] = None  # 已占用名额的资源池，结束时归还
+        self.pool_wait = 0.0  # 等待资源池名额的秒数
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.process = None  # subprocess.Popen，命令启动后赋值
+        # 取消与启动命令互斥：要么取消先发生、命令不再启动，要么命令已启动、取消时能拿到进程并结束
+        self.lock = threading.Lock()
+        self.returncode: Optional[int] = None
+        self.stdout = ""
+        self.stderr = ""
+        self.error: Optional[str] = None
+        self.failure_kind: Optional[FailureKind] = None  # 执行结束后在 complete 中判定
+
+    @property
+    def cancelled(self) -> bool:
+        return self.state == "cancelled"
+
+    @property
+    def success(self) -> bool:
+        return not self.cancelled and self.error is None and self.returncode == 0
+
+    def to_history(self) -> Dict[str, Any]:
+        # 写入执行历史的记录，不包含命令输出
+        def timestamp(value: Optional[datetime]) -> Optional[str]:
+            return value.isoformat() if value else None
+
+        return {
+            "run_id": self.run_id,
+            "task_id": self.task.id,
+            "task_name": self.task.name,
+            "queued_at": timestamp(self.queued_at),
+            "started_at": timestamp(self.started_at),
+            "finished_at": timestamp(self.finished_at),
+            "returncode": self.returncode,
+            "success": self.success,
+            "failure_kind": self.failure_kind.value if self.failure_kind else None,
+            "error": self.error,
+            "pool_wait": round(self.pool_wait, 3)
+        }
+
+
+class TaskExecutor(QObject):
+    # CMD任务在线程池中执行，避免阻塞界面；不同的依赖分支可以并行运行。
+    # 按任务ID跟踪正在运行和排队的执行，根据任务的重叠策略决定新触发的处理方式。
+    # 工作线程大多只是阻塞在 communicate() 上，并发由重叠策略和资源池控制，线程数上限只防止失控；
+    # 默认值可在 settings.json 的 executor.max_workers 中修改
+    MAX_WORKERS = 32
+
+    run_finished = pyqtSignal(object)
+    # 资源池占用或等待队列发生变化
+    pools_changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = None  # 线程池在第一次执行CMD任务时才创建
+        self.pool_size = 0
+        self.max_workers = self.MAX_WORKERS
+        self.active_runs: Dict[str, TaskRun] = {}
+        # running 中包含正在等待资源池名额的执行，重叠策略把它们视为尚未结束
+        self.running: Dict[str, List[TaskRun]] = {}
+        self.queued: Dict[str, deque] = {}
+        self.resource_pools: Dict[str, ResourcePool] = {}
+        # 输出存储（storage.OutputStore），设置后在工作线程中保存每次执行的输出
+        self.output_store = None
+        # 执行预写日志（storage.RunJournal），程序异常退出后据此找出被中断的执行
+        self.journal = None
+
+    def set_resource_pools(self, pools: List[ResourcePool]):
+        # 按名称更新资源池配置；已删除的资源池中等待的执行不再受限，直接启动
+        configured = {pool.name: pool for pool in pools if pool.name}
+        for name, pool in list(self.resource_pools.items()):
+            if name in configured:
+                pool.configure(configured.pop(name))
+            else:
+                del self.resource_pools[name]
+                while pool.waiting:
+                    self._launch(pool.waiting.popleft())
+        self.resource_pools.update(configured)
+        self.resize_workers()
+        for pool in self.resource_pools.values():
+            self._drain_pool(pool)
+        self.pools_changed.emit()
+
+    def set_max_workers(self, max_workers: int):
+        self.max_workers = max(1, max_workers)
+        self.resize_workers()
+
+    def worker_limit(self) -> int:
+        # 不少于各资源池并发上限之和，资源池放行的执行不会再在线程池中排队
+        return max(self.max_workers, sum(max(1, pool.max_concurrency) for pool in self.resource_pools.values()))
+
+    def resize_workers(self):
+        # ThreadPoolExecutor 不能调整大小：需要更多线程时换一个新的线程池，
+        # 旧线程池中已提交的执行照常完成，之后线程退出
+        if self.pool is not None and self.pool_size < self.worker_limit():
+            pool, self.pool = self.pool, None
+            pool.shutdown(wait=False)
+
+    @timed("executor.submit")
+    def submit(self, task: Task) -> Optional[TaskRun]:
+        # 返回 None 表示根据重叠策略跳过了本次触发
+        running = self.running.get(task.id, [])
+        policy = task.overlap_policy
+        limit = max(1, task.max_overlap)
+
+        if running:
+            if policy == OverlapPolicy.SKIP:
+                return None
+            if policy == OverlapPolicy.QUEUE:
+                queue = self.queued.setdefault(task.id, deque())
+                if len(queue) >= limit:
+                    return None
+                run = TaskRun(task)
+                queue.append(run)
+                self.active_runs[run.run_id] = run
+                return run
+            if policy == OverlapPolicy.PARALLEL and len(running) >= limit:
+                return None
+            if policy == OverlapPolicy.CANCEL:
+                for old_run in list(running):
+                    self.cancel(old_run)
+
+        run = TaskRun(task)
+        self.active_runs[run.run_id] = run
+        self._start(run)
+        return run
+
+    def _start(self, run: TaskRun):
+        self.running.setdefault(run.task.id, []).append(run)
+        resource_pool = self.resource_pools.get(run.task.resource_pool)
+        if resource_pool is None:
+            self._launch(run)
+            return
+        # 引用资源池的任务先进入资源池的等待队列，有空闲名额时按触发顺序启动
+        run.state = "waiting"
+        resource_pool.waiting.append(run)
+        self._drain_pool(resource_pool)
+        self.pools_changed.emit()
+
+    def _drain_pool(self, resource_pool: ResourcePool):
+        while resource_pool.waiting:
+            delay = resource_pool.try_acquire()
+            if delay is None:
+                return
+            if delay > 0:
+                # 令牌不足：等令牌补充后再试，同一资源池只安排一次重试
+                if not resource_pool.retry_pending:
+                    resource_pool.retry_pending = True
+                    QTimer.singleShot(int(delay * 1000) + 1, lambda: self._retry_pool(resource_pool))
+                return
+            run = resource_pool.waiting.popleft()
+            run.pool = resource_pool
+            run.pool_wait = (datetime.now() - run.queued_at).total_seconds()
+            resource_pool.record_wait(run.pool_wait)
+            self._launch(run)
+
+    def _retry_pool(self, resource_pool: ResourcePool):
+        resource_pool.retry_pending = False
+        self._drain_pool(resource_pool)
+        self.pools_changed.emit()
+
+    def _launch(self, run: TaskRun):
+        run.state = "running"
+        if self.pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.pool_size = self.worker_limit()
+            self.pool = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="task-run")
+        future = self.pool.submit(self._run_cmd, run)
+        future.add_done_callback(lambda _: self.run_finished.emit(run))
+
+    @timed("cmd.run", track_slow=False)
+    def _run_cmd(self, run: TaskRun):
+        # subprocess 只在真正执行命令时才导入，不计入启动耗时
+        import subprocess
+
+        journaled = False
+        try:
+            run.started_at = datetime.now()
+            if run.cancelled:
+                return
+            task = run.task
+            journaled = self.journal_event(self.journal.start if self.journal else None, run.run_id,
+                                           task.id, task.name, run.started_at.isoformat())
+            if os.name == "nt":
+                popen_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP | priority_creationflags(task)}
+            else:
+                # 隔离模式的资源限制和优先级由 wrap_command 生成的 shell 前缀设置
+                popen_kwargs = {"start_new_session": True}
+            with run.lock:
+                if run.cancelled:
+                    return
+                run.process = subprocess.Popen(wrap_command(task), shell=True, stdout=subprocess.PIPE,
+                                               stderr=subprocess.PIPE, text=True, cwd=task.working_dir or None,
+                                               env=build_popen_env(task), **popen_kwargs)
+            run.stdout, run.stderr = run.process.communicate()
+            run.returncode = run.process.returncode
+            run.finished_at = datetime.now()
+            self.save_output(run)
+        except Exception as e:
+            run.error = str(e)
+        finally:
+            run.finished_at = datetime.now()
+            if journaled:
+                self.journal_event(self.journal.finish, run.run_id, run.finished_at.isoformat())
+
+    def journal_event(self, write, *args) -> bool:
+        # 日志写入失败（如磁盘已满）时照常执行命令，只是无法在崩溃后恢复这次执行
+        if write is None:
+            return False
+        try:
+            write(*args)
+            return True
+        except Exception:
+            return False
+
+    @timed("cmd.save_output", track_slow=False)
+    def save_output(self, run: TaskRun):
+        # 压缩和写盘放在工作线程中，不占用界面线程；保存失败不影响执行结果
+        if self.output_store is None:
+            return
+        try:
+            task = run.task
+            self.output_store.save(task.id, run.run_id, run.finished_at.isoformat(), run.returncode,
+                                   run.stdout, run.stderr, task.output_max_runs, task.output_max_kb * 1024)
+        except Exception:
+            pass
+
+    @timed("executor.cancel")
+    def cancel(self, run: TaskRun):
+        import signal
+        import subprocess
+
+        if run.state == "waiting":
+            # 尚未启动的执行直接从资源池等待队列中移除
+            run.state = "cancelled"
+            for resource_pool in self.resource_pools.values():
+                if run in resource_pool.waiting:
+                    resource_pool.waiting.remove(run)
+            self.run_finished.emit(run)
+            self.pools_changed.emit()
+            return
+
+        with run.lock:
+            run.state = "cancelled"
+            process = run.process
+        if process is None or process.poll() is not None:
+            return
+        try:
+            # shell=True 时需要结束整个进程组，否则命令的子进程会继续运行
+            if os.name == "nt":
+                subprocess.run(["taskkill", "/T", "/F", "/PID", str(process.pid)], capture_output=True)
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except Exception:
+            process.kill()
+
+    def complete(self, run: TaskRun):
+        # 在界面线程中调用：登记执行结束，并启动该任务排队中的下一次执行
+        self.active_runs.pop(run.run_id, None)
+        running = self.running.get(run.task.id)
+        if running and run in running:
+            running.remove(run)
+        if not running:
+            self.running.pop(run.task.id, None)
+
+        if run.state == "running":
+            run.state = "finished"
+        run.failure_kind = classify_failure(run.task, run.returncode, run.stderr, run.error, run.cancelled)
+
+        if run.pool is not None:
+            resource_pool, run.pool = run.pool, None
+            resource_pool.release()
+            if self.resource_pools.get(resource_pool.name) is resource_pool:
+                self._drain_pool(resource_pool)
+            self.pools_changed.emit()
+
+        queue = self.queued.get(run.task.id)
+        if queue:
+            self._start(queue.popleft())
+            if not queue:
+                del self.queued[run.task.id]
+
+    def in_flight(self, task_id: str) -> int:
+        return len(self.running.get(task_id, ())) + len(self.queued.get(task_id, ()))
+
+    def active_count(self) -> int:
+        return len(self.active_runs)
+
+    def shutdown(self):
+        for resource_pool in self.resource_pools.values():
+            resource_pool.waiting.clear()
+        for runs in list(self.running.values()):
+            for run in list(runs):
+                if run.state == "running":
+                    self.cancel(run)
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
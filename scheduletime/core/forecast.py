@@ -0,0 +1,233 @@
+import heapq
+import math
+from datetime import datetime, timedelta
+from typing import Dict, List, Iterator, Optional, Tuple
+
+from PyQt6.QtCore import QDate
+
+from .task import Task, TaskType, TaskStatus
+from .jitter import JitterSettings
+
+DEFAULT_CMD_DURATION = 1.0  # 没有执行历史时假设的CMD执行耗时（秒）
+TIME_SCHEDULE_TYPES = ("interval", "daily", "weekly", "monthly")
+
+
+def quantize_duration(seconds: float) -> int:
+    # 按耗时分组计算占用：一分钟以内按秒，十分钟以内按 10 秒，更长的按分钟向上取整
+    seconds = max(1, int(math.ceil(seconds)))
+    if seconds < 60:
+        return seconds
+    if seconds < 600:
+        return int(math.ceil(seconds / 10) * 10)
+    return int(math.ceil(seconds / 60) * 60)
+
+
+class Forecast:
+    # 负载预测结果：从 start（取整到分钟）开始每分钟计划触发的次数，以及预计同时执行的CMD数量
+    def __init__(self, start: datetime, minutes: int):
+        self.start = start
+        self.minutes = minutes
+        self.run_counts = [0] * minutes
+        self.busy_seconds = [0.0] * minutes  # 每分钟内所有CMD执行占用的秒数之和
+        self.task_count = 0
+        self.skipped_count = 0  # 依赖触发、事件触发等无法按时间预测的任务
+
+    @property
+    def total_runs(self) -> int:
+        return sum(self.run_counts)
+
+    def busy_slots(self) -> List[float]:
+        return [seconds / 60 for seconds in self.busy_seconds]
+
+    def minute_at(self, index: int) -> datetime:
+        return self.start + timedelta(minutes=index)
+
+    def peak_runs(self) -> Tuple[Optional[datetime], int]:
+        if not self.minutes:
+            return None, 0
+        index = max(range(self.minutes), key=self.run_counts.__getitem__)
+        return self.minute_at(index), self.run_counts[index]
+
+    def peak_busy(self) -> Tuple[Optional[datetime], float]:
+        if not self.minutes:
+            return None, 0.0
+        index = max(range(self.minutes), key=self.busy_seconds.__getitem__)
+        return self.minute_at(index), self.busy_seconds[index] / 60
+
+    def buckets(self, size: int) -> Tuple[List[int], List[float]]:
+        # 按 size 分钟合并：触发次数求和，CMD占用取平均
+        runs, busy = [], []
+        for begin in range(0, self.minutes, size):
+            end = min(begin + size, self.minutes)
+            runs.append(sum(self.run_counts[begin:end]))
+            busy.append(sum(self.busy_seconds[begin:end]) / 60 / (end - begin))
+        return runs, busy
+
+
+class ForecastBuilder:
+    # 一次遍历所有任务生成预测。固定间隔任务按（间隔, 耗时）分组：触发时刻在一个间隔内呈周期分布，
+    # 用前缀和在 O(间隔 + 分钟数) 内得到每分钟的触发次数和占用秒数，不需要逐次展开；
+    # 触发次数较少的组以及每日/每周/每月任务直接按规则逐次展开
+    def __init__(self, jitter: Optional[JitterSettings] = None):
+        self.jitter = jitter or JitterSettings()
+
+    def first_run(self, task: Task, start: datetime, first_runs: Dict[str, datetime]) -> Optional[datetime]:
+        first = first_runs.get(task.id)
+        if first is not None and first > start:
+            return first
+        if task.schedule_type == "interval":
+            return self.jitter.first_interval_run(task, start) or start + timedelta(seconds=task.interval_seconds)
+        return task.get_next_run_datetime(start, self.jitter.offset_for(task))
+
+    def schedulable(self, task: Task, today: QDate) -> bool:
+        return (task.status == TaskStatus.ENABLED and task.schedule_type in TIME_SCHEDULE_TYPES
+                and task.start_date <= today <= task.end_date)
+
+    def build(self, tasks: List[Task], start: datetime, hours: float,
+              first_runs: Optional[Dict[str, datetime]] = None,
+              durations: Optional[Dict[str, float]] = None) -> Forecast:
+        # first_runs: 调度器中各任务的下次执行时间（含错峰偏移），没有时按规则推算；
+        # durations: 各任务历史执行耗时（秒），只用于CMD任务
+        first_runs = first_runs or {}
+        durations = durations or {}
+        origin = start.replace(second=0, microsecond=0)
+        forecast = Forecast(origin, max(1, int(hours * 60)))
+        horizon = forecast.minutes * 60
+        today = QDate(start.year, start.month, start.day)
+
+        # 逐次展开时的占用用差分数组累计，最后一次性加到 busy_seconds
+        full_diff = [0] * (forecast.minutes + 1)
+        groups: Dict[Tuple[int, int], List[int]] = {}
+
+        for task in tasks:
+            if not self.schedulable(task, today):
+                if task.status == TaskStatus.ENABLED and task.schedule_type not in TIME_SCHEDULE_TYPES:
+                    forecast.skipped_count += 1
+                continue
+            forecast.task_count += 1
+            duration = 0
+            if task.task_type == TaskType.CMD:
+                duration = quantize_duration(durations.get(task.id, DEFAULT_CMD_DURATION))
+
+            first = self.first_run(task, start, first_runs)
+            if first is None:
+                continue
+            offset = int((first - origin).total_seconds())
+            if offset >= horizon:
+                continue
+
+            if task.schedule_type == "interval":
+                groups.setdefault((max(1, task.interval_seconds), duration), []).append(offset)
+            elif task.schedule_type in ("daily", "weekly"):
+                step = 86400 if task.schedule_type == "daily" else 7 * 86400
+                for second in range(offset, horizon, step):
+                    self.add_run(forecast, full_diff, second, duration)
+            else:
+                fire = first
+                while offset < horizon:
+                    self.add_run(forecast, full_diff, offset, duration)
+                    fire = task.get_next_run_datetime(fire, self.jitter.offset_for(task))
+                    if fire is None:
+                        break
+                    offset = int((fire - origin).total_seconds())
+
+        for (interval, duration), offsets in groups.items():
+            fires = sum((horizon - offset + interval - 1) // interval for offset in offsets)
+            if fires <= forecast.minutes + interval:
+                for offset in offsets:
+                    for second in range(offset, horizon, interval):
+                        self.add_run(forecast, full_diff, second, duration)
+            else:
+                self.add_periodic_group(forecast, full_diff, interval, duration, offsets)
+
+        full = 0
+        for minute in range(forecast.minutes):
+            full += full_diff[minute]
+            forecast.busy_seconds[minute] += full
+        return forecast
+
+    def add_run(self, forecast: Forecast, full_diff: List[int], second: int, duration: int, sign: int = 1):
+        minute = second // 60
+        forecast.run_counts[minute] += sign
+        if not duration:
+            return
+        # 第一分钟的部分占用、中间的整分钟、最后一分钟的剩余部分
+        first_part = min(duration, 60 - second % 60)
+        forecast.busy_seconds[minute] += sign * first_part
+        rest = duration - first_part
+        full_minutes, remainder = divmod(rest, 60)
+        end = min(minute + 1 + full_minutes, forecast.minutes)
+        if minute + 1 < end:
+            full_diff[minute + 1] += sign * 60
+            full_diff[end] -= sign * 60
+        if remainder and minute + 1 + full_minutes < forecast.minutes:
+            forecast.busy_seconds[minute + 1 + full_minutes] += sign * remainder
+
+    def add_periodic_group(self, forecast: Forecast, full_diff: List[int], interval: int, duration: int,
+                           offsets: List[int]):
+        # counts[p] 为相位 p（首次触发时刻对间隔取模）上的任务数，第 s 秒的触发次数为 counts[s % interval]
+        counts = [0] * interval
+        for offset in offsets:
+            counts[offset % interval] += 1
+        prefix = [0] * (interval + 1)  # prefix[r] = counts[0:r] 之和
+        for phase in range(interval):
+            prefix[phase + 1] = prefix[phase] + counts[phase]
+        prefix2 = [0] * (interval + 1)  # prefix2[r] = prefix[0:r] 之和
+        for phase in range(interval):
+            prefix2[phase + 1] = prefix2[phase] + prefix[phase]
+        total = prefix[interval]
+
+        def fired_before(x: int) -> int:
+            # [0, x) 秒内的触发次数
+            if x <= 0:
+                return 0
+            cycles, rest = divmod(x, interval)
+            return cycles * total + prefix[rest]
+
+        def fired_sum(x: int) -> int:
+            # sum(fired_before(y) for y in range(x))，用于计算占用秒数
+            if x <= 0:
+                return 0
+            cycles, rest = divmod(x, interval)
+            return (total * interval * cycles * (cycles - 1) // 2 + cycles * prefix2[interval]
+                    + rest * cycles * total + prefix2[rest])
+
+        for minute in range(forecast.minutes):
+            begin = minute * 60
+            forecast.run_counts[minute] += fired_before(begin + 60) - fired_before(begin)
+            if duration:
+                # 第 t 秒正在执行的数量为 fired_before(t + 1) - fired_before(t + 1 - duration)
+                forecast.busy_seconds[minute] += (fired_sum(begin + 61) - fired_sum(begin + 1)
+                                                  - fired_sum(begin + 61 - duration)
+                                                  + fired_sum(begin + 1 - duration))
+
+        # 首次触发晚于一个间隔时（错峰窗口），扣除周期模型在首次触发之前多算的触发
+        for offset in offsets:
+            for second in range(offset - interval, -1, -interval):
+                self.add_run(forecast, full_diff, second, duration, -1)
+
+    def upcoming_runs(self, tasks: List[Task], start: datetime, hours: float, limit: int = 500,
+                      first_runs: Optional[Dict[str, datetime]] = None) -> List[Tuple[datetime, Task]]:
+        # 按时间顺序列出最近的 limit 次计划触发，用于时间线
+        first_runs = first_runs or {}
+        end = start + timedelta(hours=hours)
+        today = QDate(start.year, start.month, start.day)
+        iterators = [self.iter_runs(task, start, end, first_runs) for task in tasks if self.schedulable(task, today)]
+        runs = []
+        for fire, _, task in heapq.merge(*iterators, key=lambda item: (item[0], item[1])):
+            runs.append((fire, task))
+            if len(runs) >= limit:
+                break
+        return runs
+
+    def iter_runs(self, task: Task, start: datetime, end: datetime,
+                  first_runs: Dict[str, datetime]) -> Iterator[Tuple[datetime, str, Task]]:
+        fire = self.first_run(task, start, first_runs)
+        step = None
+        if task.schedule_type == "interval":
+            step = timedelta(seconds=max(1, task.interval_seconds))
+        elif task.schedule_type in ("daily", "weekly"):
+            step = timedelta(days=1 if task.schedule_type == "daily" else 7)
+        while fire is not None and fire < end:
+            yield fire, task.id, task
+            fire = fire + step if step else task.get_next_run_datetime(fire, self.jitter.offset_for(task))
@@ -0,0 +1,78 @@
+from typing import Dict, List, Set, Optional
+
+from .task import Task
+
+
+class TaskGraph:
+    # 任务依赖图：保存上下游邻接表和每个下游任务已完成的上游集合，触发解析只需遍历相关的边
+    def __init__(self):
+        self.tasks: Dict[str, Task] = {}
+        self.upstreams: Dict[str, List[str]] = {}
+        self.downstreams: Dict[str, List[str]] = {}
+        self.completed: Dict[str, Set[str]] = {}
+
+    def build(self, tasks: List[Task]):
+        self.tasks = {task.id: task for task in tasks}
+        self.upstreams = {}
+        self.downstreams = {}
+        for task in tasks:
+            upstreams = [task_id for task_id in dict.fromkeys(task.depends_on)
+                         if task_id in self.tasks and task_id != task.id]
+            if upstreams:
+                self.upstreams[task.id] = upstreams
+                for upstream_id in upstreams:
+                    self.downstreams.setdefault(upstream_id, []).append(task.id)
+
+        # 外部修改的任务文件可能包含循环依赖，逐条断开环上的边避免无限触发
+        cycle = self.find_cycle(self.upstreams)
+        while cycle:
+            downstream_id, upstream_id = cycle[-2], cycle[-1]
+            self.upstreams[downstream_id].remove(upstream_id)
+            self.downstreams[upstream_id].remove(downstream_id)
+            cycle = self.find_cycle(self.upstreams)
+
+        # 保留仍然有效的边上已记录的完成状态
+        completed = {}
+        for task_id, done in self.completed.items():
+            if task_id in self.upstreams:
+                done = done.intersection(self.upstreams[task_id])
+                if done:
+                    completed[task_id] = done
+        self.completed = completed
+
+    def on_task_succeeded(self, task_id: str) -> List[Task]:
+        # 返回所有上游都已成功完成、可以触发的下游任务
+        ready = []
+        for downstream_id in self.downstreams.get(task_id, ()):
+            done = self.completed.setdefault(downstream_id, set())
+            done.add(task_id)
+            if len(done) == len(self.upstreams[downstream_id]):
+                del self.completed[downstream_id]
+                ready.append(self.tasks[downstream_id])
+        return ready
+
+    @staticmethod
+    def find_cycle(dependencies: Dict[str, List[str]]) -> Optional[List[str]]:
+        # 迭代式深度优先搜索，发现回边时返回构成环的任务ID路径
+        WHITE, GRAY, BLACK = 0, 1, 2
+        color = {task_id: WHITE for task_id in dependencies}
+        for root in dependencies:
+            if color[root] != WHITE:
+                continue
+            path = [root]
+            stack = [iter(dependencies[root])]
+            color[root] = GRAY
+            while stack:
+                next_id = next(stack[-1], None)
+                if next_id is None:
+                    color[path.pop()] = BLACK
+                    stack.pop()
+                elif next_id not in color:
+                    continue
+                elif color[next_id] == GRAY:
+                    return path[path.index(next_id):] + [next_id]
+                elif color[next_id] == WHITE:
+                    color[next_id] = GRAY
+                    path.append(next_id)
+                    stack.append(iter(dependencies[next_id]))
+        return None
@@ -0,0 +1,117 @@
+import os
+import signal
+from enum import Enum
+from typing import Dict, List, Optional
+
+from .task import Task
+
+
+class FailureKind(Enum):
+    # 执行失败的类型，写入执行历史；超出资源限制与普通的非零退出码分开记录
+    EXIT_CODE = "退出码非零"
+    ERROR = "启动失败"
+    CANCELLED = "已取消"
+    CPU_LIMIT = "超出CPU时间限制"
+    MEMORY_LIMIT = "超出内存限制"
+    FILES_LIMIT = "超出打开文件数限制"
+    INTERRUPTED = "程序退出时中断"
+
+
+# ionice 的调度类别：2 为尽力而为（最低优先级 7），3 为仅在磁盘空闲时执行
+IO_PRIORITY_ARGS = {"best-effort": "-c 2 -n 7", "idle": "-c 3"}
+
+MEMORY_ERROR_MARKERS = ("MemoryError", "Cannot allocate memory", "out of memory", "std::bad_alloc")
+FILES_ERROR_MARKERS = ("Too many open files",)
+
+
+def build_popen_env(task: Task) -> Optional[Dict[str, str]]:
+    # 任务的环境变量叠加在调度器自身的环境之上；没有设置时返回 None 沿用当前环境
+    if not task.env:
+        return None
+    env = dict(os.environ)
+    env.update({str(key): str(value) for key, value in task.env.items()})
+    return env
+
+
+def wrap_command(task: Task) -> str:
+    # 在命令前由 shell 自身设置 IO 优先级、资源限制和 CPU 优先级，之后启动的子进程都会继承；
+    # 不使用 preexec_fn：执行器在工作线程中启动子进程，多线程下 preexec_fn 可能让子进程死锁
+    command = task.cmd_command
+    if not task.isolated or os.name == "nt":
+        return command
+    import shlex
+    import shutil
+
+    if task.nice > 0 and shutil.which("nice"):
+        # exec 替换当前 shell，进程ID不变，取消任务时仍按进程组结束
+        command = f"exec nice -n {task.nice} /bin/sh -c {shlex.quote(command)}"
+    limits = limit_commands(task)
+    if limits:
+        # 任何一项限制设置失败都不执行命令，以 126 退出
+        command = f"{' && '.join(limits)} || exit 126; {command}"
+    args = IO_PRIORITY_ARGS.get(task.io_priority)
+    if args and shutil.which("ionice"):
+        command = f"ionice {args} -p $$ >/dev/null 2>&1; {command}"
+    return command
+
+
+def limit_commands(task: Task) -> List[str]:
+    # 资源限制对应的 ulimit 命令；不超过调度器自身的硬限制，否则 shell 无权提高而设置失败
+    import resource
+
+    def clamp(limit: int, value: int) -> int:
+        hard = resource.getrlimit(limit)[1]
+        return value if hard == resource.RLIM_INFINITY else min(value, hard)
+
+    commands = []
+    if task.cpu_limit_seconds > 0:
+        # 软限制到期时发送 SIGXCPU，再超出一秒由硬限制强制结束；先降软限制，否则硬限制会低于当前软限制
+        hard = clamp(resource.RLIMIT_CPU, task.cpu_limit_seconds + 1)
+        commands += [f"ulimit -S -t {min(task.cpu_limit_seconds, hard)}", f"ulimit -H -t {hard}"]
+    if task.memory_limit_mb > 0:
+        # ulimit -v 以 KB 为单位，对应 RLIMIT_AS
+        size = clamp(resource.RLIMIT_AS, task.memory_limit_mb * 1024 * 1024)
+        commands.append(f"ulimit -v {size // 1024}")
+    if task.open_files_limit > 0:
+        commands.append(f"ulimit -n {clamp(resource.RLIMIT_NOFILE, task.open_files_limit)}")
+    return commands
+
+
+def priority_creationflags(task: Task) -> int:
+    # Windows 没有 rlimit，只按 nice 值降低进程优先级
+    if not task.isolated or os.name != "nt" or task.nice <= 0:
+        return 0
+    import subprocess
+    return subprocess.IDLE_PRIORITY_CLASS if task.nice >= 15 else subprocess.BELOW_NORMAL_PRIORITY_CLASS
+
+
+def terminating_signal(returncode: int) -> Optional[int]:
+    # 子进程被信号结束时 returncode 为负数；shell 中的命令被结束时 shell 以 128+信号值 退出
+    if returncode < 0:
+        return -returncode
+    if 128 < returncode < 128 + 65:
+        return returncode - 128
+    return None
+
+
+def classify_failure(task: Task, returncode: Optional[int], stderr: str, error: Optional[str],
+                     cancelled: bool) -> Optional[FailureKind]:
+    # 取消任务时执行器会结束进程组，必须先于信号判断，否则会被误记为超出资源限制
+    if cancelled:
+        return FailureKind.CANCELLED
+    if error is not None:
+        return FailureKind.ERROR
+    if returncode == 0:
+        return None
+
+    if task.isolated and returncode is not None:
+        signum = terminating_signal(returncode)
+        # 只有 SIGXCPU 能确定是 CPU 时间软限制到期；SIGKILL 也可能来自 OOM killer 或用户手动结束
+        if task.cpu_limit_seconds > 0 and signum is not None and signum == getattr(signal, "SIGXCPU", None):
+            return FailureKind.CPU_LIMIT
+        if task.memory_limit_mb > 0 and (signum in (signal.SIGSEGV, signal.SIGABRT)
+                                         or any(marker in stderr for marker in MEMORY_ERROR_MARKERS)):
+            return FailureKind.MEMORY_LIMIT
+        if task.open_files_limit > 0 and any(marker in stderr for marker in FILES_ERROR_MARKERS):
+            return FailureKind.FILES_LIMIT
+    return FailureKind.EXIT_CODE
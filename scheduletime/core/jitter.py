@@ -0,0 +1,62 @@
+import hashlib
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+
+from .task import Task
+
+SECONDS_PER_DAY = 24 * 3600
+
+
+def stable_fraction(task_id: str, salt: str = "") -> float:
+    # 由任务ID（和可选的盐值）哈希得到 [0, 1) 之间的数，同一任务每次启动结果相同
+    digest = hashlib.sha256(f"{salt}:{task_id}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2 ** 64
+
+
+class JitterSettings:
+    # 错峰设置：同一时刻触发的大量任务按任务ID哈希分散到一个时间窗口内
+    def __init__(self, window_seconds: int = 0, spread_intervals: bool = True, salt: str = ""):
+        self.window_seconds = window_seconds  # 全局偏移窗口，任务未单独设置时使用
+        self.spread_intervals = spread_intervals  # 固定间隔任务按任务ID错开相位
+        self.salt = salt  # 修改盐值可以整体重新打散偏移
+
+    def window_for(self, task: Task) -> int:
+        if task.jitter_seconds is not None:
+            return max(0, task.jitter_seconds)
+        return max(0, self.window_seconds)
+
+    def offset_for(self, task: Task) -> int:
+        # 定时任务的偏移秒数；偏移不会跨过当天午夜，避免每周/每月任务落到另一天
+        window = self.window_for(task)
+        if window <= 0 or task.schedule_type not in ("daily", "weekly", "monthly"):
+            return 0
+        base = task.daily_time.hour() * 3600 + task.daily_time.minute() * 60
+        window = min(window, SECONDS_PER_DAY - base)
+        return int(stable_fraction(task.id, self.salt) * window)
+
+    def first_interval_run(self, task: Task, now: Optional[datetime] = None) -> Optional[datetime]:
+        # 固定间隔任务的首次触发时间，None 表示沿用调度器默认的“当前时间 + 间隔”
+        interval = max(1, task.interval_seconds)
+        now = now or datetime.now()
+        if self.spread_intervals:
+            # 相位对齐到 Unix 纪元：同一间隔的任务在整个间隔内均匀分布，重启后相位不变
+            phase = stable_fraction(task.id, self.salt) * interval
+            elapsed = (now.timestamp() - phase) % interval
+            return now + timedelta(seconds=interval - elapsed)
+        window = min(self.window_for(task), interval)
+        if window <= 0:
+            return None
+        return now + timedelta(seconds=interval + stable_fraction(task.id, self.salt) * window)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "window_seconds": self.window_seconds,
+            "spread_intervals": self.spread_intervals,
+            "salt": self.salt
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'JitterSettings':
+        return cls(max(0, int(data.get("window_seconds", 0))),
+                   bool(data.get("spread_intervals", True)),
+                   str(data.get("salt", "")))
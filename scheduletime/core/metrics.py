@@ -0,0 +1,144 @@
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from typing import Dict, List, Any, Optional
+
+
+def get_peak_memory_kb() -> Optional[int]:
+    # 当前进程的峰值内存占用（KB）
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+    except ImportError:
+        pass
+
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize // 1024
+    except Exception:
+        pass
+    return None
+
+
+class PerfRecorder:
+    # 热点路径耗时统计：按名称累计调用次数、总耗时和最大耗时，超过 slow_ms 的调用单独记录
+    def __init__(self, slow_ms: float = 50.0, max_slow_calls: int = 200):
+        self.slow_ms = slow_ms
+        self.lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self.slow_calls = deque(maxlen=max_slow_calls)
+
+    @contextmanager
+    def measure(self, name: str, track_slow: bool = True):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started, track_slow)
+
+    def record(self, name: str, seconds: float, track_slow: bool = True):
+        # track_slow 为 False 的调用（如工作线程中执行的命令，通常都超过阈值）只累计统计，
+        # 不进入慢调用列表，避免挤掉界面线程上真正需要关注的慢调用
+        elapsed_ms = seconds * 1000
+        with self.lock:
+            stat = self.stats.get(name)
+            if stat is None:
+                stat = self.stats[name] = {"name": name, "count": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                           "last_ms": 0.0, "slow_count": 0}
+            stat["count"] += 1
+            stat["total_ms"] += elapsed_ms
+            stat["last_ms"] = elapsed_ms
+            stat["max_ms"] = max(stat["max_ms"], elapsed_ms)
+            if track_slow and elapsed_ms >= self.slow_ms:
+                stat["slow_count"] += 1
+                self.slow_calls.append({"name": name, "at": datetime.now().isoformat(timespec="seconds"),
+                                        "elapsed_ms": round(elapsed_ms, 1),
+                                        "thread": threading.current_thread().name})
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self.lock:
+            stats = [dict(stat, avg_ms=stat["total_ms"] / stat["count"]) for stat in self.stats.values()]
+        return sorted(stats, key=lambda stat: stat["total_ms"], reverse=True)
+
+    def recent_slow_calls(self) -> List[Dict[str, Any]]:
+        with self.lock:
+            return list(self.slow_calls)
+
+    def reset(self):
+        with self.lock:
+            self.stats.clear()
+            self.slow_calls.clear()
+
+
+# 进程内共用的耗时统计，调度线程、执行线程和界面线程都记录到这里
+perf = PerfRecorder()
+
+
+def timed(name: str, track_slow: bool = True):
+    # 装饰器：把函数每次调用的耗时记录到 perf。不要用在直接连接信号的槽函数上：
+    # *args 包装会让 PyQt 不再丢弃多余的信号参数（如 clicked 的 checked），槽函数内改用 perf.measure
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with perf.measure(name, track_slow):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class ProfileSession:
+    # 按需 cProfile 采样：start 之后界面线程上的所有调用都会被统计，stop 时写入 .prof 和文本摘要
+    def __init__(self, directory: str = "profiles"):
+        self.directory = directory
+        self.profiler = None
+        self.started_at: Optional[datetime] = None
+
+    @property
+    def active(self) -> bool:
+        return self.profiler is not None
+
+    def start(self):
+        # cProfile 只在第一次采样时导入，不计入启动耗时
+        import cProfile
+
+        if self.profiler is not None:
+            return
+        self.profiler = cProfile.Profile()
+        self.started_at = datetime.now()
+        self.profiler.enable()
+
+    def stop(self) -> Optional[str]:
+        # 返回 .prof 文件路径，可用 snakeviz 等工具打开；同名 .txt 为按累计耗时排序的前 60 项
+        import pstats
+
+        if self.profiler is None:
+            return None
+        profiler, self.profiler = self.profiler, None
+        profiler.disable()
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"profile-{self.started_at:%Y%m%d-%H%M%S}.prof")
+        profiler.dump_stats(path)
+        with open(os.path.splitext(path)[0] + ".txt", "w", encoding="utf-8") as f:
+            stats = pstats.Stats(profiler, stream=f)
+            stats.sort_stats("cumulative").print_stats(60)
+        return path
@@ -0,0 +1,78 @@
+import time as time_module
+from collections import deque
+from typing import Dict, Any, Optional
+
+
+class ResourcePool:
+    # 命名资源池：访问同一后端（数据库、同步工具等）的任务共用并发上限，可选令牌桶限速
+    def __init__(self, name: str, max_concurrency: int = 1, rate_per_minute: float = 0.0, burst: int = 1):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.rate_per_minute = rate_per_minute  # 每分钟允许启动的次数，0 表示不限速
+        self.burst = burst  # 令牌桶容量，允许短时间内连续启动的次数
+
+        self.tokens = float(burst)
+        self.refilled_at = time_module.monotonic()
+        self.running = 0
+        self.waiting: deque = deque()  # 等待空闲名额的执行，按触发顺序排列
+        self.retry_pending = False  # 已安排限速到期后的重试
+
+        # 等待时间统计（秒）
+        self.wait_count = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_wait = 0.0
+
+    def refill(self, now: float):
+        if self.rate_per_minute > 0:
+            self.tokens = min(float(self.burst), self.tokens + (now - self.refilled_at) * self.rate_per_minute / 60)
+        self.refilled_at = now
+
+    def try_acquire(self, now: Optional[float] = None) -> Optional[float]:
+        # 返回 0 表示已占用一个名额；返回秒数表示限速中、需要多久后再试；
+        # 返回 None 表示并发已满，需要等其他执行结束
+        if self.running >= max(1, self.max_concurrency):
+            return None
+        if self.rate_per_minute > 0:
+            now = time_module.monotonic() if now is None else now
+            self.refill(now)
+            if self.tokens < 1:
+                return (1 - self.tokens) * 60 / self.rate_per_minute
+            self.tokens -= 1
+        self.running += 1
+        return 0
+
+    def release(self):
+        self.running = max(0, self.running - 1)
+
+    def record_wait(self, seconds: float):
+        self.wait_count += 1
+        self.total_wait += seconds
+        self.max_wait = max(self.max_wait, seconds)
+        self.last_wait = seconds
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.wait_count if self.wait_count else 0.0
+
+    def configure(self, other: 'ResourcePool'):
+        # 重新加载设置时只更新配置，保留运行中的计数、等待队列和统计
+        self.max_concurrency = other.max_concurrency
+        self.rate_per_minute = other.rate_per_minute
+        self.burst = other.burst
+        self.tokens = min(self.tokens, float(other.burst))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "max_concurrency": self.max_concurrency,
+            "rate_per_minute": self.rate_per_minute,
+            "burst": self.burst
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ResourcePool':
+        return cls(data.get("name", ""),
+                   max(1, int(data.get("max_concurrency", 1))),
+                   max(0.0, float(data.get("rate_per_minute", 0.0))),
+                   max(1, int(data.get("burst", 1))))
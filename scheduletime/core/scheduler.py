@@ -0,0 +1,242 @@
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set
+
+import schedule
+from PyQt6.QtCore import QObject, QTime, pyqtSignal
+
+from .task import Task, TaskStatus, CatchUpPolicy
+from .jitter import JitterSettings
+from .metrics import timed
+from .forecast import Forecast, ForecastBuilder
+from .clock import SystemClock, ClockScheduler
+
+
+class TaskScheduler(QObject):
+    # 后台调度线程：按任务的定时规则登记 schedule 作业，到期时通过信号通知界面线程执行
+    TICK_SECONDS = 0.1
+
+    task_due = pyqtSignal(object)
+    # 下次执行时间变化：{任务ID: datetime 或 None}，第二个参数表示是否为全量结果
+    next_runs_changed = pyqtSignal(object, bool)
+    tasks_loaded = pyqtSignal()
+    ready = pyqtSignal()
+
+    def __init__(self, parent=None, clock: Optional[SystemClock] = None):
+        super().__init__(parent)
+        # 所有“当前时间”都从 clock 读取；换成 SimulatedClock 即可在虚拟时间中回放调度
+        self.clock = clock or SystemClock()
+        self.tasks: List[Task] = []
+        self.thread: Optional[threading.Thread] = None
+        self.running = False
+
+        # 使用独立的调度器实例，而不是 schedule 模块级的默认调度器；作业按触发时间放在堆中
+        self.jobs = ClockScheduler(self.clock)
+        # 调度器登记的任务及其 schedule 作业，以及本轮触发过、需要发布新执行时间的任务
+        self.scheduled_jobs: Dict[str, schedule.Job] = {}
+        self.fired_tasks: List[Task] = []
+        self.lock = threading.Lock()
+        self.jitter = JitterSettings()
+        # 暂停只是调度器的状态：作业照常计算触发时间，到期时不派发，只记录错过的次数；
+        # 任务自身的启用/禁用状态不受影响
+        self.paused = False
+        self.paused_tags: Set[str] = set()
+        self.missed: Dict[str, int] = {}
+
+    def start(self, loader: Optional[Callable[[], List[Task]]] = None):
+        # loader 不为空时在调度线程中读取任务，读取完成后立即登记作业
+        self.running = True
+        self.thread = threading.Thread(target=self.loop, args=(loader,), daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+
+    def loop(self, loader: Optional[Callable[[], List[Task]]] = None):
+        if loader:
+            self.tasks = loader()
+            self.tasks_loaded.emit()
+        self.reschedule_all()
+        self.ready.emit()
+
+        while self.running:
+            try:
+                self.tick()
+            except Exception:
+                pass
+
+            self.clock.sleep(self.TICK_SECONDS)
+
+    @timed("scheduler.tick")
+    def tick(self):
+        with self.lock:
+            self.jobs.run_pending()
+        self.publish_fired_next_runs()
+
+    @timed("scheduler.reschedule_all")
+    def reschedule_all(self):
+        try:
+            with self.lock:
+                self.jobs.clear()
+                self.scheduled_jobs.clear()
+                self.fired_tasks.clear()
+
+                for task in self.tasks:
+                    if task.status == TaskStatus.ENABLED:
+                        self.schedule_task(task)
+
+                next_runs = {task.id: self.get_next_run(task) for task in self.tasks
+                             if task.id in self.scheduled_jobs}
+            self.next_runs_changed.emit(next_runs, True)
+
+        except Exception:
+            pass
+
+    def run_until(self, end: datetime) -> int:
+        # 只用于模拟时钟：直接跳到下一个作业的触发时间，不等待真实时间，返回执行的轮数；
+        # 没有界面需要刷新，本轮触发过的任务不再发布新的执行时间
+        steps = 0
+        while True:
+            with self.lock:
+                next_run = self.jobs.next_run
+                if next_run is None or next_run > end:
+                    break
+                self.clock.advance_to(next_run)
+                self.jobs.run_pending()
+                self.fired_tasks.clear()
+            steps += 1
+        self.clock.advance_to(end)
+        return steps
+
+    def apply_changes(self, added: List[Task], updated: List[Task], removed: List[Task]):
+        # 增量更新：只为新增和修改的任务重新登记作业，其余任务的作业和触发时间保持不变
+        with self.lock:
+            next_runs: Dict[str, Optional[datetime]] = {}
+            cancelled = set()
+            for task in removed + updated:
+                job = self.scheduled_jobs.pop(task.id, None)
+                if job is not None:
+                    cancelled.add(job)
+                next_runs[task.id] = None
+            if cancelled:
+                # 批量操作可能一次取消上千个作业，逐个 cancel_job 是 O(作业数) 的列表删除，这里一次过滤
+                self.jobs.cancel_jobs(cancelled)
+            for task in updated + added:
+                if task.status == TaskStatus.ENABLED:
+                    self.schedule_task(task)
+                next_runs[task.id] = self.get_next_run(task)
+        if next_runs:
+            self.next_runs_changed.emit(next_runs, False)
+
+    def is_suspended(self, task: Task) -> bool:
+        return self.paused or (bool(self.paused_tags) and not self.paused_tags.isdisjoint(task.tags))
+
+    def pause(self, tags: Optional[List[str]] = None):
+        # tags 为空时全局暂停，否则只暂停带有这些标签的任务
+        with self.lock:
+            if tags:
+                self.paused_tags.update(tags)
+            else:
+                self.paused = True
+
+    def resume(self, tags: Optional[List[str]] = None) -> List[Task]:
+        # 返回暂停期间错过执行、且补执行策略为补执行一次的任务，由调用方派发
+        with self.lock:
+            if tags:
+                self.paused_tags.difference_update(tags)
+            else:
+                self.paused = False
+            catch_up = []
+            if self.missed:
+                for task in self.tasks:
+                    if task.id not in self.missed or self.is_suspended(task):
+                        continue
+                    del self.missed[task.id]
+                    if task.status == TaskStatus.ENABLED and task.catch_up_policy == CatchUpPolicy.ONCE:
+                        catch_up.append(task)
+        return catch_up
+
+    def record_missed(self, task: Task):
+        with self.lock:
+            self.missed[task.id] = self.missed.get(task.id, 0) + 1
+
+    def get_next_run(self, task: Task) -> Optional[datetime]:
+        # 以调度器中作业的实际触发时间为准
+        job = self.scheduled_jobs.get(task.id)
+        if job is None:
+            return None
+        return job.next_run
+
+    def forecast(self, hours: float, durations: Optional[Dict[str, float]] = None) -> Forecast:
+        # 负载预测：以作业当前的触发时间为起点，按与调度相同的规则和错峰设置向后推算
+        with self.lock:
+            tasks = list(self.tasks)
+            first_runs = {task.id: self.get_next_run(task) for task in tasks
+                          if task.id in self.scheduled_jobs}
+        first_runs = {task_id: run for task_id, run in first_runs.items() if run is not None}
+        return ForecastBuilder(self.jitter).build(tasks, self.clock.now(), hours, first_runs, durations)
+
+    def upcoming_runs(self, hours: float, limit: int = 500) -> list:
+        with self.lock:
+            tasks = list(self.tasks)
+            first_runs = {task.id: self.get_next_run(task) for task in tasks
+                          if task.id in self.scheduled_jobs}
+        first_runs = {task_id: run for task_id, run in first_runs.items() if run is not None}
+        return ForecastBuilder(self.jitter).upcoming_runs(tasks, self.clock.now(), hours, limit, first_runs)
+
+    def publish_fired_next_runs(self):
+        # run_pending 之后作业已计算出新的触发时间，只发布本轮触发过的任务
+        if not self.fired_tasks:
+            return
+        with self.lock:
+            next_runs = {task.id: self.get_next_run(task) for task in self.fired_tasks}
+            self.fired_tasks.clear()
+        self.next_runs_changed.emit(next_runs, False)
+
+    def schedule_task(self, task: Task):
+        try:
+            # 开始日期之前也登记作业，作业自己把首次触发推迟到开始日期；已经结束的任务不再登记
+            if self.clock.today() > task.end_date:
+                return
+
+            job = None
+            # 错峰：按任务ID哈希出的偏移加在执行时刻上，精确到秒
+            time_str = QTime(task.daily_time.hour(), task.daily_time.minute()).addSecs(self.jitter.offset_for(task)).toString("HH:mm:ss")
+
+            if task.schedule_type == "interval":
+                job = self.jobs.every(task.interval_seconds).seconds
+            elif task.schedule_type == "daily":
+                job = self.jobs.every().day.at(time_str)
+            elif task.schedule_type == "weekly":
+                days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+                job = getattr(self.jobs.every(), days[task.weekly_day]).at(time_str)
+            elif task.schedule_type == "monthly":  # 新增每月执行
+                job = self.jobs.every().monthly(task.monthly_day).at(time_str)
+
+            if job:
+                if task.schedule_type == "interval":
+                    # 固定间隔任务的首次触发按相位错开，之后由 schedule 每隔一个间隔触发
+                    first_run = self.jitter.first_interval_run(task, self.clock.now())
+                    if first_run is not None:
+                        job = job.starting_at(first_run)
+                job = job.between(task.start_date.toPyDate() if task.start_date.isValid() else None,
+                                  task.end_date.toPyDate())
+
+                def job_wrapper(task):
+                    try:
+                        self.fired_tasks.append(task)
+                        # run_pending 在持有 self.lock 时调用作业，这里直接记录错过的次数
+                        if self.is_suspended(task):
+                            self.missed[task.id] = self.missed.get(task.id, 0) + 1
+                            return
+                        self.task_due.emit(task)
+                    except Exception:
+                        pass
+
+                job.do(job_wrapper, task)
+                self.scheduled_jobs[task.id] = job
+        except Exception:
+            pass
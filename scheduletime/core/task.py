@@ -0,0 +1,319 @@
+import os
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Dict, List, Any, Optional
+import time as time_module
+
+from PyQt6.QtCore import QTime, QDate
+
+
+class TaskType(Enum):
+    CMD = "CMD命令"
+    NOTIFICATION = "提醒任务"
+
+
+class PopupType(Enum):
+    SYSTEM_TRAY = "右下角弹窗"
+    WINDOW_POPUP = "窗口弹窗"
+
+
+class TaskStatus(Enum):
+    ENABLED = "启用"
+    DISABLED = "禁用"
+
+
+class OverlapPolicy(Enum):
+    # 上一次执行尚未结束时再次触发的处理方式
+    SKIP = "跳过本次"
+    QUEUE = "排队等待"
+    PARALLEL = "并行执行"
+    CANCEL = "取消上一次"
+
+
+class RecoveryPolicy(Enum):
+    # 程序异常退出时正在执行的任务，重新启动后的处理方式
+    FAIL = "记为失败"
+    RERUN = "重新执行"
+
+
+class CatchUpPolicy(Enum):
+    # 暂停期间错过的执行，恢复后的处理方式
+    SKIP = "跳过错过的执行"
+    ONCE = "恢复后补执行一次"
+
+
+class Task:
+    def __init__(self):
+        self.id = str(int(time_module.time() * 1000))
+        self.name = ""
+        self.description = ""
+        self.task_type = TaskType.NOTIFICATION  # 修改默认值为提醒任务
+        self.status = TaskStatus.ENABLED
+        self.schedule_type = "interval"
+        self.interval_seconds = 60
+        self.daily_time = QTime.currentTime()
+        self.weekly_day = 0  # 0-6, Monday to Sunday
+        self.monthly_day = 1  # 1-31, day of month
+        self.start_date = QDate.currentDate()
+        self.end_date = QDate.currentDate().addYears(1)
+        self.cmd_command = ""
+        self.notification_title = ""
+        self.notification_content = ""
+        self.notification_timeout = 3000  # 添加弹窗显示时间属性，默认3秒
+        self.popup_type = "system_tray"  # 新增弹窗类型，默认系统托盘
+        self.last_execution = None
+        self.execution_count = 0
+        self.retry_count = 0
+        self.enable_logging = True
+        self.depends_on: List[str] = []  # 上游任务ID，上游全部成功完成后触发本任务
+        self.overlap_policy = OverlapPolicy.SKIP
+        self.max_overlap = 1  # 排队或并行的最大数量
+        self.recovery_policy = RecoveryPolicy.FAIL
+        self.resource_pool = ""  # 资源池名称，为空表示不受资源池限制
+        self.jitter_seconds: Optional[int] = None  # 错峰偏移窗口（秒），None 表示使用全局设置
+        # 运行环境：工作目录和环境变量对所有CMD任务生效，资源限制只在隔离模式下生效（0 表示不限制）
+        self.working_dir = ""
+        self.env: Dict[str, str] = {}
+        self.isolated = False
+        self.cpu_limit_seconds = 0
+        self.memory_limit_mb = 0
+        self.open_files_limit = 0
+        self.nice = 0  # 0-19，数值越大优先级越低
+        self.io_priority = ""  # "" / best-effort / idle
+        # 命令输出的保留设置，0 表示使用全局设置
+        self.output_max_runs = 0
+        self.output_max_kb = 0
+        # 事件触发：文件/目录变化或进程结束时执行，短时间内的多次事件按去抖时间合并为一次
+        self.watch_path = ""
+        self.watch_pattern = ""  # 目录中文件名的通配符，如 *.csv，为空表示任意文件
+        self.watch_process = ""  # 进程名或 PID
+        self.trigger_debounce_ms = 300
+        self.tags: List[str] = []  # 标签，可按标签批量暂停/恢复
+        self.group = ""  # 分组名称，为空表示未分组
+        self.catch_up_policy = CatchUpPolicy.SKIP
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "task_type": self.task_type.value,
+            "status": self.status.value,
+            "schedule_type": self.schedule_type,
+            "interval_seconds": self.interval_seconds,
+            "daily_time": self.daily_time.toString("hh:mm"),
+            "weekly_day": self.weekly_day,
+            "monthly_day": self.monthly_day,
+            "start_date": self.start_date.toString("yyyy-MM-dd"),
+            "end_date": self.end_date.toString("yyyy-MM-dd"),
+            "cmd_command": self.cmd_command,
+            "notification_title": self.notification_title,
+            "notification_content": self.notification_content,
+            "notification_timeout": self.notification_timeout,  # 保存弹窗显示时间
+            "popup_type": self.popup_type,
+            "last_execution": self.last_execution.isoformat() if self.last_execution else None,
+            "execution_count": self.execution_count,
+            "retry_count": self.retry_count,
+            "enable_logging": self.enable_logging,
+            "depends_on": self.depends_on,
+            "overlap_policy": self.overlap_policy.value,
+            "max_overlap": self.max_overlap,
+            "recovery_policy": self.recovery_policy.value,
+            "resource_pool": self.resource_pool,
+            "jitter_seconds": self.jitter_seconds,
+            "working_dir": self.working_dir,
+            "env": self.env,
+            "isolated": self.isolated,
+            "cpu_limit_seconds": self.cpu_limit_seconds,
+            "memory_limit_mb": self.memory_limit_mb,
+            "open_files_limit": self.open_files_limit,
+            "nice": self.nice,
+            "io_priority": self.io_priority,
+            "output_max_runs": self.output_max_runs,
+            "output_max_kb": self.output_max_kb,
+            "watch_path": self.watch_path,
+            "watch_pattern": self.watch_pattern,
+            "watch_process": self.watch_process,
+            "trigger_debounce_ms": self.trigger_debounce_ms,
+            "tags": self.tags,
+            "group": self.group,
+            "catch_up_policy": self.catch_up_policy.value
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Task':
+        task = cls()
+        task.id = data.get("id", str(int(time_module.time() * 1000)))
+        task.name = data.get("name", "")
+        task.description = data.get("description", "")
+
+        # 数据迁移：将旧的窗口弹窗提醒类型转换为提醒任务
+        raw_task_type = data.get("task_type", TaskType.NOTIFICATION.value)
+        if raw_task_type in [TaskType.NOTIFICATION.value, "窗口弹窗提醒"]:
+            task.task_type = TaskType.NOTIFICATION
+        elif raw_task_type == TaskType.CMD.value:
+            task.task_type = TaskType.CMD
+        else:
+            task.task_type = TaskType.NOTIFICATION  # 默认值
+
+        task.status = TaskStatus(data.get("status", TaskStatus.ENABLED.value))
+        task.schedule_type = data.get("schedule_type", "interval")
+        task.interval_seconds = data.get("interval_seconds", 60)
+        task.daily_time = QTime.fromString(data.get("daily_time", "00:00"), "hh:mm")
+        task.weekly_day = data.get("weekly_day", 0)
+        task.monthly_day = data.get("monthly_day", 1)  # 新增每月执行日期
+        task.start_date = QDate.fromString(data.get("start_date", QDate.currentDate().toString("yyyy-MM-dd")),
+                                           "yyyy-MM-dd")
+        task.end_date = QDate.fromString(data.get("end_date", QDate.currentDate().addYears(1).toString("yyyy-MM-dd")),
+                                         "yyyy-MM-dd")
+        task.cmd_command = data.get("cmd_command", "")
+        task.notification_title = data.get("notification_title", "")
+        task.notification_content = data.get("notification_content", "")
+        task.notification_timeout = data.get("notification_timeout", 3000)  # 加载弹窗显示时间
+        task.popup_type = data.get("popup_type", "system_tray")  # 加载弹窗类型
+        if data.get("last_execution"):
+            task.last_execution = datetime.fromisoformat(data["last_execution"])
+        task.execution_count = data.get("execution_count", 0)
+        task.retry_count = data.get("retry_count", 0)
+        task.enable_logging = data.get("enable_logging", True)
+        task.depends_on = list(data.get("depends_on", []))
+        try:
+            task.overlap_policy = OverlapPolicy(data.get("overlap_policy", OverlapPolicy.SKIP.value))
+        except ValueError:
+            task.overlap_policy = OverlapPolicy.SKIP
+        task.max_overlap = data.get("max_overlap", 1)
+        try:
+            task.recovery_policy = RecoveryPolicy(data.get("recovery_policy", RecoveryPolicy.FAIL.value))
+        except ValueError:
+            task.recovery_policy = RecoveryPolicy.FAIL
+        task.resource_pool = data.get("resource_pool", "")
+        task.jitter_seconds = data.get("jitter_seconds")
+        task.working_dir = data.get("working_dir", "")
+        task.env = dict(data.get("env", {}))
+        task.isolated = data.get("isolated", False)
+        task.cpu_limit_seconds = data.get("cpu_limit_seconds", 0)
+        task.memory_limit_mb = data.get("memory_limit_mb", 0)
+        task.open_files_limit = data.get("open_files_limit", 0)
+        task.nice = data.get("nice", 0)
+        task.io_priority = data.get("io_priority", "")
+        task.output_max_runs = data.get("output_max_runs", 0)
+        task.output_max_kb = data.get("output_max_kb", 0)
+        task.watch_path = data.get("watch_path", "")
+        task.watch_pattern = data.get("watch_pattern", "")
+        task.watch_process = data.get("watch_process", "")
+        task.trigger_debounce_ms = data.get("trigger_debounce_ms", 300)
+        task.tags = [str(tag) for tag in data.get("tags", []) if str(tag).strip()]
+        task.group = data.get("group", "")
+        try:
+            task.catch_up_policy = CatchUpPolicy(data.get("catch_up_policy", CatchUpPolicy.SKIP.value))
+        except ValueError:
+            task.catch_up_policy = CatchUpPolicy.SKIP
+        return task
+
+    def shift_schedule(self, minutes: int):
+        # 批量调整时间：每日/每周/每月任务的执行时刻整体平移，跨过零点时顺延到前一天或后一天
+        if self.schedule_type not in ("daily", "weekly", "monthly") or not minutes:
+            return
+        days, total = divmod(self.daily_time.hour() * 60 + self.daily_time.minute() + minutes, 1440)
+        self.daily_time = QTime(total // 60, total % 60)
+        if self.schedule_type == "weekly":
+            self.weekly_day = (self.weekly_day + days) % 7
+        elif self.schedule_type == "monthly":
+            self.monthly_day = (self.monthly_day - 1 + days) % 31 + 1
+
+    def get_schedule_description(self) -> str:
+        if self.schedule_type == "interval":
+            if self.interval_seconds < 60:
+                return f"每{self.interval_seconds}秒"
+            elif self.interval_seconds < 3600:
+                minutes = self.interval_seconds // 60
+                seconds = self.interval_seconds % 60
+                if seconds == 0:
+                    return f"每{minutes}分钟"
+                else:
+                    return f"每{minutes}分{seconds}秒"
+            else:
+                hours = self.interval_seconds // 3600
+                minutes = (self.interval_seconds % 3600) // 60
+                seconds = self.interval_seconds % 60
+                if minutes == 0 and seconds == 0:
+                    return f"每{hours}小时"
+                elif seconds == 0:
+                    return f"每{hours}小时{minutes}分钟"
+                else:
+                    return f"每{hours}小时{minutes}分{seconds}秒"
+        elif self.schedule_type == "daily":
+            return f"每天 {self.daily_time.toString('hh:mm')}"
+        elif self.schedule_type == "weekly":
+            days = ["周一", "周二", "周三", "周四", "周五", "周六", "周日"]
+            return f"每周{days[self.weekly_day]} {self.daily_time.toString('hh:mm')}"
+        elif self.schedule_type == "monthly":
+            return f"每月{self.monthly_day}日 {self.daily_time.toString('hh:mm')}"
+        elif self.schedule_type == "dependency":
+            return f"上游{len(self.depends_on)}个任务完成后"
+        elif self.schedule_type == "file_change":
+            target = os.path.join(self.watch_path, self.watch_pattern) if self.watch_pattern else self.watch_path
+            return f"文件变化: {target}"
+        elif self.schedule_type == "process_exit":
+            return f"进程结束: {self.watch_process}"
+        return "未知"
+
+    def get_next_run_datetime(self, now: Optional[datetime] = None, offset_seconds: int = 0) -> Optional[datetime]:
+        # offset_seconds 为错峰偏移，加在每日/每周/每月的执行时刻上
+        if self.status != TaskStatus.ENABLED:
+            return None
+
+        now = now or datetime.now()
+        hour, minute = self.daily_time.hour(), self.daily_time.minute()
+        offset = timedelta(seconds=offset_seconds)
+
+        if self.schedule_type == "interval":
+            if self.last_execution:
+                return self.last_execution + timedelta(seconds=self.interval_seconds)
+            return now + timedelta(seconds=self.interval_seconds)
+
+        elif self.schedule_type == "daily":
+            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0) + offset
+            if next_run <= now:
+                next_run += timedelta(days=1)
+            return next_run
+
+        elif self.schedule_type == "weekly":
+            days_ahead = (self.weekly_day - now.weekday()) % 7
+            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0) + timedelta(days=days_ahead) + offset
+            if next_run <= now:
+                next_run += timedelta(days=7)
+            return next_run
+
+        elif self.schedule_type == "monthly":
+            # 跳过没有该日期的月份（如2月30日），与调度器按日匹配的行为一致
+            year, month = now.year, now.month
+            for _ in range(13):
+                try:
+                    next_run = datetime(year, month, self.monthly_day, hour, minute) + offset
+                except ValueError:
+                    next_run = None
+                if next_run and next_run > now:
+                    return next_run
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        return None
+
+    def get_next_run_time(self) -> str:
+        if self.status != TaskStatus.ENABLED:
+            return "未启用"
+        if self.schedule_type == "dependency":
+            return "等待上游任务"
+        if self.schedule_type == "file_change":
+            return "等待文件变化"
+        if self.schedule_type == "process_exit":
+            return "等待进程结束"
+
+        try:
+            next_run = self.get_next_run_datetime()
+        except Exception:
+            return "计算错误"
+
+        if next_run is None:
+            return "未知"
+        return next_run.strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,281 @@
+import os
+import fnmatch
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+from .task import Task, TaskStatus
+from .clock import SystemClock
+
+EVENT_TRIGGER_TYPES = ("file_change", "process_exit")
+
+
+def scan_path(path: str, pattern: str) -> Dict[str, Tuple[int, int]]:
+    # 文件或目录的快照：{文件名: (修改时间, 大小)}，目录只比较第一层中符合通配符的文件
+    try:
+        if os.path.isdir(path):
+            snapshot = {}
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if pattern and not fnmatch.fnmatch(entry.name, pattern):
+                        continue
+                    try:
+                        stat = entry.stat()
+                        snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+                    except OSError:
+                        continue
+            return snapshot
+        stat = os.stat(path)
+        return {os.path.basename(path): (stat.st_mtime_ns, stat.st_size)}
+    except OSError:
+        return {}
+
+
+def list_processes() -> Dict[int, str]:
+    # {PID: 进程名}；优先使用可选依赖 psutil，没有安装时 Linux 读取 /proc，Windows 调用 tasklist
+    try:
+        import psutil
+        return {process.pid: process.info["name"] or "" for process in psutil.process_iter(["name"])}
+    except ImportError:
+        pass
+
+    processes = {}
+    if os.path.isdir("/proc"):
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                # /proc/<pid>/stat 的格式为 “pid (进程名) 状态 ...”，已退出但未被回收的僵尸进程（Z）视为已结束
+                with open(f"/proc/{entry}/stat", "r", encoding="utf-8", errors="replace") as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            name, _, rest = stat[stat.find("(") + 1:].rpartition(")")
+            if rest.split()[:1] != ["Z"]:
+                processes[int(entry)] = name
+    elif os.name == "nt":
+        import csv
+        import subprocess
+        output = subprocess.run(["tasklist", "/fo", "csv", "/nh"], capture_output=True, text=True,
+                                creationflags=subprocess.CREATE_NO_WINDOW).stdout
+        for row in csv.reader(output.splitlines()):
+            if len(row) >= 2 and row[1].isdigit():
+                processes[int(row[1])] = row[0]
+    return processes
+
+
+def process_matches(name: str, target: str) -> bool:
+    # 不区分大小写，忽略 .exe 后缀；/proc/<pid>/comm 最多 15 个字符，按前缀比较
+    name, target = name.lower(), target.lower()
+    if name.endswith(".exe"):
+        name = name[:-4]
+    if target.endswith(".exe"):
+        target = target[:-4]
+    return name == target or (len(name) == 15 and target.startswith(name))
+
+
+class EventTriggerManager(QObject):
+    # 事件触发：文件/目录变化（QFileSystemWatcher，Linux 上基于 inotify）和进程结束。
+    # 同一任务短时间内的多次事件按任务的去抖时间合并为一次触发，与定时任务一样通过 triggered 信号交给执行器
+    POLL_INTERVAL_MS = 5000  # 收不到文件系统通知时（如网络磁盘）的轮询间隔
+    PROCESS_POLL_SECONDS = 2.0
+
+    triggered = pyqtSignal(object)
+    processes_exited = pyqtSignal(object)  # 进程监视线程发出：[任务ID]
+
+    def __init__(self, parent=None, clock: Optional[SystemClock] = None):
+        super().__init__(parent)
+        # 与调度器共用时钟，任务的起止日期按同一个“今天”判断
+        self.clock = clock or SystemClock()
+        self.tasks: Dict[str, Task] = {}
+        self.configs: Dict[str, tuple] = {}
+        self.snapshots: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        self.debounce_timers: Dict[str, QTimer] = {}
+        self.watched_paths: Dict[str, List[str]] = {}
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.on_path_changed)
+        self.watcher.directoryChanged.connect(self.on_path_changed)
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(self.POLL_INTERVAL_MS)
+        self.poll_timer.timeout.connect(self.poll_files)
+
+        # 进程监视在后台线程中轮询进程列表，只有存在进程结束触发的任务时才运行
+        self.process_targets: Dict[str, str] = {}
+        self.process_pids: Dict[str, set] = {}
+        self.process_lock = threading.Lock()
+        self.process_thread: Optional[threading.Thread] = None
+        # 每个监视线程有自己的停止事件：先停止再重新启动时，旧线程不会因为共用的标志被重新置位而继续运行
+        self.process_stop: Optional[threading.Event] = None
+        self.processes_exited.connect(self.on_processes_exited)
+
+    def config_of(self, task: Task) -> Optional[tuple]:
+        today = self.clock.today()
+        if (task.status != TaskStatus.ENABLED or task.schedule_type not in EVENT_TRIGGER_TYPES
+                or today < task.start_date or today > task.end_date):
+            return None
+        if task.schedule_type == "file_change":
+            if not task.watch_path:
+                return None
+            return task.schedule_type, os.path.abspath(task.watch_path), task.watch_pattern
+        if not task.watch_process.strip():
+            return None
+        return task.schedule_type, task.watch_process.strip()
+
+    def set_tasks(self, tasks: List[Task]):
+        # 增量更新：只为监视配置发生变化的任务重新登记，未变化的任务保留快照和进程列表
+        configs = {}
+        for task in tasks:
+            config = self.config_of(task)
+            if config is not None:
+                configs[task.id] = config
+                self.tasks[task.id] = task
+
+        for task_id in list(self.configs):
+            if configs.get(task_id) != self.configs[task_id]:
+                self.remove(task_id)
+        for task_id, config in configs.items():
+            if task_id not in self.configs:
+                self.add(task_id, config)
+        for task_id in list(self.tasks):
+            if task_id not in configs:
+                del self.tasks[task_id]
+
+        if any(config[0] == "file_change" for config in self.configs.values()):
+            self.poll_timer.start()
+        else:
+            self.poll_timer.stop()
+        with self.process_lock:
+            has_process_tasks = bool(self.process_targets)
+        if has_process_tasks and self.process_stop is None:
+            self.process_stop = threading.Event()
+            self.process_thread = threading.Thread(target=self.watch_processes, args=(self.process_stop,),
+                                                   name="process-trigger", daemon=True)
+            self.process_thread.start()
+        elif not has_process_tasks:
+            self.stop_process_thread()
+
+    def stop_process_thread(self):
+        if self.process_stop is not None:
+            self.process_stop.set()
+            self.process_stop = None
+            self.process_thread = None
+
+    def add(self, task_id: str, config: tuple):
+        self.configs[task_id] = config
+        if config[0] == "file_change":
+            path, pattern = config[1], config[2]
+            self.snapshots[task_id] = scan_path(path, pattern)
+            # 监视单个文件时同时监视上级目录，文件被删除后重新创建或被原子替换时也能收到通知
+            paths = [path] if os.path.isdir(path) else [path, os.path.dirname(path)]
+            paths = [p for p in paths if os.path.exists(p)]
+            self.watched_paths[task_id] = paths
+            new_paths = [p for p in paths if p not in self.watcher.files() + self.watcher.directories()]
+            if new_paths:
+                self.watcher.addPaths(new_paths)
+        else:
+            with self.process_lock:
+                self.process_targets[task_id] = config[1]
+                self.process_pids.pop(task_id, None)
+
+    def remove(self, task_id: str):
+        config = self.configs.pop(task_id)
+        timer = self.debounce_timers.pop(task_id, None)
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+        if config[0] == "file_change":
+            self.snapshots.pop(task_id, None)
+            paths = self.watched_paths.pop(task_id, [])
+            still_used = {p for other in self.watched_paths.values() for p in other}
+            unused = [p for p in paths if p not in still_used]
+            if unused:
+                self.watcher.removePaths(unused)
+        else:
+            with self.process_lock:
+                self.process_targets.pop(task_id, None)
+                self.process_pids.pop(task_id, None)
+
+    def stop(self):
+        self.stop_process_thread()
+        self.poll_timer.stop()
+        for task_id in list(self.configs):
+            self.remove(task_id)
+        self.tasks.clear()
+
+    def on_path_changed(self, path: str):
+        for task_id, paths in list(self.watched_paths.items()):
+            if path in paths:
+                self.check_file_task(task_id)
+
+    def poll_files(self):
+        for task_id, config in list(self.configs.items()):
+            if config[0] == "file_change":
+                self.check_file_task(task_id)
+
+    def check_file_task(self, task_id: str):
+        # 目录通知也会由无关文件引起，比较快照后只在符合通配符的文件有变化时触发
+        config = self.configs.get(task_id)
+        if config is None:
+            return
+        snapshot = scan_path(config[1], config[2])
+        if snapshot == self.snapshots.get(task_id):
+            return
+        self.snapshots[task_id] = snapshot
+        # 被监视的文件删除后重新创建时，QFileSystemWatcher 不再监视它，需要重新添加
+        watching = self.watcher.files() + self.watcher.directories()
+        missing = [p for p in self.watched_paths.get(task_id, []) + [config[1]]
+                   if os.path.exists(p) and p not in watching]
+        if missing:
+            self.watcher.addPaths(list(dict.fromkeys(missing)))
+            self.watched_paths[task_id] = list(dict.fromkeys(self.watched_paths.get(task_id, []) + missing))
+        self.schedule_trigger(task_id)
+
+    def watch_processes(self, stop: threading.Event):
+        while not stop.is_set():
+            try:
+                exited = self.poll_processes(list_processes())
+                if exited and not stop.is_set():
+                    self.processes_exited.emit(exited)
+            except Exception:
+                pass
+            stop.wait(self.PROCESS_POLL_SECONDS)
+
+    def poll_processes(self, processes: Dict[int, str]) -> List[str]:
+        # 按进程名监视时，任何一个匹配的进程结束都会触发；按 PID 监视时该进程结束后触发一次
+        exited = []
+        with self.process_lock:
+            for task_id, target in self.process_targets.items():
+                if target.isdigit():
+                    pids = {int(target)} & set(processes)
+                else:
+                    pids = {pid for pid, name in processes.items() if process_matches(name, target)}
+                previous = self.process_pids.get(task_id)
+                if previous is not None and previous - pids:
+                    exited.append(task_id)
+                self.process_pids[task_id] = pids
+        return exited
+
+    def on_processes_exited(self, task_ids: List[str]):
+        for task_id in task_ids:
+            if task_id in self.configs:
+                self.schedule_trigger(task_id)
+
+    def schedule_trigger(self, task_id: str):
+        task = self.tasks.get(task_id)
+        if task is None:
+            return
+        timer = self.debounce_timers.get(task_id)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self.fire(task_id))
+            self.debounce_timers[task_id] = timer
+        timer.setInterval(max(0, task.trigger_debounce_ms))
+        timer.start()
+
+    def fire(self, task_id: str):
+        task = self.tasks.get(task_id)
+        if task is not None and task.status == TaskStatus.ENABLED:
+            self.triggered.emit(task)
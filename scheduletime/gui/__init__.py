@@ -0,0 +1 @@
+# 界面模块不在包初始化时导入任何子模块：对话框等较重的模块在第一次使用时才加载
@@ -0,0 +1,33 @@
+import os
+import sys
+from typing import List, Optional
+
+from PyQt6.QtWidgets import QApplication, QStyle
+
+from .main_window import TaskManager
+from .single_instance import SingleInstance
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv if argv is None else argv
+    app = QApplication(argv)
+    app.setQuitOnLastWindowClosed(False)
+    app.setWindowIcon(app.style().standardIcon(QStyle.StandardPixmap.SP_TitleBarMenuButton))
+
+    # --minimized: 只启动托盘和调度器，主界面在第一次打开时再构建
+    start_minimized = "--minimized" in argv[1:]
+
+    # 同一数据目录已有实例在运行时，通知它显示主窗口后直接退出
+    instance = SingleInstance(os.getcwd())
+    if not instance.acquire("minimized" if start_minimized else "show"):
+        return 0
+
+    manager = TaskManager(start_minimized=start_minimized)
+    instance.message_received.connect(manager.handle_instance_message)
+    if not start_minimized:
+        manager.show()
+
+    try:
+        return app.exec()
+    finally:
+        instance.release()
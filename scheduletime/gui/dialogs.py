@@ -0,0 +1,1104 @@
+import math
+from typing import Dict, List, Optional
+
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+                             QLineEdit, QComboBox, QTextEdit, QSpinBox, QCheckBox, QTimeEdit,
+                             QDialog, QFormLayout, QTabWidget, QMessageBox, QStyle,
+                             QListWidget, QListWidgetItem, QTableWidget, QTableWidgetItem,
+                             QHeaderView, QAbstractItemView, QFileDialog, QPlainTextEdit, QSplitter)
+from PyQt6.QtCore import Qt, QTime, QTimer, QRectF
+from PyQt6.QtGui import QPainter, QColor, QPen
+
+from ..core.task import Task, TaskType, PopupType, TaskStatus, OverlapPolicy, RecoveryPolicy, CatchUpPolicy
+from ..core.graph import TaskGraph
+from ..core.pools import ResourcePool
+from ..core.jitter import JitterSettings
+from ..core.forecast import Forecast, DEFAULT_CMD_DURATION
+
+
+class TaskEditDialog(QDialog):
+    def __init__(self, task: Optional[Task] = None, parent=None, all_tasks: Optional[List[Task]] = None,
+                 pool_names: Optional[List[str]] = None):
+        super().__init__(parent)
+        self.task = task if task else Task()
+        self.all_tasks = all_tasks or []
+        self.pool_names = pool_names or []
+        self.setup_ui()
+        self.load_task_data()
+
+    def setup_ui(self):
+        self.setWindowTitle("编辑任务")
+        self.setModal(True)
+        self.resize(600, 500)  # 增大窗口尺寸
+
+        # 设置全局字体大小
+        font = self.font()
+        font.setPointSize(10)  # 增大字体
+        self.setFont(font)
+
+        tab_widget = QTabWidget()
+        layout = QVBoxLayout()
+        layout.addWidget(tab_widget)
+
+        # 基本信息
+        basic_widget = QWidget()
+        basic_layout = QFormLayout()
+        # 设置表单布局的间距和边距
+        basic_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        basic_layout.setHorizontalSpacing(15)
+        basic_layout.setVerticalSpacing(10)
+
+        self.name_edit = QLineEdit()
+        self.name_edit.setMinimumHeight(25)  # 增大控件高度
+        self.name_edit.addAction(
+            self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon),
+            QLineEdit.ActionPosition.LeadingPosition
+        )
+
+        self.description_edit = QTextEdit()
+        self.description_edit.setMaximumHeight(100)  # 增大高度
+        self.description_edit.setMinimumHeight(80)
+
+        self.type_combo = QComboBox()
+        self.type_combo.setMinimumHeight(25)
+        self.type_combo.addItems([t.value for t in TaskType])
+        self.type_combo.setItemIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_CommandLink))
+        self.type_combo.setItemIcon(1, self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation))
+
+        basic_layout.addRow("任务名称:", self.name_edit)
+        basic_layout.addRow("任务描述:", self.description_edit)
+        basic_layout.addRow("任务类型:", self.type_combo)
+
+        self.group_combo = QComboBox()
+        self.group_combo.setMinimumHeight(25)
+        self.group_combo.setEditable(True)
+        self.group_combo.addItems(sorted({other.group for other in self.all_tasks if other.group}))
+        self.group_combo.lineEdit().setPlaceholderText("为空表示未分组")
+
+        self.tags_edit = QLineEdit()
+        self.tags_edit.setMinimumHeight(25)
+        self.tags_edit.setPlaceholderText("多个标签以逗号分隔，可按标签批量暂停")
+        basic_layout.addRow("分组:", self.group_combo)
+        basic_layout.addRow("标签:", self.tags_edit)
+
+        basic_widget.setLayout(basic_layout)
+        tab_widget.addTab(basic_widget, "基本信息")
+
+        # 定时配置
+        schedule_widget = QWidget()
+        schedule_layout = QFormLayout()
+        schedule_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        schedule_layout.setHorizontalSpacing(15)
+        schedule_layout.setVerticalSpacing(10)
+
+        self.schedule_type_combo = QComboBox()
+        self.schedule_type_combo.setMinimumHeight(25)
+        self.schedule_type_combo.addItems(["固定间隔", "每日", "每周", "每月", "依赖触发", "文件变化", "进程结束"])
+        self.schedule_type_combo.setItemIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowUp))
+        self.schedule_type_combo.setItemIcon(1, self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOkButton))
+        self.schedule_type_combo.setItemIcon(2, self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOpenButton))
+        self.schedule_type_combo.setItemIcon(3, self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOpenButton))
+        self.schedule_type_combo.setItemIcon(4, self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowRight))
+        self.schedule_type_combo.setItemIcon(5, self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
+        self.schedule_type_combo.setItemIcon(6, self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserStop))
+
+        self.interval_spin = QSpinBox()
+        self.interval_spin.setMinimumHeight(25)
+        self.interval_spin.setRange(1, 100000)
+
+        self.interval_unit_combo = QComboBox()
+        self.interval_unit_combo.setMinimumHeight(25)
+        self.interval_unit_combo.addItems(["秒", "分钟", "小时"])
+
+        self.daily_time_edit = QTimeEdit()
+        self.daily_time_edit.setMinimumHeight(25)
+        self.daily_time_edit.setTime(QTime.currentTime())
+
+        self.weekly_combo = QComboBox()
+        self.weekly_combo.setMinimumHeight(25)
+        self.weekly_combo.addItems(["周一", "周二", "周三", "周四", "周五", "周六", "周日"])
+
+        self.monthly_day_spin = QSpinBox()
+        self.monthly_day_spin.setMinimumHeight(25)
+        self.monthly_day_spin.setRange(1, 31)
+        self.monthly_day_spin.setValue(1)
+
+        # 错峰偏移：在执行时刻之后的窗口内按任务ID固定偏移，-1 表示使用全局设置
+        self.jitter_spin = QSpinBox()
+        self.jitter_spin.setMinimumHeight(25)
+        self.jitter_spin.setRange(-1, 24 * 3600)
+        self.jitter_spin.setSpecialValueText("使用全局设置")
+        self.jitter_spin.setSuffix(" 秒")
+
+        # 上游依赖：勾选的任务全部执行成功后触发本任务
+        self.depends_list = QListWidget()
+        self.depends_list.setMinimumHeight(100)
+        for other in self.all_tasks:
+            if other.id == self.task.id:
+                continue
+            item = QListWidgetItem(other.name or other.id)
+            item.setData(Qt.ItemDataRole.UserRole, other.id)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Unchecked)
+            self.depends_list.addItem(item)
+
+        # 事件触发：监视的文件或目录（目录可按通配符过滤文件名）、进程名或 PID，以及去抖时间
+        self.watch_path_edit = QLineEdit()
+        self.watch_path_edit.setMinimumHeight(25)
+        self.watch_path_edit.setPlaceholderText("要监视的文件或目录")
+        self.watch_path_button = QPushButton("浏览...")
+        self.watch_path_widget = QWidget()
+        watch_path_layout = QHBoxLayout()
+        watch_path_layout.setContentsMargins(0, 0, 0, 0)
+        watch_path_layout.addWidget(self.watch_path_edit)
+        watch_path_layout.addWidget(self.watch_path_button)
+        self.watch_path_widget.setLayout(watch_path_layout)
+
+        self.watch_pattern_edit = QLineEdit()
+        self.watch_pattern_edit.setMinimumHeight(25)
+        self.watch_pattern_edit.setPlaceholderText("如 *.csv，为空表示目录中任意文件")
+
+        self.watch_process_edit = QLineEdit()
+        self.watch_process_edit.setMinimumHeight(25)
+        self.watch_process_edit.setPlaceholderText("进程名（如 backup.exe）或 PID")
+
+        self.debounce_spin = QSpinBox()
+        self.debounce_spin.setMinimumHeight(25)
+        self.debounce_spin.setRange(0, 600000)
+        self.debounce_spin.setSuffix(" 毫秒")
+
+        schedule_layout.addRow("定时类型:", self.schedule_type_combo)
+        schedule_layout.addRow("间隔时间:", self.interval_spin)
+        schedule_layout.addRow("时间单位:", self.interval_unit_combo)
+        schedule_layout.addRow("执行时间:", self.daily_time_edit)
+        schedule_layout.addRow("星期:", self.weekly_combo)
+        schedule_layout.addRow("每月日期:", self.monthly_day_spin)
+        schedule_layout.addRow("错峰窗口:", self.jitter_spin)
+        schedule_layout.addRow("上游任务:", self.depends_list)
+        schedule_layout.addRow("监视路径:", self.watch_path_widget)
+        schedule_layout.addRow("文件名通配符:", self.watch_pattern_edit)
+        schedule_layout.addRow("监视进程:", self.watch_process_edit)
+        schedule_layout.addRow("去抖时间:", self.debounce_spin)
+
+        schedule_widget.setLayout(schedule_layout)
+        tab_widget.addTab(schedule_widget, "定时配置")
+
+        # 任务内容
+        content_widget = QWidget()
+        content_layout = QVBoxLayout()
+        content_layout.setSpacing(10)
+
+        self.cmd_text = QTextEdit()
+        self.cmd_text.setMinimumHeight(100)
+        self.cmd_text.setPlaceholderText("输入要执行的CMD命令...")
+
+        self.notification_title_edit = QLineEdit()
+        self.notification_title_edit.setMinimumHeight(25)
+        self.notification_title_edit.setPlaceholderText("提醒标题...")
+
+        self.notification_content_edit = QTextEdit()
+        self.notification_content_edit.setMinimumHeight(100)
+        self.notification_content_edit.setMaximumHeight(150)
+        self.notification_content_edit.setPlaceholderText("提醒内容...")
+
+        # 添加弹窗类型选择
+        self.popup_type_combo = QComboBox()
+        self.popup_type_combo.setMinimumHeight(25)
+        self.popup_type_combo.addItems([PopupType.SYSTEM_TRAY.value, PopupType.WINDOW_POPUP.value])
+
+        # 添加弹窗显示时间输入框
+        self.notification_timeout_spin = QSpinBox()
+        self.notification_timeout_spin.setMinimumHeight(25)
+        self.notification_timeout_spin.setRange(1, 60000)  # 1毫秒到60秒
+        self.notification_timeout_spin.setValue(3000)  # 默认3秒
+        self.notification_timeout_spin.setSuffix(" 毫秒")
+
+        content_layout.addWidget(QLabel("CMD命令:"))
+        content_layout.addWidget(self.cmd_text)
+        content_layout.addWidget(QLabel("提醒标题:"))
+        content_layout.addWidget(self.notification_title_edit)
+        content_layout.addWidget(QLabel("提醒内容:"))
+        content_layout.addWidget(self.notification_content_edit)
+        content_layout.addWidget(QLabel("弹窗类型:"))
+        content_layout.addWidget(self.popup_type_combo)
+        content_layout.addWidget(QLabel("弹窗显示时间:"))
+        content_layout.addWidget(self.notification_timeout_spin)
+
+        content_widget.setLayout(content_layout)
+        tab_widget.addTab(content_widget, "任务内容")
+
+        # 高级选项
+        advanced_widget = QWidget()
+        advanced_layout = QFormLayout()
+        advanced_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        advanced_layout.setHorizontalSpacing(15)
+        advanced_layout.setVerticalSpacing(10)
+
+        self.enable_check = QCheckBox("启用任务")
+        self.enable_check.setChecked(True)
+
+        self.retry_spin = QSpinBox()
+        self.retry_spin.setMinimumHeight(25)
+        self.retry_spin.setRange(0, 10)
+
+        self.logging_check = QCheckBox("记录执行日志")
+        self.logging_check.setChecked(True)
+
+        # 上一次执行尚未结束时的处理方式（仅CMD任务）
+        self.overlap_combo = QComboBox()
+        self.overlap_combo.setMinimumHeight(25)
+        self.overlap_combo.addItems([policy.value for policy in OverlapPolicy])
+
+        self.max_overlap_spin = QSpinBox()
+        self.max_overlap_spin.setMinimumHeight(25)
+        self.max_overlap_spin.setRange(1, 20)
+
+        # 资源池：共用同一后端的CMD任务受资源池的并发数和启动速率限制
+        self.pool_combo = QComboBox()
+        self.pool_combo.setMinimumHeight(25)
+        self.pool_combo.addItem("不使用", "")
+        pool_names = list(self.pool_names)
+        if self.task.resource_pool and self.task.resource_pool not in pool_names:
+            pool_names.append(self.task.resource_pool)
+        for name in pool_names:
+            self.pool_combo.addItem(name, name)
+
+        advanced_layout.addRow(self.enable_check)
+        advanced_layout.addRow("重试次数:", self.retry_spin)
+        advanced_layout.addRow(self.logging_check)
+        advanced_layout.addRow("重叠执行:", self.overlap_combo)
+        advanced_layout.addRow("排队/并行上限:", self.max_overlap_spin)
+        advanced_layout.addRow("资源池:", self.pool_combo)
+
+        # 程序异常退出时正在执行的命令，重新启动后记为失败或重新执行
+        self.recovery_combo = QComboBox()
+        self.recovery_combo.setMinimumHeight(25)
+        self.recovery_combo.addItems([policy.value for policy in RecoveryPolicy])
+        advanced_layout.addRow("异常退出后:", self.recovery_combo)
+
+        # 暂停期间错过的执行，恢复后是否补执行一次
+        self.catch_up_combo = QComboBox()
+        self.catch_up_combo.setMinimumHeight(25)
+        self.catch_up_combo.addItems([policy.value for policy in CatchUpPolicy])
+        advanced_layout.addRow("暂停后恢复:", self.catch_up_combo)
+
+        advanced_widget.setLayout(advanced_layout)
+        tab_widget.addTab(advanced_widget, "高级选项")
+
+        # 运行环境（仅CMD任务）
+        environment_widget = QWidget()
+        environment_layout = QFormLayout()
+        environment_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        environment_layout.setHorizontalSpacing(15)
+        environment_layout.setVerticalSpacing(10)
+
+        self.working_dir_edit = QLineEdit()
+        self.working_dir_edit.setMinimumHeight(25)
+        self.working_dir_edit.setPlaceholderText("为空时使用程序当前目录")
+        self.working_dir_button = QPushButton("浏览...")
+        working_dir_layout = QHBoxLayout()
+        working_dir_layout.addWidget(self.working_dir_edit)
+        working_dir_layout.addWidget(self.working_dir_button)
+
+        self.env_edit = QTextEdit()
+        self.env_edit.setMaximumHeight(80)
+        self.env_edit.setPlaceholderText("每行一个，格式为 名称=值")
+
+        self.isolated_check = QCheckBox("隔离模式：限制命令可使用的资源")
+
+        self.cpu_limit_spin = QSpinBox()
+        self.cpu_limit_spin.setMinimumHeight(25)
+        self.cpu_limit_spin.setRange(0, 7 * 24 * 3600)
+        self.cpu_limit_spin.setSpecialValueText("不限制")
+        self.cpu_limit_spin.setSuffix(" 秒")
+
+        self.memory_limit_spin = QSpinBox()
+        self.memory_limit_spin.setMinimumHeight(25)
+        self.memory_limit_spin.setRange(0, 1024 * 1024)
+        self.memory_limit_spin.setSpecialValueText("不限制")
+        self.memory_limit_spin.setSuffix(" MB")
+
+        self.open_files_spin = QSpinBox()
+        self.open_files_spin.setMinimumHeight(25)
+        self.open_files_spin.setRange(0, 1024 * 1024)
+        self.open_files_spin.setSpecialValueText("不限制")
+
+        self.nice_spin = QSpinBox()
+        self.nice_spin.setMinimumHeight(25)
+        self.nice_spin.setRange(0, 19)
+        self.nice_spin.setSpecialValueText("默认")
+
+        self.io_priority_combo = QComboBox()
+        self.io_priority_combo.setMinimumHeight(25)
+        self.io_priority_combo.addItem("默认", "")
+        self.io_priority_combo.addItem("低优先级", "best-effort")
+        self.io_priority_combo.addItem("仅在磁盘空闲时", "idle")
+
+        environment_layout.addRow("工作目录:", working_dir_layout)
+        environment_layout.addRow("环境变量:", self.env_edit)
+        environment_layout.addRow(self.isolated_check)
+        environment_layout.addRow("CPU时间上限:", self.cpu_limit_spin)
+        environment_layout.addRow("内存上限:", self.memory_limit_spin)
+        environment_layout.addRow("打开文件数上限:", self.open_files_spin)
+        environment_layout.addRow("CPU优先级(nice):", self.nice_spin)
+        environment_layout.addRow("磁盘IO优先级:", self.io_priority_combo)
+
+        # 命令输出保留设置，0 表示使用 settings.json 中的默认值
+        self.output_runs_spin = QSpinBox()
+        self.output_runs_spin.setMinimumHeight(25)
+        self.output_runs_spin.setRange(0, 100000)
+        self.output_runs_spin.setSpecialValueText("默认")
+        self.output_runs_spin.setSuffix(" 次")
+
+        self.output_kb_spin = QSpinBox()
+        self.output_kb_spin.setMinimumHeight(25)
+        self.output_kb_spin.setRange(0, 1024 * 1024)
+        self.output_kb_spin.setSpecialValueText("默认")
+        self.output_kb_spin.setSuffix(" KB")
+
+        environment_layout.addRow("保留输出次数:", self.output_runs_spin)
+        environment_layout.addRow("输出占用上限:", self.output_kb_spin)
+
+        environment_widget.setLayout(environment_layout)
+        self.environment_tab_index = tab_widget.addTab(environment_widget, "运行环境")
+        self.tab_widget = tab_widget
+
+        # 按钮
+        button_layout = QHBoxLayout()
+        self.ok_button = QPushButton("确定")
+        self.ok_button.setMinimumHeight(30)  # 增大按钮
+        self.ok_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOkButton))
+        self.cancel_button = QPushButton("取消")
+        self.cancel_button.setMinimumHeight(30)
+        self.cancel_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton))
+
+        button_layout.addWidget(self.ok_button)
+        button_layout.addWidget(self.cancel_button)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+
+        # 连接信号
+        self.schedule_type_combo.currentTextChanged.connect(self.on_schedule_type_changed)
+        self.type_combo.currentTextChanged.connect(self.on_task_type_changed)
+        self.isolated_check.toggled.connect(self.on_isolated_changed)
+        self.working_dir_button.clicked.connect(self.browse_working_dir)
+        self.watch_path_button.clicked.connect(self.browse_watch_path)
+        self.ok_button.clicked.connect(self.accept)
+        self.cancel_button.clicked.connect(self.reject)
+
+        self.on_schedule_type_changed(self.schedule_type_combo.currentText())
+        self.on_task_type_changed(self.type_combo.currentText())
+        self.on_isolated_changed(False)
+
+    def on_schedule_type_changed(self, schedule_type):
+        self.interval_spin.setVisible(False)
+        self.interval_unit_combo.setVisible(False)
+        self.daily_time_edit.setVisible(False)
+        self.weekly_combo.setVisible(False)
+        self.monthly_day_spin.setVisible(False)
+        self.jitter_spin.setVisible(schedule_type not in ("依赖触发", "文件变化", "进程结束"))
+        self.watch_path_widget.setVisible(schedule_type == "文件变化")
+        self.watch_pattern_edit.setVisible(schedule_type == "文件变化")
+        self.watch_process_edit.setVisible(schedule_type == "进程结束")
+        self.debounce_spin.setVisible(schedule_type in ("文件变化", "进程结束"))
+
+        if schedule_type == "固定间隔":
+            self.interval_spin.setVisible(True)
+            self.interval_unit_combo.setVisible(True)
+        elif schedule_type == "每日":
+            self.daily_time_edit.setVisible(True)
+        elif schedule_type == "每周":
+            self.daily_time_edit.setVisible(True)
+            self.weekly_combo.setVisible(True)
+        elif schedule_type == "每月":  # 新增每月执行配置
+            self.daily_time_edit.setVisible(True)
+            self.monthly_day_spin.setVisible(True)
+
+    def on_task_type_changed(self, task_type):
+        is_notification_task = task_type == TaskType.NOTIFICATION.value
+        self.cmd_text.setVisible(task_type == TaskType.CMD.value)
+        self.notification_title_edit.setVisible(is_notification_task)
+        self.notification_content_edit.setVisible(is_notification_task)
+        self.popup_type_combo.setVisible(is_notification_task)
+        self.notification_timeout_spin.setVisible(is_notification_task)
+        self.tab_widget.setTabEnabled(self.environment_tab_index, task_type == TaskType.CMD.value)
+
+    def on_isolated_changed(self, isolated: bool):
+        for widget in (self.cpu_limit_spin, self.memory_limit_spin, self.open_files_spin,
+                       self.nice_spin, self.io_priority_combo):
+            widget.setEnabled(isolated)
+
+    def browse_working_dir(self):
+        path = QFileDialog.getExistingDirectory(self, "选择工作目录", self.working_dir_edit.text())
+        if path:
+            self.working_dir_edit.setText(path)
+
+    def browse_watch_path(self):
+        path = QFileDialog.getExistingDirectory(self, "选择监视的目录", self.watch_path_edit.text())
+        if path:
+            self.watch_path_edit.setText(path)
+
+    def get_env(self) -> Optional[Dict[str, str]]:
+        # 解析“名称=值”格式的环境变量，格式错误时返回 None
+        env = {}
+        for line in self.env_edit.toPlainText().splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            name, sep, value = line.partition("=")
+            if not sep or not name.strip():
+                return None
+            env[name.strip()] = value
+        return env
+
+    def load_task_data(self):
+        self.name_edit.setText(self.task.name)
+        self.description_edit.setPlainText(self.task.description)
+        self.type_combo.setCurrentText(self.task.task_type.value)
+        self.enable_check.setChecked(self.task.status == TaskStatus.ENABLED)
+        self.retry_spin.setValue(self.task.retry_count)
+        self.logging_check.setChecked(self.task.enable_logging)
+        self.overlap_combo.setCurrentText(self.task.overlap_policy.value)
+        self.max_overlap_spin.setValue(self.task.max_overlap)
+        self.recovery_combo.setCurrentText(self.task.recovery_policy.value)
+        self.catch_up_combo.setCurrentText(self.task.catch_up_policy.value)
+        self.tags_edit.setText(", ".join(self.task.tags))
+        self.group_combo.setCurrentText(self.task.group)
+        self.pool_combo.setCurrentIndex(max(0, self.pool_combo.findData(self.task.resource_pool)))
+        self.jitter_spin.setValue(-1 if self.task.jitter_seconds is None else self.task.jitter_seconds)
+        self.working_dir_edit.setText(self.task.working_dir)
+        self.env_edit.setPlainText("\n".join(f"{name}={value}" for name, value in self.task.env.items()))
+        self.isolated_check.setChecked(self.task.isolated)
+        self.cpu_limit_spin.setValue(self.task.cpu_limit_seconds)
+        self.memory_limit_spin.setValue(self.task.memory_limit_mb)
+        self.open_files_spin.setValue(self.task.open_files_limit)
+        self.nice_spin.setValue(self.task.nice)
+        self.io_priority_combo.setCurrentIndex(max(0, self.io_priority_combo.findData(self.task.io_priority)))
+        self.output_runs_spin.setValue(self.task.output_max_runs)
+        self.output_kb_spin.setValue(self.task.output_max_kb)
+        self.watch_path_edit.setText(self.task.watch_path)
+        self.watch_pattern_edit.setText(self.task.watch_pattern)
+        self.watch_process_edit.setText(self.task.watch_process)
+        self.debounce_spin.setValue(self.task.trigger_debounce_ms)
+
+        if self.task.schedule_type == "interval":
+            self.schedule_type_combo.setCurrentText("固定间隔")
+            self.interval_spin.setValue(self.task.interval_seconds)
+        elif self.task.schedule_type == "daily":
+            self.schedule_type_combo.setCurrentText("每日")
+            self.daily_time_edit.setTime(self.task.daily_time)
+        elif self.task.schedule_type == "weekly":
+            self.schedule_type_combo.setCurrentText("每周")
+            self.daily_time_edit.setTime(self.task.daily_time)
+            self.weekly_combo.setCurrentIndex(self.task.weekly_day)
+        elif self.task.schedule_type == "monthly":
+            self.schedule_type_combo.setCurrentText("每月")
+            self.daily_time_edit.setTime(self.task.daily_time)
+            self.monthly_day_spin.setValue(self.task.monthly_day)
+        elif self.task.schedule_type == "dependency":
+            self.schedule_type_combo.setCurrentText("依赖触发")
+        elif self.task.schedule_type == "file_change":
+            self.schedule_type_combo.setCurrentText("文件变化")
+        elif self.task.schedule_type == "process_exit":
+            self.schedule_type_combo.setCurrentText("进程结束")
+
+        depends_on = set(self.task.depends_on)
+        for row in range(self.depends_list.count()):
+            item = self.depends_list.item(row)
+            if item.data(Qt.ItemDataRole.UserRole) in depends_on:
+                item.setCheckState(Qt.CheckState.Checked)
+
+        self.cmd_text.setPlainText(self.task.cmd_command)
+        self.notification_title_edit.setText(self.task.notification_title)
+        self.notification_content_edit.setPlainText(self.task.notification_content)
+        self.notification_timeout_spin.setValue(self.task.notification_timeout)  # 加载弹窗显示时间
+        self.popup_type_combo.setCurrentText(self.task.popup_type)  # 加载弹窗类型
+
+    def get_task_data(self):
+        self.task.name = self.name_edit.text()
+        self.task.description = self.description_edit.toPlainText()
+        self.task.task_type = TaskType(self.type_combo.currentText())
+        self.task.status = TaskStatus.ENABLED if self.enable_check.isChecked() else TaskStatus.DISABLED
+        self.task.retry_count = self.retry_spin.value()
+        self.task.enable_logging = self.logging_check.isChecked()
+        self.task.overlap_policy = OverlapPolicy(self.overlap_combo.currentText())
+        self.task.max_overlap = self.max_overlap_spin.value()
+        self.task.recovery_policy = RecoveryPolicy(self.recovery_combo.currentText())
+        self.task.catch_up_policy = CatchUpPolicy(self.catch_up_combo.currentText())
+        tags = self.tags_edit.text().replace("，", ",").split(",")
+        self.task.tags = list(dict.fromkeys(tag.strip() for tag in tags if tag.strip()))
+        self.task.group = self.group_combo.currentText().strip()
+        self.task.resource_pool = self.pool_combo.currentData() or ""
+        self.task.jitter_seconds = None if self.jitter_spin.value() < 0 else self.jitter_spin.value()
+        self.task.working_dir = self.working_dir_edit.text().strip()
+        self.task.env = self.get_env() or {}
+        self.task.isolated = self.isolated_check.isChecked()
+        self.task.cpu_limit_seconds = self.cpu_limit_spin.value()
+        self.task.memory_limit_mb = self.memory_limit_spin.value()
+        self.task.open_files_limit = self.open_files_spin.value()
+        self.task.nice = self.nice_spin.value()
+        self.task.io_priority = self.io_priority_combo.currentData() or ""
+        self.task.output_max_runs = self.output_runs_spin.value()
+        self.task.output_max_kb = self.output_kb_spin.value()
+        self.task.watch_path = self.watch_path_edit.text().strip()
+        self.task.watch_pattern = self.watch_pattern_edit.text().strip()
+        self.task.watch_process = self.watch_process_edit.text().strip()
+        self.task.trigger_debounce_ms = self.debounce_spin.value()
+
+        schedule_type = self.schedule_type_combo.currentText()
+        if schedule_type == "固定间隔":
+            self.task.schedule_type = "interval"
+            interval = self.interval_spin.value()
+            unit = self.interval_unit_combo.currentText()
+            if unit == "秒":
+                self.task.interval_seconds = interval
+            elif unit == "分钟":
+                self.task.interval_seconds = interval * 60
+            else:
+                self.task.interval_seconds = interval * 3600
+        elif schedule_type == "每日":
+            self.task.schedule_type = "daily"
+            self.task.daily_time = self.daily_time_edit.time()
+        elif schedule_type == "每周":
+            self.task.schedule_type = "weekly"
+            self.task.daily_time = self.daily_time_edit.time()
+            self.task.weekly_day = self.weekly_combo.currentIndex()
+        elif schedule_type == "每月":  # 新增每月执行配置
+            self.task.schedule_type = "monthly"
+            self.task.daily_time = self.daily_time_edit.time()
+            self.task.monthly_day = self.monthly_day_spin.value()
+        elif schedule_type == "依赖触发":
+            self.task.schedule_type = "dependency"
+        elif schedule_type == "文件变化":
+            self.task.schedule_type = "file_change"
+        elif schedule_type == "进程结束":
+            self.task.schedule_type = "process_exit"
+        self.task.depends_on = self.get_checked_dependencies()
+
+        self.task.cmd_command = self.cmd_text.toPlainText()
+        self.task.notification_title = self.notification_title_edit.text()
+        self.task.notification_content = self.notification_content_edit.toPlainText()
+        self.task.notification_timeout = self.notification_timeout_spin.value()  # 保存弹窗显示时间
+        self.task.popup_type = self.popup_type_combo.currentText()  # 保存弹窗类型
+
+        return self.task
+
+    def get_checked_dependencies(self) -> List[str]:
+        depends_on = []
+        for row in range(self.depends_list.count()):
+            item = self.depends_list.item(row)
+            if item.checkState() == Qt.CheckState.Checked:
+                depends_on.append(item.data(Qt.ItemDataRole.UserRole))
+        return depends_on
+
+    def accept(self):
+        depends_on = self.get_checked_dependencies()
+        if self.schedule_type_combo.currentText() == "依赖触发" and not depends_on:
+            QMessageBox.warning(self, "缺少上游任务", "依赖触发的任务至少需要选择一个上游任务")
+            return
+        if self.schedule_type_combo.currentText() == "文件变化" and not self.watch_path_edit.text().strip():
+            QMessageBox.warning(self, "缺少监视路径", "文件变化触发的任务需要填写要监视的文件或目录")
+            return
+        if self.schedule_type_combo.currentText() == "进程结束" and not self.watch_process_edit.text().strip():
+            QMessageBox.warning(self, "缺少监视进程", "进程结束触发的任务需要填写进程名或 PID")
+            return
+        if self.get_env() is None:
+            QMessageBox.warning(self, "环境变量格式错误", "环境变量每行一个，格式为 名称=值")
+            return
+
+        # 用编辑后的依赖替换本任务原有的依赖，检查是否形成循环
+        dependencies = {other.id: other.depends_on for other in self.all_tasks}
+        dependencies[self.task.id] = depends_on
+        cycle = TaskGraph.find_cycle(dependencies)
+        if cycle:
+            names = {other.id: other.name for other in self.all_tasks}
+            names[self.task.id] = self.name_edit.text() or self.task.name
+            QMessageBox.warning(self, "依赖循环", "任务依赖存在循环：\n" +
+                                " → ".join(names.get(task_id, task_id) for task_id in cycle))
+            return
+        super().accept()
+
+
+class ResourcePoolDialog(QDialog):
+    # 资源池设置：前四列可编辑，后面几列显示当前占用和等待时间，每秒刷新
+    COLUMNS = ["名称", "最大并发", "每分钟启动次数", "突发容量", "运行中", "等待中", "平均等待", "最长等待"]
+    EDITABLE_COLUMNS = 4
+
+    def __init__(self, pools: List[ResourcePool], parent=None):
+        super().__init__(parent)
+        self.pools = pools
+        self.setup_ui()
+        self.load_pools()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(1000)
+        self.refresh_timer.timeout.connect(self.refresh_usage)
+        self.refresh_timer.start()
+
+    def setup_ui(self):
+        self.setWindowTitle("资源池")
+        self.setModal(True)
+        self.resize(760, 360)
+
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel("引用同一资源池的CMD任务共用并发上限；设置每分钟启动次数后按令牌桶限速，0 表示不限速"))
+
+        self.pool_table = QTableWidget(0, len(self.COLUMNS))
+        self.pool_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.pool_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.pool_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        layout.addWidget(self.pool_table)
+
+        button_layout = QHBoxLayout()
+        self.add_button = QPushButton("添加")
+        self.remove_button = QPushButton("删除")
+        self.ok_button = QPushButton("确定")
+        self.ok_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOkButton))
+        self.cancel_button = QPushButton("取消")
+        self.cancel_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton))
+        button_layout.addWidget(self.add_button)
+        button_layout.addWidget(self.remove_button)
+        button_layout.addStretch()
+        button_layout.addWidget(self.ok_button)
+        button_layout.addWidget(self.cancel_button)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+
+        self.add_button.clicked.connect(lambda: self.add_row(ResourcePool(f"pool{self.pool_table.rowCount() + 1}")))
+        self.remove_button.clicked.connect(self.remove_rows)
+        self.ok_button.clicked.connect(self.accept)
+        self.cancel_button.clicked.connect(self.reject)
+
+    def load_pools(self):
+        for pool in self.pools:
+            self.add_row(pool)
+        self.refresh_usage()
+
+    def add_row(self, pool: ResourcePool):
+        row = self.pool_table.rowCount()
+        self.pool_table.insertRow(row)
+        values = [pool.name, str(pool.max_concurrency), f"{pool.rate_per_minute:g}", str(pool.burst)]
+        for column, value in enumerate(values):
+            self.pool_table.setItem(row, column, QTableWidgetItem(value))
+        for column in range(self.EDITABLE_COLUMNS, len(self.COLUMNS)):
+            item = QTableWidgetItem("")
+            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            self.pool_table.setItem(row, column, item)
+
+    def remove_rows(self):
+        rows = sorted({index.row() for index in self.pool_table.selectedIndexes()}, reverse=True)
+        for row in rows:
+            self.pool_table.removeRow(row)
+
+    def refresh_usage(self):
+        # 统计来自执行器中正在使用的资源池对象，新添加的行还没有统计
+        pools = {pool.name: pool for pool in self.pools}
+        for row in range(self.pool_table.rowCount()):
+            pool = pools.get(self.pool_table.item(row, 0).text().strip())
+            if pool is None:
+                values = ["-", "-", "-", "-"]
+            else:
+                values = [f"{pool.running}/{pool.max_concurrency}", str(len(pool.waiting)),
+                          f"{pool.average_wait:.1f}秒", f"{pool.max_wait:.1f}秒"]
+            for offset, value in enumerate(values):
+                self.pool_table.item(row, self.EDITABLE_COLUMNS + offset).setText(value)
+
+    def get_pools(self) -> List[ResourcePool]:
+        pools = []
+        for row in range(self.pool_table.rowCount()):
+            name = self.pool_table.item(row, 0).text().strip()
+            pools.append(ResourcePool(name,
+                                      int(self.pool_table.item(row, 1).text()),
+                                      float(self.pool_table.item(row, 2).text()),
+                                      int(self.pool_table.item(row, 3).text())))
+        return pools
+
+    def accept(self):
+        try:
+            pools = self.get_pools()
+        except ValueError:
+            QMessageBox.warning(self, "资源池设置错误", "最大并发和突发容量必须是整数，每分钟启动次数必须是数字")
+            return
+        names = [pool.name for pool in pools]
+        if "" in names or len(set(names)) != len(names):
+            QMessageBox.warning(self, "资源池设置错误", "资源池名称不能为空，也不能重复")
+            return
+        if any(pool.max_concurrency < 1 or pool.burst < 1 or pool.rate_per_minute < 0 for pool in pools):
+            QMessageBox.warning(self, "资源池设置错误", "最大并发和突发容量至少为 1，每分钟启动次数不能为负数")
+            return
+        super().accept()
+
+
+class JitterSettingsDialog(QDialog):
+    # 全局错峰设置：同一时刻触发的任务按任务ID分散到偏移窗口内，固定间隔任务错开相位
+    def __init__(self, settings: JitterSettings, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("错峰设置")
+        self.setModal(True)
+
+        layout = QFormLayout()
+        layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        layout.setHorizontalSpacing(15)
+        layout.setVerticalSpacing(10)
+
+        self.window_spin = QSpinBox()
+        self.window_spin.setMinimumHeight(25)
+        self.window_spin.setRange(0, 24 * 3600)
+        self.window_spin.setSpecialValueText("不偏移")
+        self.window_spin.setSuffix(" 秒")
+        self.window_spin.setValue(settings.window_seconds)
+
+        self.spread_check = QCheckBox("固定间隔任务按任务ID错开首次执行的相位")
+        self.spread_check.setChecked(settings.spread_intervals)
+
+        self.salt_edit = QLineEdit(settings.salt)
+        self.salt_edit.setMinimumHeight(25)
+        self.salt_edit.setPlaceholderText("修改后所有任务的偏移重新分布")
+
+        layout.addRow("默认错峰窗口:", self.window_spin)
+        layout.addRow(self.spread_check)
+        layout.addRow("偏移种子:", self.salt_edit)
+        layout.addRow(QLabel("偏移由任务ID计算，同一任务每次启动的执行时刻保持一致"))
+
+        button_layout = QHBoxLayout()
+        ok_button = QPushButton("确定")
+        ok_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOkButton))
+        cancel_button = QPushButton("取消")
+        cancel_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton))
+        button_layout.addStretch()
+        button_layout.addWidget(ok_button)
+        button_layout.addWidget(cancel_button)
+        layout.addRow(button_layout)
+        self.setLayout(layout)
+
+        ok_button.clicked.connect(self.accept)
+        cancel_button.clicked.connect(self.reject)
+
+    def get_settings(self) -> JitterSettings:
+        return JitterSettings(self.window_spin.value(), self.spread_check.isChecked(), self.salt_edit.text())
+
+
+class BulkRetimeDialog(QDialog):
+    # 批量调整执行时间：每日/每周/每月任务整体平移执行时刻，固定间隔任务改为新的间隔
+    def __init__(self, task_count: int, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("调整执行时间")
+        self.setModal(True)
+
+        layout = QFormLayout()
+        layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        layout.setHorizontalSpacing(15)
+        layout.setVerticalSpacing(10)
+
+        self.shift_spin = QSpinBox()
+        self.shift_spin.setMinimumHeight(25)
+        self.shift_spin.setRange(-24 * 60, 24 * 60)
+        self.shift_spin.setSpecialValueText("不调整")
+        self.shift_spin.setSuffix(" 分钟")
+        self.shift_spin.setValue(0)
+
+        self.interval_spin = QSpinBox()
+        self.interval_spin.setMinimumHeight(25)
+        self.interval_spin.setRange(0, 7 * 24 * 3600)
+        self.interval_spin.setSpecialValueText("不修改")
+        self.interval_spin.setSuffix(" 秒")
+
+        layout.addRow(QLabel(f"将调整选中的 {task_count} 个任务"))
+        layout.addRow("执行时刻平移:", self.shift_spin)
+        layout.addRow("固定间隔改为:", self.interval_spin)
+        layout.addRow(QLabel("平移跨过零点时，每周/每月任务的执行日期相应顺延"))
+
+        button_layout = QHBoxLayout()
+        ok_button = QPushButton("确定")
+        ok_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOkButton))
+        cancel_button = QPushButton("取消")
+        cancel_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton))
+        button_layout.addStretch()
+        button_layout.addWidget(ok_button)
+        button_layout.addWidget(cancel_button)
+        layout.addRow(button_layout)
+        self.setLayout(layout)
+
+        ok_button.clicked.connect(self.accept)
+        cancel_button.clicked.connect(self.reject)
+
+    def get_values(self):
+        # (平移分钟数, 新的间隔秒数)，0 表示不调整
+        return self.shift_spin.value(), self.interval_spin.value()
+
+
+class OutputViewerDialog(QDialog):
+    # 查看任务历次执行的输出：列表只读取索引，选中某次执行时才解压对应的输出
+    def __init__(self, store, task: Task, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.task = task
+        self.runs = list(reversed(store.list_runs(task.id)))  # 最新的执行在前
+        self.setup_ui()
+
+    def setup_ui(self):
+        self.setWindowTitle(f"执行输出 - {self.task.name}")
+        self.resize(900, 560)
+
+        layout = QVBoxLayout()
+        usage_kb = self.store.task_usage(self.task.id) / 1024
+        layout.addWidget(QLabel(f"共 {len(self.runs)} 次执行，输出压缩后占用 {usage_kb:.1f} KB"))
+
+        self.run_list = QListWidget()
+        for record in self.runs:
+            finished_at = (record.get("finished_at") or "")[:19].replace("T", " ")
+            sizes = [ref["size"] for ref in (record.get("stdout"), record.get("stderr")) if ref]
+            item = QListWidgetItem(f"{finished_at}  退出码 {record.get('returncode')}  {sum(sizes)} 字节")
+            self.run_list.addItem(item)
+
+        output_tabs = QTabWidget()
+        self.stdout_view = QPlainTextEdit()
+        self.stdout_view.setReadOnly(True)
+        self.stderr_view = QPlainTextEdit()
+        self.stderr_view.setReadOnly(True)
+        output_tabs.addTab(self.stdout_view, "标准输出")
+        output_tabs.addTab(self.stderr_view, "错误输出")
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        splitter.addWidget(self.run_list)
+        splitter.addWidget(output_tabs)
+        splitter.setSizes([300, 600])
+        layout.addWidget(splitter)
+
+        close_button = QPushButton("关闭")
+        close_button.clicked.connect(self.accept)
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+        self.run_list.currentRowChanged.connect(self.show_run)
+        if self.runs:
+            self.run_list.setCurrentRow(0)
+
+    def show_run(self, row: int):
+        if row < 0 or row >= len(self.runs):
+            return
+        record = self.runs[row]
+        self.stdout_view.setPlainText(self.store.read(self.task.id, record.get("stdout")))
+        self.stderr_view.setPlainText(self.store.read(self.task.id, record.get("stderr")))
+
+
+class ForecastChart(QWidget):
+    # 负载预测柱状图：柱高为每段时间的计划触发次数，折线为预计同时执行的CMD数量
+    MAX_BARS = 240
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.forecast: Optional[Forecast] = None
+        self.bucket_minutes = 1
+        self.runs: List[int] = []
+        self.busy: List[float] = []
+        self.setMinimumHeight(220)
+
+    def set_forecast(self, forecast: Forecast):
+        self.forecast = forecast
+        self.bucket_minutes = max(1, math.ceil(forecast.minutes / self.MAX_BARS))
+        self.runs, self.busy = forecast.buckets(self.bucket_minutes)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.palette().base())
+        if not self.runs:
+            return
+        margin = 24
+        width = self.width() - 2 * margin
+        height = self.height() - 2 * margin
+        bar_width = width / len(self.runs)
+        max_runs = max(self.runs) or 1
+        max_busy = max(self.busy) or 1
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(80, 140, 220))
+        for i, count in enumerate(self.runs):
+            bar_height = height * count / max_runs
+            painter.drawRect(QRectF(margin + i * bar_width, margin + height - bar_height,
+                                    max(1.0, bar_width - 1), bar_height))
+
+        painter.setPen(QPen(QColor(220, 90, 60), 2))
+        previous = None
+        for i, busy in enumerate(self.busy):
+            point = (margin + (i + 0.5) * bar_width, margin + height - height * busy / max_busy)
+            if previous:
+                painter.drawLine(int(previous[0]), int(previous[1]), int(point[0]), int(point[1]))
+            previous = point
+
+        painter.setPen(self.palette().text().color())
+        painter.drawText(margin, margin - 6, f"每 {self.bucket_minutes} 分钟触发次数（最高 {max_runs}）")
+        painter.drawText(margin, self.height() - 6,
+                         f"{self.forecast.start:%m-%d %H:%M}  —  红线: 平均同时执行的CMD（最高 {max_busy:.2f}）")
+
+
+class ForecastDialog(QDialog):
+    # 负载预测：按调度规则推算未来一段时间内的触发次数和CMD占用，并列出最近的计划执行
+    HORIZONS = [("1 小时", 1), ("6 小时", 6), ("24 小时", 24), ("7 天", 7 * 24)]
+    TIMELINE_LIMIT = 500
+
+    def __init__(self, scheduler, durations: Dict[str, float], parent=None):
+        super().__init__(parent)
+        self.scheduler = scheduler
+        self.durations = durations
+        self.setup_ui()
+        self.refresh()
+
+    def setup_ui(self):
+        self.setWindowTitle("负载预测")
+        self.resize(900, 640)
+
+        layout = QVBoxLayout()
+        top_layout = QHBoxLayout()
+        top_layout.addWidget(QLabel("预测范围:"))
+        self.horizon_combo = QComboBox()
+        for label, hours in self.HORIZONS:
+            self.horizon_combo.addItem(label, hours)
+        self.horizon_combo.setCurrentIndex(2)
+        top_layout.addWidget(self.horizon_combo)
+        top_layout.addStretch()
+        layout.addLayout(top_layout)
+
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+        self.chart = ForecastChart()
+        layout.addWidget(self.chart)
+
+        self.timeline_table = QTableWidget(0, 4)
+        self.timeline_table.setHorizontalHeaderLabels(["计划时间", "任务名称", "任务类型", "预计耗时"])
+        self.timeline_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.timeline_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.timeline_table.verticalHeader().setVisible(False)
+        layout.addWidget(self.timeline_table)
+
+        close_button = QPushButton("关闭")
+        close_button.clicked.connect(self.accept)
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+        self.horizon_combo.currentIndexChanged.connect(self.refresh)
+
+    def refresh(self):
+        hours = self.horizon_combo.currentData()
+        forecast = self.scheduler.forecast(hours, self.durations)
+        self.chart.set_forecast(forecast)
+
+        peak_time, peak_runs = forecast.peak_runs()
+        busy_time, peak_busy = forecast.peak_busy()
+        summary = f"{forecast.task_count} 个任务计划触发 {forecast.total_runs} 次"
+        if peak_runs:
+            summary += f"，触发最多的一分钟: {peak_time:%m-%d %H:%M}（{peak_runs} 次）"
+        if peak_busy:
+            summary += f"，CMD占用最高: {busy_time:%m-%d %H:%M}（平均 {peak_busy:.2f} 个同时执行）"
+        if forecast.skipped_count:
+            summary += f"，{forecast.skipped_count} 个依赖触发或事件触发的任务未计入"
+        self.summary_label.setText(summary)
+
+        runs = self.scheduler.upcoming_runs(hours, self.TIMELINE_LIMIT)
+        self.timeline_table.setRowCount(len(runs))
+        for row, (fire, task) in enumerate(runs):
+            duration = ""
+            if task.task_type == TaskType.CMD:
+                duration = f"{self.durations.get(task.id, DEFAULT_CMD_DURATION):.1f} 秒"
+            for column, text in enumerate([fire.strftime("%Y-%m-%d %H:%M:%S"), task.name,
+                                           task.task_type.value, duration]):
+                self.timeline_table.setItem(row, column, QTableWidgetItem(text))
+
+
+class DiagnosticsDialog(QDialog):
+    # 诊断面板：各热点路径的耗时统计、最近的慢调用，以及事件循环看门狗记录的界面卡顿和调用栈
+    def __init__(self, recorder, watchdog, parent=None):
+        super().__init__(parent)
+        self.recorder = recorder
+        self.watchdog = watchdog
+        self.stalls = []
+        self.setup_ui()
+        self.refresh()
+
+    def setup_ui(self):
+        self.setWindowTitle("诊断信息")
+        self.resize(900, 640)
+
+        layout = QVBoxLayout()
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        self.stats_table = QTableWidget(0, 6)
+        self.stats_table.setHorizontalHeaderLabels(["路径", "调用次数", "平均(ms)", "最大(ms)", "最近(ms)", "慢调用"])
+        self.stats_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.stats_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.stats_table.verticalHeader().setVisible(False)
+
+        self.slow_list = QListWidget()
+        self.stall_list = QListWidget()
+        self.stack_view = QPlainTextEdit()
+        self.stack_view.setReadOnly(True)
+        stall_splitter = QSplitter(Qt.Orientation.Horizontal)
+        stall_splitter.addWidget(self.stall_list)
+        stall_splitter.addWidget(self.stack_view)
+        stall_splitter.setSizes([300, 600])
+
+        tabs = QTabWidget()
+        tabs.addTab(self.stats_table, "耗时统计")
+        tabs.addTab(self.slow_list, "慢调用")
+        tabs.addTab(stall_splitter, "界面卡顿")
+        layout.addWidget(tabs)
+
+        refresh_button = QPushButton("刷新")
+        refresh_button.clicked.connect(self.refresh)
+        reset_button = QPushButton("清空统计")
+        reset_button.clicked.connect(self.reset)
+        close_button = QPushButton("关闭")
+        close_button.clicked.connect(self.accept)
+        button_layout = QHBoxLayout()
+        button_layout.addWidget(refresh_button)
+        button_layout.addWidget(reset_button)
+        button_layout.addStretch()
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+        self.stall_list.currentRowChanged.connect(self.show_stall)
+
+    def refresh(self):
+        stats = self.recorder.snapshot()
+        self.stats_table.setRowCount(len(stats))
+        for row, stat in enumerate(stats):
+            values = [stat["name"], str(stat["count"]), f"{stat['avg_ms']:.2f}", f"{stat['max_ms']:.1f}",
+                      f"{stat['last_ms']:.1f}", str(stat["slow_count"])]
+            for column, text in enumerate(values):
+                self.stats_table.setItem(row, column, QTableWidgetItem(text))
+
+        slow_calls = list(reversed(self.recorder.recent_slow_calls()))
+        self.slow_list.clear()
+        for call in slow_calls:
+            self.slow_list.addItem(f"{call['at'].replace('T', ' ')}  {call['name']}  {call['elapsed_ms']} ms  ({call['thread']})")
+
+        self.stalls = list(reversed(self.watchdog.recent_stalls()))
+        self.stall_list.clear()
+        for stall in self.stalls:
+            self.stall_list.addItem(f"{stall['detected_at'].replace('T', ' ')}  阻塞 {stall['duration_ms']} ms")
+        self.stack_view.clear()
+        if self.stalls:
+            self.stall_list.setCurrentRow(0)
+
+        self.summary_label.setText(f"慢调用阈值 {self.recorder.slow_ms:.0f} ms，界面卡顿阈值 "
+                                   f"{self.watchdog.threshold * 1000:.0f} ms；共记录 {len(slow_calls)} 次慢调用、"
+                                   f"{len(self.stalls)} 次界面卡顿（调用栈同时写入 {self.watchdog.log_path}）")
+
+    def reset(self):
+        self.recorder.reset()
+        self.refresh()
+
+    def show_stall(self, row: int):
+        if 0 <= row < len(self.stalls):
+            self.stack_view.setPlainText(self.stalls[row]["stack"])
@@ -0,0 +1,1150 @@
+import os
+import json
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+import time as time_module
+
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                             QPushButton, QLabel, QLineEdit, QComboBox, QSpinBox, QCheckBox,
+                             QSystemTrayIcon, QMenu, QDialog, QMessageBox, QHeaderView, QStyle,
+                             QAbstractItemView, QTreeView, QInputDialog)
+from PyQt6.QtCore import Qt, QTimer, QPoint
+from PyQt6.QtGui import QAction
+
+from ..core.task import Task, TaskType, PopupType, TaskStatus, RecoveryPolicy
+from ..core.graph import TaskGraph
+from ..core.executor import TaskRun, TaskExecutor
+from ..core.isolation import FailureKind
+from ..core.pools import ResourcePool
+from ..core.jitter import JitterSettings
+from ..core.scheduler import TaskScheduler
+from ..core.triggers import EventTriggerManager
+from ..core.metrics import get_peak_memory_kb, perf, timed, ProfileSession
+from ..storage.task_store import TaskStore
+from ..storage.settings_store import SettingsStore
+from ..storage.history_store import HistoryStore
+from ..storage.output_store import OutputStore
+from ..storage.run_journal import RunJournal
+from ..storage.file_watcher import TaskFileWatcher
+from .models import TaskTableModel, TaskFilterProxyModel, TaskGroupModel
+from .watchdog import EventLoopWatchdog
+
+
+class TaskManager(QMainWindow):
+    SAVE_DELAY_MS = 2000  # 任务触发后更新执行记录的写入延迟，期间的多次触发合并为一次写入
+
+    def __init__(self, start_minimized: bool = False):
+        super().__init__()
+        self.startup_started = time_module.perf_counter()
+        self.startup_metrics: Dict[str, Any] = {}
+        self.is_minimized_to_tray = False
+        # 托盘启动模式：任务在调度线程中加载，主界面在第一次显示时才构建
+        self.start_minimized = start_minimized
+        self.ui_built = False
+
+        self.store = TaskStore("tasks.json")
+        self.settings_store = SettingsStore("settings.json")
+        self.settings = self.settings_store.load()
+        self.history_store = HistoryStore("history.jsonl")
+        self.journal = RunJournal("runs.wal")
+        self.journal_recovered = False
+        # 任务文件被外部修改（如配置管理工具重新生成）时增量更新，不需要重启
+        self.task_watcher = TaskFileWatcher(self.store.path, self)
+        self.task_watcher.changed.connect(self.on_task_file_changed)
+        output_settings = self.settings.get("output_store", {})
+        self.output_store = OutputStore("outputs",
+                                        max_runs=output_settings.get("max_runs", 50),
+                                        max_bytes=output_settings.get("max_bytes", 5 * 1024 * 1024),
+                                        compression=output_settings.get("compression", "zlib"))
+
+        # 任务列表由调度器持有，界面线程通过 self.tasks 访问同一个列表
+        self.scheduler = TaskScheduler(self)
+        self.scheduler.jitter = JitterSettings.from_dict(self.settings.get("jitter", {}))
+        pause_settings = self.settings.get("pause", {})
+        self.scheduler.paused = bool(pause_settings.get("paused", False))
+        self.scheduler.paused_tags = set(pause_settings.get("tags", []))
+        self.scheduler.task_due.connect(self.execute_task)
+        self.scheduler.next_runs_changed.connect(self.on_next_runs_changed)
+        self.scheduler.tasks_loaded.connect(self.on_tasks_loaded)
+        self.scheduler.ready.connect(lambda: self.record_startup_metric("scheduler_ready_ms"),
+                                     Qt.ConnectionType.DirectConnection)
+
+        # 文件变化、进程结束等事件触发的任务与定时任务走同一条执行路径
+        self.triggers = EventTriggerManager(self, self.scheduler.clock)
+        self.triggers.triggered.connect(self.dispatch_task)
+
+        # 实时倒计时：每秒只刷新可见行的“下次执行”单元格
+        self.countdown_timer = QTimer()
+        self.countdown_timer.setInterval(1000)
+        self.countdown_timer.timeout.connect(self.refresh_next_run_times)
+
+        # 执行记录（上次执行时间、执行次数）变化时只标记待写入，由单次定时器合并写入任务文件
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(self.SAVE_DELAY_MS)
+        self.save_timer.timeout.connect(self.save_tasks)
+
+        # 诊断：界面线程卡顿时记录调用栈，托盘菜单可按需开启 cProfile 采样
+        diagnostics = self.settings.get("diagnostics", {})
+        perf.slow_ms = diagnostics.get("slow_ms", 50)
+        self.watchdog = EventLoopWatchdog(diagnostics.get("watchdog_ms", 500), "diagnostics.log", self)
+        self.profile_session = ProfileSession("profiles")
+        self.watchdog.start()
+
+        self.executor = TaskExecutor(self)
+        self.executor.set_max_workers(self.settings.get("executor", {}).get("max_workers", TaskExecutor.MAX_WORKERS))
+        self.executor.run_finished.connect(self.on_run_finished)
+        self.executor.pools_changed.connect(self.update_pool_status)
+        self.executor.output_store = self.output_store
+        # 读取上次运行中断的执行并在调度器启动前挂上执行日志，托盘模式下调度线程最早触发的执行也会记录；
+        # 中断的执行在任务加载后由 recover_interrupted_runs 写入执行历史，之后才从日志中确认删除
+        try:
+            self.interrupted_runs = self.journal.recover()
+        except Exception:
+            self.interrupted_runs = []
+        self.executor.journal = self.journal
+        self.task_graph = TaskGraph()
+
+        # 任务模型不依赖界面控件，先于表格创建，托盘模式下也能接收调度器的更新
+        self.task_model = TaskTableModel(self)
+        self.task_proxy = TaskFilterProxyModel(self)
+        self.task_proxy.setSourceModel(self.task_model)
+        self.group_model = TaskGroupModel(self.task_model, self.task_proxy, self)
+        self.status_label = QLabel("就绪")
+        self.pool_status_label = QLabel("")
+        self.pause_status_label = QLabel("")
+        self.task_model.is_suspended = self.scheduler.is_suspended
+        self.executor.set_resource_pools([ResourcePool.from_dict(data)
+                                          for data in self.settings.get("resource_pools", [])])
+
+        self.setup_tray()
+        if start_minimized:
+            self.scheduler.start(loader=self.store.load)
+        else:
+            self.ensure_ui()
+            self.load_tasks()
+            self.scheduler.start()
+
+    @property
+    def tasks(self) -> List[Task]:
+        return self.scheduler.tasks
+
+    @tasks.setter
+    def tasks(self, tasks: List[Task]):
+        self.scheduler.tasks = tasks
+
+    def ensure_ui(self):
+        if self.ui_built:
+            return
+        self.ui_built = True
+        self.setup_style()
+        self.setup_ui()
+        self.refresh_tasks()
+        self.record_startup_metric("ui_built_ms")
+
+    def setVisible(self, visible: bool):
+        # 第一次显示主窗口时才构建界面
+        if visible:
+            self.ensure_ui()
+        super().setVisible(visible)
+
+    def setup_style(self):
+        self.setStyleSheet("""
+            QMainWindow {
+                background-color: #f0f0f0;
+            }
+            QGroupBox {
+                font-weight: bold;
+                border: 1px solid #cccccc;
+                border-radius: 5px;
+                margin-top: 1ex;
+                padding-top: 10px;
+            }
+            QGroupBox::title {
+                subline-offset: -2px;
+                padding: 0 5px;
+                background-color: #f0f0f0;
+            }
+            QPushButton {
+                background-color: #4CAF50;
+                border: none;
+                color: white;
+                padding: 8px 16px;
+                text-align: center;
+                text-decoration: none;
+                font-size: 14px;
+                border-radius: 4px;
+                min-width: 80px;
+            }
+            QPushButton:hover {
+                background-color: #45a049;
+            }
+            QPushButton:pressed {
+                background-color: #3d8b40;
+            }
+            QPushButton#delete_button {
+                background-color: #f44336;
+            }
+            QPushButton#delete_button:hover {
+                background-color: #d32f2f;
+            }
+            QPushButton#delete_button:pressed {
+                background-color: #b71c1c;
+            }
+            QLineEdit, QTextEdit, QComboBox, QSpinBox, QTimeEdit {
+                padding: 5px;
+                border: 1px solid #cccccc;
+                border-radius: 4px;
+            }
+            QTableView {
+                alternate-background-color: #f9f9f9;
+                background-color: white;
+            }
+            QHeaderView::section {
+                background-color: #e0e0e0;
+                padding: 4px;
+                border: 1px solid #cccccc;
+                font-weight: bold;
+            }
+        """)
+
+    def setup_ui(self):
+        self.setWindowTitle("定时任务管理器")
+        self.setGeometry(100, 100, 1000, 700)
+        self.setWindowIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TitleBarMenuButton))
+        self.setWindowFlags(Qt.WindowType.WindowCloseButtonHint | Qt.WindowType.WindowMinimizeButtonHint)
+
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+
+        # 工具栏
+        toolbar_layout = QHBoxLayout()
+
+        self.new_button = QPushButton("新建任务")
+        self.new_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon))
+
+        self.edit_button = QPushButton("编辑任务")
+        self.edit_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
+
+        self.delete_button = QPushButton("删除任务")
+        self.delete_button.setObjectName("delete_button")
+        self.delete_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon))
+
+        self.refresh_button = QPushButton("刷新")
+        self.refresh_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
+
+        self.enable_button = QPushButton("启用任务")
+        self.enable_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOkButton))
+        self.disable_button = QPushButton("禁用任务")
+        self.disable_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton))
+
+        self.select_all_button = QPushButton("全选")
+        self.select_all_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowRight))
+
+        # 批量操作：作用于选中的任务，分组视图中选中汇总行即选中整个分组
+        self.bulk_button = QPushButton("批量操作")
+        self.bulk_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogListView))
+        bulk_menu = QMenu(self.bulk_button)
+        bulk_menu.addAction("移动到分组...", self.bulk_move_to_group)
+        bulk_menu.addAction("调整执行时间...", self.bulk_retime)
+        self.bulk_button.setMenu(bulk_menu)
+
+        self.pool_button = QPushButton("资源池")
+        self.pool_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DriveNetIcon))
+
+        self.output_button = QPushButton("执行输出")
+        self.output_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogInfoView))
+
+        self.jitter_button = QPushButton("错峰设置")
+        self.jitter_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaSeekForward))
+
+        self.diagnostics_button = QPushButton("诊断")
+        self.diagnostics_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation))
+
+        self.forecast_button = QPushButton("负载预测")
+        self.forecast_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogContentsView))
+
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("搜索任务...")
+        self.search_edit.addAction(
+            self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogContentsView),
+            QLineEdit.ActionPosition.LeadingPosition
+        )
+
+        toolbar_layout.addWidget(self.new_button)
+        toolbar_layout.addWidget(self.edit_button)
+        toolbar_layout.addWidget(self.delete_button)
+        toolbar_layout.addWidget(self.enable_button)
+        toolbar_layout.addWidget(self.disable_button)
+        toolbar_layout.addWidget(self.select_all_button)
+        toolbar_layout.addWidget(self.bulk_button)
+        toolbar_layout.addWidget(self.refresh_button)
+        toolbar_layout.addWidget(self.output_button)
+        toolbar_layout.addWidget(self.pool_button)
+        toolbar_layout.addWidget(self.jitter_button)
+        toolbar_layout.addWidget(self.forecast_button)
+        toolbar_layout.addWidget(self.diagnostics_button)
+        toolbar_layout.addStretch()
+        toolbar_layout.addWidget(QLabel("搜索:"))
+        toolbar_layout.addWidget(self.search_edit)
+
+        layout.addLayout(toolbar_layout)
+
+        # 过滤条件
+        filter_layout = QHBoxLayout()
+
+        self.status_filter_combo = QComboBox()
+        self.status_filter_combo.addItem("全部状态", None)
+        for status in TaskStatus:
+            self.status_filter_combo.addItem(status.value, status)
+
+        self.type_filter_combo = QComboBox()
+        self.type_filter_combo.addItem("全部类型", None)
+        for task_type in TaskType:
+            self.type_filter_combo.addItem(task_type.value, task_type)
+
+        self.schedule_filter_combo = QComboBox()
+        self.schedule_filter_combo.addItem("全部定时", None)
+        for label, schedule_type in [("固定间隔", "interval"), ("每日", "daily"), ("每周", "weekly"), ("每月", "monthly"),
+                                     ("依赖触发", "dependency"), ("文件变化", "file_change"), ("进程结束", "process_exit")]:
+            self.schedule_filter_combo.addItem(label, schedule_type)
+
+        self.due_filter_spin = QSpinBox()
+        self.due_filter_spin.setRange(0, 7 * 24 * 60)
+        self.due_filter_spin.setSpecialValueText("不限")
+        self.due_filter_spin.setSuffix(" 分钟内")
+
+        self.countdown_check = QCheckBox("实时倒计时")
+
+        self.group_view_combo = QComboBox()
+        self.group_view_combo.addItem("不分组", "")
+        self.group_view_combo.addItem("按分组", "group")
+        self.group_view_combo.addItem("按标签", "tag")
+
+        filter_layout.addWidget(QLabel("状态:"))
+        filter_layout.addWidget(self.status_filter_combo)
+        filter_layout.addWidget(QLabel("类型:"))
+        filter_layout.addWidget(self.type_filter_combo)
+        filter_layout.addWidget(QLabel("定时:"))
+        filter_layout.addWidget(self.schedule_filter_combo)
+        filter_layout.addWidget(QLabel("即将执行:"))
+        filter_layout.addWidget(self.due_filter_spin)
+        filter_layout.addWidget(QLabel("显示:"))
+        filter_layout.addWidget(self.group_view_combo)
+        filter_layout.addStretch()
+        filter_layout.addWidget(self.countdown_check)
+
+        layout.addLayout(filter_layout)
+
+        # 任务列表 (7列)：模型只为可见行生成显示内容，过滤由代理模型和搜索索引完成
+        self.task_table = QTableView()
+        self.task_table.setModel(self.task_proxy)
+        self.task_table.setAlternatingRowColors(True)
+        self.task_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # 启用拖拽排序
+        self.task_table.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
+        self.task_table.setDragEnabled(True)
+        self.task_table.setAcceptDrops(True)
+        self.task_table.setDropIndicatorShown(True)
+        # 连接拖拽事件
+        self.task_model.task_moved.connect(self.on_task_order_changed)
+        layout.addWidget(self.task_table)
+
+        # 分组视图：顶层为折叠的汇总行，展开后显示分组内的任务
+        self.group_tree = QTreeView()
+        self.group_tree.setModel(self.group_model)
+        self.group_tree.setAlternatingRowColors(True)
+        self.group_tree.setUniformRowHeights(True)
+        self.group_tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.group_tree.header().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.group_tree.setVisible(False)
+        layout.addWidget(self.group_tree)
+
+        # 搜索输入防抖：停止输入一段时间后才重新过滤
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(200)
+        self.filter_timer.timeout.connect(self.filter_tasks)
+
+        # 状态栏
+        self.statusBar().addWidget(self.status_label)
+        self.statusBar().addPermanentWidget(self.pause_status_label)
+        self.statusBar().addPermanentWidget(self.pool_status_label)
+        self.update_pool_status()
+        self.update_pause_status()
+
+        # 连接信号
+        self.new_button.clicked.connect(self.new_task)
+        self.edit_button.clicked.connect(self.edit_task)
+        self.delete_button.clicked.connect(self.delete_task)
+        self.enable_button.clicked.connect(self.enable_task)
+        self.disable_button.clicked.connect(self.disable_task)
+        self.select_all_button.clicked.connect(self.select_all_tasks)
+        self.refresh_button.clicked.connect(self.refresh_tasks)
+        self.output_button.clicked.connect(self.show_task_output)
+        self.pool_button.clicked.connect(self.edit_resource_pools)
+        self.jitter_button.clicked.connect(self.edit_jitter_settings)
+        self.forecast_button.clicked.connect(self.show_forecast)
+        self.diagnostics_button.clicked.connect(self.show_diagnostics)
+        # 不能直接连接 filter_timer.start：带 int 参数的信号会调用 start(msec)，把参数变成防抖间隔
+        self.search_edit.textChanged.connect(lambda: self.filter_timer.start())
+        self.status_filter_combo.currentIndexChanged.connect(self.filter_tasks)
+        self.type_filter_combo.currentIndexChanged.connect(self.filter_tasks)
+        self.schedule_filter_combo.currentIndexChanged.connect(self.filter_tasks)
+        self.due_filter_spin.valueChanged.connect(lambda: self.filter_timer.start())
+        self.countdown_check.toggled.connect(self.toggle_countdown)
+        self.task_table.doubleClicked.connect(self.edit_task_on_double_click)
+        self.group_tree.doubleClicked.connect(self.edit_task_on_double_click)
+        self.group_view_combo.currentIndexChanged.connect(self.on_group_view_changed)
+
+    def task_from_index(self, index) -> Optional[Task]:
+        if not index.isValid():
+            return None
+        if index.model() is self.group_model:
+            return self.group_model.task_at(index)
+        return self.task_model.task_at(self.task_proxy.mapToSource(index).row())
+
+    def task_view(self):
+        return self.group_tree if self.group_view_combo.currentData() else self.task_table
+
+    def on_group_view_changed(self):
+        group_by = self.group_view_combo.currentData()
+        self.task_table.setVisible(not group_by)
+        self.group_tree.setVisible(bool(group_by))
+        if group_by:
+            self.group_model.group_by = group_by
+            self.group_model.rebuild()
+        else:
+            self.group_model.clear()
+
+    def rebuild_group_view(self):
+        if self.ui_built and self.group_view_combo.currentData():
+            self.group_model.rebuild()
+
+    def edit_task_on_double_click(self, index):
+        if index.row() >= 0:
+            task = self.task_from_index(index)
+            if task:
+                from .dialogs import TaskEditDialog
+                dialog = TaskEditDialog(task, all_tasks=self.tasks, pool_names=self.pool_names())
+                if dialog.exec() == QDialog.DialogCode.Accepted:
+                    dialog.get_task_data()
+                    self.apply_bulk([task], [], "任务更新成功")
+
+    def setup_tray(self):
+        self.tray_icon = QSystemTrayIcon(self)
+        self.tray_icon.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TitleBarMenuButton))
+        self.tray_icon.setToolTip("定时任务管理器")
+
+        tray_menu = QMenu()
+
+        show_action = QAction("显示主窗口", self)
+        show_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TitleBarNormalButton))
+        show_action.triggered.connect(self.show)
+
+        pause_action = QAction("暂停所有任务", self)
+        pause_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPause))
+        pause_action.triggered.connect(self.pause_all_tasks)
+
+        resume_action = QAction("恢复所有任务", self)
+        resume_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+        resume_action.triggered.connect(self.resume_all_tasks)
+
+        diagnostics_action = QAction("诊断信息", self)
+        diagnostics_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation))
+        diagnostics_action.triggered.connect(self.show_diagnostics)
+
+        self.profile_action = QAction("开始性能分析", self)
+        self.profile_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaSeekForward))
+        self.profile_action.triggered.connect(self.toggle_profiling)
+
+        quit_action = QAction("退出", self)
+        quit_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCloseButton))
+        quit_action.triggered.connect(self.quit_application)
+
+        tray_menu.addAction(show_action)
+        tray_menu.addAction(pause_action)
+        tray_menu.addAction(resume_action)
+        # 按标签暂停：每次打开菜单时按当前任务的标签重建
+        self.tag_pause_menu = tray_menu.addMenu("按标签暂停")
+        self.tag_pause_menu.aboutToShow.connect(self.build_tag_pause_menu)
+        tray_menu.addSeparator()
+        tray_menu.addAction(diagnostics_action)
+        tray_menu.addAction(self.profile_action)
+        tray_menu.addSeparator()
+        tray_menu.addAction(quit_action)
+
+        self.tray_icon.setContextMenu(tray_menu)
+        self.tray_icon.activated.connect(self.tray_icon_activated)
+        self.tray_icon.show()
+
+    def tray_icon_activated(self, reason):
+        if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
+            if self.isVisible():
+                self.hide()
+            else:
+                self.show()
+                self.activateWindow()
+
+    def new_task(self):
+        from .dialogs import TaskEditDialog
+        dialog = TaskEditDialog(all_tasks=self.tasks, pool_names=self.pool_names())
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            task = dialog.get_task_data()
+            self.tasks.append(task)
+            self.apply_bulk([], [], "任务创建成功", added=[task])
+
+    def edit_task(self):
+        current_index = self.task_view().currentIndex()
+        if current_index.isValid():
+            task = self.task_from_index(current_index)
+            if task:
+                from .dialogs import TaskEditDialog
+                dialog = TaskEditDialog(task, all_tasks=self.tasks, pool_names=self.pool_names())
+                if dialog.exec() == QDialog.DialogCode.Accepted:
+                    dialog.get_task_data()
+                    self.apply_bulk([task], [], "任务更新成功")
+
+    def show_task_output(self):
+        task = self.task_from_index(self.task_view().currentIndex())
+        if task is None:
+            self.status_label.setText("请先选择任务")
+            return
+        from .dialogs import OutputViewerDialog
+        OutputViewerDialog(self.output_store, task, self).exec()
+
+    def pool_names(self) -> List[str]:
+        return list(self.executor.resource_pools)
+
+    def edit_resource_pools(self):
+        from .dialogs import ResourcePoolDialog
+        dialog = ResourcePoolDialog(list(self.executor.resource_pools.values()), self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            pools = dialog.get_pools()
+            self.executor.set_resource_pools(pools)
+            self.settings["resource_pools"] = [pool.to_dict() for pool in pools]
+            self.settings_store.save(self.settings)
+            self.status_label.setText(f"已保存 {len(pools)} 个资源池")
+
+    def edit_jitter_settings(self):
+        from .dialogs import JitterSettingsDialog
+        dialog = JitterSettingsDialog(self.scheduler.jitter, self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            self.scheduler.jitter = dialog.get_settings()
+            self.settings["jitter"] = self.scheduler.jitter.to_dict()
+            self.settings_store.save(self.settings)
+            self.on_tasks_changed()
+            self.status_label.setText("错峰设置已保存")
+
+    def show_forecast(self):
+        from .dialogs import ForecastDialog
+        dialog = ForecastDialog(self.scheduler, self.history_store.durations(), self)
+        dialog.exec()
+
+    def show_diagnostics(self):
+        from .dialogs import DiagnosticsDialog
+        dialog = DiagnosticsDialog(perf, self.watchdog, self)
+        dialog.exec()
+
+    def toggle_profiling(self):
+        # 第一次点击开始 cProfile 采样，再次点击停止并把结果保存到 profiles/ 目录
+        if not self.profile_session.active:
+            self.profile_session.start()
+            self.profile_action.setText("停止性能分析并保存")
+            self.show_notification("性能分析", "已开始采样，再次点击托盘菜单中的“停止性能分析并保存”结束", 3000)
+            return
+        try:
+            path = self.profile_session.stop()
+            self.show_notification("性能分析", f"采样结果已保存到 {path}", 5000)
+        except Exception as e:
+            self.show_notification("性能分析", f"保存采样结果失败: {e}", 5000)
+        self.profile_action.setText("开始性能分析")
+
+    def update_pool_status(self):
+        # 状态栏显示各资源池的占用、等待数量和最近一次的等待时间
+        parts = []
+        for pool in self.executor.resource_pools.values():
+            text = f"{pool.name} {pool.running}/{pool.max_concurrency}"
+            if pool.waiting:
+                text += f" 等待{len(pool.waiting)}"
+            if pool.wait_count:
+                text += f" 上次等待{pool.last_wait:.1f}秒"
+            parts.append(text)
+        self.pool_status_label.setText("资源池: " + "，".join(parts) if parts else "")
+
+    def get_selected_tasks(self):
+        if self.group_view_combo.currentData():
+            # 分组视图：汇总行代表整个分组，同一任务在多个标签下被选中时只计一次
+            selected_tasks = {}
+            for index in self.group_tree.selectionModel().selectedRows():
+                for task in self.group_model.tasks_at(index):
+                    selected_tasks[task.id] = task
+            return list(selected_tasks.values())
+
+        selected_rows = set()
+        for index in self.task_table.selectionModel().selectedIndexes():
+            selected_rows.add(self.task_proxy.mapToSource(index).row())
+
+        selected_tasks = []
+        for row in sorted(selected_rows):
+            task = self.task_model.task_at(row)
+            if task:
+                selected_tasks.append(task)
+
+        return selected_tasks
+
+    def enable_task(self):
+        selected_tasks = self.get_selected_tasks()
+        if not selected_tasks:
+            self.status_label.setText("请先选择任务")
+            return
+
+        for task in selected_tasks:
+            task.status = TaskStatus.ENABLED
+        self.apply_bulk(selected_tasks, [], f"已启用 {len(selected_tasks)} 个任务")
+
+    def disable_task(self):
+        selected_tasks = self.get_selected_tasks()
+        if not selected_tasks:
+            self.status_label.setText("请先选择任务")
+            return
+
+        for task in selected_tasks:
+            task.status = TaskStatus.DISABLED
+        self.apply_bulk(selected_tasks, [], f"已禁用 {len(selected_tasks)} 个任务")
+
+    def bulk_move_to_group(self):
+        selected_tasks = self.get_selected_tasks()
+        if not selected_tasks:
+            self.status_label.setText("请先选择任务")
+            return
+        groups = sorted({task.group for task in self.tasks if task.group})
+        group, ok = QInputDialog.getItem(self, "移动到分组", f"将选中的 {len(selected_tasks)} 个任务移动到分组（留空表示未分组）:",
+                                         groups, 0, True)
+        if not ok:
+            return
+        group = group.strip()
+        for task in selected_tasks:
+            task.group = group
+        self.apply_bulk(selected_tasks, [], f"已将 {len(selected_tasks)} 个任务移动到分组“{group or '未分组'}”")
+
+    def bulk_retime(self):
+        selected_tasks = self.get_selected_tasks()
+        if not selected_tasks:
+            self.status_label.setText("请先选择任务")
+            return
+        from .dialogs import BulkRetimeDialog
+        dialog = BulkRetimeDialog(len(selected_tasks), self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        shift_minutes, interval_seconds = dialog.get_values()
+        changed = []
+        for task in selected_tasks:
+            if task.schedule_type == "interval" and interval_seconds:
+                task.interval_seconds = interval_seconds
+                changed.append(task)
+            elif task.schedule_type in ("daily", "weekly", "monthly") and shift_minutes:
+                task.shift_schedule(shift_minutes)
+                changed.append(task)
+        if changed:
+            self.apply_bulk(changed, [], f"已调整 {len(changed)} 个任务的执行时间")
+        else:
+            self.status_label.setText("选中的任务中没有需要调整的")
+
+    def apply_bulk(self, updated: List[Task], removed: List[Task], message: str,
+                   added: Optional[List[Task]] = None):
+        # 新建、编辑、删除和批量操作只写一次任务文件，调度器和事件触发只为受影响的任务增量更新，
+        # 不重新登记全部作业；added 中的任务需已加入 self.tasks
+        added = added or []
+        if self.save_tasks():
+            # 任务文件被外部修改过，save_tasks 已合并并整体重新调度
+            return
+        self.task_graph.build(self.tasks)
+        if self.scheduler.running:
+            self.scheduler.apply_changes(added, updated, removed)
+        self.triggers.set_tasks(self.tasks)
+        if added or removed or len(updated) > 64:
+            self.refresh_tasks()
+        else:
+            for task in updated:
+                self.task_model.update_task(task.id)
+            # 搜索索引包含分组和标签，只在模型重置时自动失效，这里手动失效后在下次搜索时重建
+            self.task_proxy.search_index.invalidate()
+            if self.ui_built:
+                # 状态、分组等可能影响过滤和分组结果
+                self.apply_filters()
+        self.status_label.setText(message)
+
+    def select_all_tasks(self):
+        if self.group_view_combo.currentData():
+            self.group_tree.selectAll()
+            self.status_label.setText(f"已选择 {len(self.get_selected_tasks())} 个任务")
+            return
+        self.task_table.selectAll()
+        self.status_label.setText(f"已选择 {self.task_proxy.rowCount()} 个任务")
+
+    def delete_task(self):
+        selected_tasks = self.get_selected_tasks()
+        if not selected_tasks:
+            self.status_label.setText("请先选择任务")
+            return
+
+        task_names = [task.name for task in selected_tasks]
+        reply = QMessageBox.question(
+            self,
+            "确认删除",
+            f"确定要删除选中的 {len(selected_tasks)} 个任务吗？\n{', '.join(task_names)}",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+
+        if reply == QMessageBox.StandardButton.Yes:
+            removed_ids = {task.id for task in selected_tasks}
+            self.tasks[:] = [task for task in self.tasks if task.id not in removed_ids]
+            for task in selected_tasks:
+                self.output_store.remove_task(task.id)
+            self.apply_bulk([], selected_tasks, f"已删除 {len(selected_tasks)} 个任务")
+
+    def refresh_tasks(self):
+        with perf.measure("refresh_tasks"):
+            self.task_model.set_tasks(self.tasks)
+            if self.ui_built:
+                self.apply_filters()
+            self.status_label.setText("任务已刷新")
+
+    def on_next_runs_changed(self, next_runs: Dict[str, Optional[datetime]], full: bool):
+        self.task_model.update_next_runs(next_runs, full)
+
+    def toggle_countdown(self, enabled: bool):
+        self.task_model.countdown_enabled = enabled
+        if enabled:
+            self.countdown_timer.start()
+        else:
+            self.countdown_timer.stop()
+        self.task_model.refresh_column(TaskTableModel.NEXT_RUN_COLUMN)
+
+    def refresh_next_run_times(self):
+        with perf.measure("refresh_next_run_times"):
+            # 只刷新视口内可见的行，屏幕外的行不产生任何开销
+            try:
+                if not self.isVisible():
+                    return
+                if self.group_view_combo.currentData():
+                    self.refresh_group_next_run_times()
+                    return
+                row_count = self.task_proxy.rowCount()
+                top = self.task_table.rowAt(0)
+                if row_count == 0 or top < 0:
+                    return
+                bottom = self.task_table.rowAt(self.task_table.viewport().height() - 1)
+                if bottom < 0:
+                    bottom = row_count - 1
+
+                rows = [self.task_proxy.mapToSource(self.task_proxy.index(row, 0)).row()
+                        for row in range(top, bottom + 1)]
+                self.task_model.refresh_rows(rows, TaskTableModel.NEXT_RUN_COLUMN)
+            except Exception:
+                pass
+
+    def refresh_group_next_run_times(self):
+        # 分组视图：从视口顶部逐行向下取可见的汇总行和展开的子行，折叠的子行不在其中
+        viewport_height = self.group_tree.viewport().height()
+        index = self.group_tree.indexAt(QPoint(0, 0))
+        indexes = []
+        while index.isValid() and self.group_tree.visualRect(index).top() < viewport_height:
+            indexes.append(index)
+            index = self.group_tree.indexBelow(index)
+        self.group_model.refresh_rows(indexes, TaskTableModel.NEXT_RUN_COLUMN)
+
+    def apply_filters(self):
+        self.task_proxy.set_filters(
+            search_text=self.search_edit.text(),
+            status=self.status_filter_combo.currentData(),
+            task_type=self.type_filter_combo.currentData(),
+            schedule_type=self.schedule_filter_combo.currentData(),
+            due_within_minutes=self.due_filter_spin.value(),
+        )
+        self.rebuild_group_view()
+
+    def filter_tasks(self):
+        with perf.measure("filter_tasks"):
+            self.filter_timer.stop()
+            self.apply_filters()
+            self.status_label.setText(f"显示 {self.task_proxy.rowCount()} / {len(self.tasks)} 个任务")
+
+    def on_task_order_changed(self, source_rows: List[int], destination_row: int):
+        # 获取拖拽的行和目标位置
+        source_rows = [row for row in source_rows if 0 <= row < len(self.tasks)]
+        if not source_rows:
+            return
+        if len(source_rows) == 1 and destination_row in (source_rows[0], source_rows[0] + 1):
+            return  # 没有实际移动
+
+        # 重新排序任务列表
+        moved_tasks = [self.tasks[row] for row in source_rows]
+        for row in reversed(source_rows):
+            self.tasks.pop(row)
+
+        # 计算实际插入位置：删除的行中位于目标位置之前的会使目标位置前移
+        destination_row -= sum(1 for row in source_rows if row < destination_row)
+        self.tasks[destination_row:destination_row] = moved_tasks
+        self.save_tasks()
+        self.refresh_tasks()
+        self.status_label.setText("任务顺序已更新")
+
+    def load_tasks(self):
+        self.tasks = self.store.load()
+        self.on_tasks_loaded()
+
+    def on_tasks_loaded(self):
+        self.task_graph.build(self.tasks)
+        self.refresh_tasks()
+        self.record_startup_metric("tasks_loaded_ms")
+        self.recover_interrupted_runs()
+        self.triggers.set_tasks(self.tasks)
+        self.task_watcher.start()
+
+    def on_task_file_changed(self):
+        try:
+            result = self.store.reload(self.tasks)
+        except Exception:
+            return
+        if result is None:
+            return
+        tasks, changes = result
+        self.tasks = tasks
+        if not changes:
+            return
+
+        self.task_graph.build(self.tasks)
+        # 只为新增、修改和删除的任务更新调度，未变化任务的下次执行时间保持不变
+        self.scheduler.apply_changes(changes.added, changes.updated, changes.removed)
+        self.triggers.set_tasks(self.tasks)
+
+        if changes.added or changes.updated or changes.removed:
+            self.refresh_tasks()
+        else:
+            for task in changes.runtime_updated:
+                self.task_model.update_task(task.id)
+        self.status_label.setText(f"任务文件已重新加载：新增 {len(changes.added)} 个，修改 {len(changes.updated)} 个，"
+                                  f"删除 {len(changes.removed)} 个")
+
+    def recover_interrupted_runs(self):
+        # 只在启动时执行一次：上次运行中只有开始记录的执行写入执行历史，
+        # 再按任务的恢复策略记为失败或重新执行；写入执行历史后才从执行日志中确认删除
+        if self.journal_recovered:
+            return
+        self.journal_recovered = True
+        orphans, self.interrupted_runs = self.interrupted_runs, []
+
+        tasks_by_id = {task.id: task for task in self.tasks}
+        rerun_tasks = []
+        recorded = []
+        for record in orphans:
+            task = tasks_by_id.get(record.get("task_id"))
+            task_name = task.name if task else record.get("task_name", "")
+            try:
+                self.history_store.append({
+                    "run_id": record.get("run_id"),
+                    "task_id": record.get("task_id"),
+                    "task_name": task_name,
+                    "queued_at": None,
+                    "started_at": record.get("started_at"),
+                    "finished_at": None,
+                    "returncode": None,
+                    "success": False,
+                    "failure_kind": FailureKind.INTERRUPTED.value,
+                    "error": None,
+                    "pool_wait": 0.0
+                })
+                recorded.append(record.get("run_id"))
+            except Exception:
+                pass
+            if task is None:
+                continue
+            if task.enable_logging:
+                self.write_execution_log(f"任务 '{task_name}' {FailureKind.INTERRUPTED.value}（开始于 {record.get('started_at')}）")
+            if (task.recovery_policy == RecoveryPolicy.RERUN and task.status == TaskStatus.ENABLED
+                    and task not in rerun_tasks):
+                rerun_tasks.append(task)
+
+        if orphans:
+            suspended = sum(1 for task in rerun_tasks if self.scheduler.is_suspended(task))
+            message = f"{len(orphans)} 次执行在程序退出时被中断，{len(rerun_tasks)} 个任务将重新执行"
+            if suspended:
+                message += f"（其中 {suspended} 个任务已暂停，恢复后按补执行策略处理）"
+            self.show_notification("恢复中断的执行", message, 5000)
+        # 与其他触发方式一样经过暂停检查，暂停期间只记为错过的执行
+        for task in rerun_tasks:
+            self.dispatch_task(task)
+        if recorded:
+            try:
+                self.journal.acknowledge(recorded)
+            except Exception:
+                pass
+
+    def schedule_save(self):
+        # 定时器已在计时时不重新开始，持续触发的任务也不会一直推迟写入
+        if not self.save_timer.isActive():
+            self.save_timer.start()
+
+    @timed("save_tasks")
+    def save_tasks(self) -> bool:
+        # 返回 True 表示合并了外部修改，任务列表已整体刷新并重新调度；立即写入时取消待写入的合并保存
+        self.save_timer.stop()
+        merged_tasks = self.store.save(self.tasks)
+        if merged_tasks is None:
+            return False
+        # tasks.json 在上次读写之后被外部修改过，已按任务ID合并，重新登记调度
+        self.tasks = merged_tasks
+        self.refresh_tasks()
+        self.on_tasks_changed()
+        self.status_label.setText("任务文件已被外部修改，已合并外部的更改")
+        return True
+
+    def on_tasks_changed(self):
+        self.task_graph.build(self.tasks)
+        self.triggers.set_tasks(self.tasks)
+        if self.scheduler.running:
+            self.scheduler.reschedule_all()
+
+    def execute_task(self, task: Task):
+        with perf.measure("execute_task"):
+            self.record_startup_metric("first_fire_ms")
+            try:
+                if task.task_type == TaskType.CMD:
+                    # CMD任务交给执行器异步运行，结束后在 on_run_finished 中处理
+                    if self.execute_cmd_task(task) is None:
+                        message = f"任务 '{task.name}' 上一次执行尚未结束，已按重叠策略跳过本次触发"
+                        self.status_label.setText(message)
+                        if task.enable_logging:
+                            self.write_execution_log(message)
+                        return
+
+                task.last_execution = datetime.now()
+                task.execution_count += 1
+
+                # 只通知该任务所在行更新，不再重建整个表格
+                self.task_model.update_task(task.id)
+                self.schedule_save()
+
+                if task.task_type != TaskType.CMD:
+                    self.execute_notification_task(task)
+                    self.on_task_completed(task, True)
+
+            except Exception:
+                self.watchdog.log_exception(f"执行任务 '{task.name}' 出错")
+                self.refresh_tasks()
+                self.schedule_save()
+
+    def execute_cmd_task(self, task: Task) -> Optional[TaskRun]:
+        return self.executor.submit(task)
+
+    def on_run_finished(self, run: TaskRun):
+        with perf.measure("on_run_finished"):
+            self.executor.complete(run)
+            task = run.task
+            try:
+                self.history_store.append(run.to_history())
+            except Exception:
+                pass
+
+            if run.cancelled:
+                self.show_notification("CMD任务已取消", f"任务 '{task.name}' 的上一次执行已被新的触发取消", 3000)
+            elif run.error is not None:
+                self.show_notification("CMD任务执行错误", f"任务 '{task.name}' 执行错误: {run.error}", 3000)
+            elif run.returncode == 0:
+                message = f"任务 '{task.name}' 执行成功"
+                if run.pool_wait >= 1:
+                    message += f"（等待资源池 {run.pool_wait:.1f} 秒）"
+                self.show_notification("CMD任务执行成功", message, 3000)
+            elif run.failure_kind not in (None, FailureKind.EXIT_CODE):
+                # 超出资源限制单独提示，便于与命令本身的错误区分
+                self.show_notification("CMD任务超出资源限制", f"任务 '{task.name}' {run.failure_kind.value}", 3000)
+                if task.enable_logging:
+                    self.write_execution_log(f"任务 '{task.name}' {run.failure_kind.value}（退出码 {run.returncode}）")
+            else:
+                self.show_notification("CMD任务执行失败", f"任务 '{task.name}' 执行失败: {run.stderr}", 3000)
+            self.on_task_completed(task, run.success)
+
+    def on_task_completed(self, task: Task, success: bool):
+        # 记录必要的执行日志到文件
+        if task.enable_logging:
+            self.write_execution_log(f"任务执行{'成功' if success else '失败'}: {task.name}")
+
+        if not success:
+            return
+        # 触发所有上游均已成功完成的下游任务
+        for downstream in self.task_graph.on_task_succeeded(task.id):
+            if downstream.status == TaskStatus.ENABLED:
+                self.dispatch_task(downstream)
+
+    def record_startup_metric(self, name: str):
+        # 记录从启动到各阶段完成的耗时（毫秒）和内存占用，只记录第一次
+        if name in self.startup_metrics:
+            return
+        self.startup_metrics[name] = round((time_module.perf_counter() - self.startup_started) * 1000, 1)
+        self.startup_metrics["start_minimized"] = self.start_minimized
+        self.startup_metrics["peak_memory_kb"] = get_peak_memory_kb()
+
+        report_path = os.environ.get("SCHEDULETIME_STARTUP_REPORT")
+        if report_path:
+            try:
+                with open(report_path, "w", encoding="utf-8") as f:
+                    json.dump(self.startup_metrics, f)
+            except Exception:
+                pass
+
+    def write_execution_log(self, message: str):
+        try:
+            with open("execution.log", "a", encoding="utf-8") as f:
+                f.write(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {message}\n")
+        except:
+            pass
+
+    @timed("notification")
+    def execute_notification_task(self, task: Task):
+        try:
+            if task.popup_type == PopupType.WINDOW_POPUP.value or task.popup_type == "window_popup":
+                # 创建Windows系统原生提示框，需要用户点击确认
+                QMessageBox.information(self, task.notification_title, task.notification_content)
+            else:
+                # 系统托盘弹窗，使用弹窗显示时间
+                self.show_notification(task.notification_title, task.notification_content, task.notification_timeout)
+        except Exception:
+            self.show_notification("任务提醒", f"任务 '{task.name}' 已执行", task.notification_timeout)
+
+    @timed("show_notification")
+    def show_notification(self, title: str, message: str, timeout: int = 3000):
+        try:
+            if len(message) > 200:
+                message = message[:200] + "..."
+
+            self.tray_icon.showMessage(title, message, QSystemTrayIcon.MessageIcon.Information, timeout)
+            self.status_label.setText(f"{title}: {message[:50]}...")
+
+        except Exception:
+            try:
+                QMessageBox.information(self, title, message)
+            except:
+                pass
+
+    def pause_all_tasks(self):
+        # 只设置调度器的暂停状态，不修改任务自身的启用状态，也不需要重写任务文件
+        self.scheduler.pause()
+        self.on_pause_changed()
+        self.status_label.setText("所有任务已暂停")
+
+    def resume_all_tasks(self):
+        catch_up = self.scheduler.resume()
+        self.on_pause_changed()
+        self.status_label.setText(f"所有任务已恢复，补执行 {len(catch_up)} 个任务" if catch_up else "所有任务已恢复")
+        for task in catch_up:
+            self.execute_task(task)
+
+    def all_tags(self) -> List[str]:
+        return sorted({tag for task in self.tasks for tag in task.tags})
+
+    def build_tag_pause_menu(self):
+        self.tag_pause_menu.clear()
+        tags = sorted(set(self.all_tags()) | self.scheduler.paused_tags)
+        if not tags:
+            action = self.tag_pause_menu.addAction("没有设置标签的任务")
+            action.setEnabled(False)
+            return
+        for tag in tags:
+            action = self.tag_pause_menu.addAction(tag)
+            action.setCheckable(True)
+            action.setChecked(tag in self.scheduler.paused_tags)
+            action.toggled.connect(lambda checked, tag=tag: self.set_tag_paused(tag, checked))
+
+    def set_tag_paused(self, tag: str, paused: bool):
+        if paused:
+            self.scheduler.pause([tag])
+            self.on_pause_changed()
+            self.status_label.setText(f"已暂停标签为“{tag}”的任务")
+            return
+        catch_up = self.scheduler.resume([tag])
+        self.on_pause_changed()
+        self.status_label.setText(f"已恢复标签为“{tag}”的任务")
+        for task in catch_up:
+            self.execute_task(task)
+
+    def on_pause_changed(self):
+        # 暂停状态保存在 settings.json 中，重新启动后保持
+        self.settings["pause"] = {"paused": self.scheduler.paused, "tags": sorted(self.scheduler.paused_tags)}
+        try:
+            self.settings_store.save(self.settings)
+        except Exception:
+            pass
+        self.task_model.refresh_all()
+        self.update_pause_status()
+
+    def update_pause_status(self):
+        if self.scheduler.paused:
+            self.pause_status_label.setText("已暂停所有任务")
+        elif self.scheduler.paused_tags:
+            self.pause_status_label.setText("已暂停标签: " + "，".join(sorted(self.scheduler.paused_tags)))
+        else:
+            self.pause_status_label.setText("")
+
+    def dispatch_task(self, task: Task):
+        # 事件触发和依赖触发的任务与定时任务一样受暂停状态约束，暂停期间只记录错过的执行
+        if self.scheduler.is_suspended(task):
+            self.scheduler.record_missed(task)
+            return
+        self.execute_task(task)
+
+    def handle_instance_message(self, message: str):
+        # 再次启动程序时，新进程把消息发给当前实例后退出
+        if message == "show":
+            self.show()
+            self.setWindowState(self.windowState() & ~Qt.WindowState.WindowMinimized)
+            self.raise_()
+            self.activateWindow()
+        else:
+            self.show_notification("定时任务管理器", "程序已在运行", 3000)
+
+    def quit_application(self):
+        self.task_watcher.stop()
+        self.triggers.stop()
+        self.watchdog.stop()
+        if self.profile_session.active:
+            try:
+                self.profile_session.stop()
+            except Exception:
+                pass
+        self.scheduler.running = False
+        self.countdown_timer.stop()
+        if self.save_timer.isActive():
+            # 退出前写入尚未保存的执行记录
+            try:
+                self.save_tasks()
+            except Exception:
+                self.watchdog.log_exception("退出时保存任务文件出错")
+        self.executor.shutdown()
+        self.tray_icon.hide()
+        QApplication.quit()
+
+    def closeEvent(self, event):
+        reply = QMessageBox.question(
+            self,
+            '确认退出',
+            '确定要退出定时任务管理器吗？',
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+
+        if reply == QMessageBox.StandardButton.Yes:
+            self.quit_application()
+            event.accept()
+        else:
+            event.ignore()
+
+    def changeEvent(self, event):
+        if event.type() == event.Type.WindowStateChange:
+            if self.windowState() & Qt.WindowState.WindowMinimized:
+                self.hide()
+                self.is_minimized_to_tray = True
+        super().changeEvent(event)
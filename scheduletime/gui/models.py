@@ -0,0 +1,523 @@
+import json
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Set, Optional
+
+from PyQt6.QtCore import (Qt, pyqtSignal, QAbstractTableModel, QAbstractItemModel, QSortFilterProxyModel,
+                          QModelIndex, QMimeData, QByteArray)
+from PyQt6.QtGui import QColor, QFont
+
+from ..core.task import Task, TaskType, TaskStatus
+
+
+class TaskSearchIndex:
+    # 搜索索引：预先为每个任务构建小写文本和 n-gram 倒排表，按键时无需遍历表格单元格
+    NGRAM_SIZE = 3
+
+    def __init__(self):
+        self.texts: List[str] = []
+        self.tokens: Dict[str, Set[int]] = {}
+        self.ngrams: Dict[str, Set[int]] = {}
+        self.built = False
+
+    def invalidate(self):
+        self.texts = []
+        self.tokens = {}
+        self.ngrams = {}
+        self.built = False
+
+    def build(self, tasks: List[Task]):
+        self.invalidate()
+        for row, task in enumerate(tasks):
+            text = "\n".join([task.name, task.task_type.value, task.description, task.cmd_command,
+                              task.notification_title, task.notification_content, " ".join(task.tags),
+                              task.group]).lower()
+            self.texts.append(text)
+            for token in text.split():
+                self.tokens.setdefault(token, set()).add(row)
+            for gram in self._ngrams(text):
+                self.ngrams.setdefault(gram, set()).add(row)
+        self.built = True
+
+    def _ngrams(self, text: str) -> Set[str]:
+        size = self.NGRAM_SIZE
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+    def search(self, query: str) -> Optional[Set[int]]:
+        # 返回匹配的行号集合；空查询返回 None 表示不过滤。多个关键词之间为“与”关系
+        terms = query.lower().split()
+        if not terms:
+            return None
+
+        result = None
+        for term in terms:
+            rows = self._search_term(term)
+            result = rows if result is None else result & rows
+            if not result:
+                return set()
+        return result
+
+    def _search_term(self, term: str) -> Set[int]:
+        if len(term) < self.NGRAM_SIZE:
+            # 过短的关键词无法使用 n-gram：关键词不含空白，只需扫描去重后的词表
+            rows = set()
+            for token, token_rows in self.tokens.items():
+                if term in token:
+                    rows |= token_rows
+            return rows
+
+        postings = []
+        for gram in self._ngrams(term):
+            rows = self.ngrams.get(gram)
+            if not rows:
+                return set()
+            postings.append(rows)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for rows in postings[1:]:
+            candidates &= rows
+            if not candidates:
+                return candidates
+        # n-gram 交集可能包含误报，用原文确认一次
+        return {row for row in candidates if term in self.texts[row]}
+
+
+class TaskTableModel(QAbstractTableModel):
+    COLUMNS = ["任务名称", "类型", "弹窗类型", "定时规则", "状态", "上次执行", "下次执行"]
+    NEXT_RUN_COLUMN = 6
+    MIME_TYPE = "application/x-scheduletime-task-rows"
+
+    task_moved = pyqtSignal(list, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tasks: List[Task] = []
+        self.rows_by_id: Dict[str, int] = {}
+        self.next_runs: Dict[str, datetime] = {}
+        self.countdown_enabled = False
+        self.is_suspended: Optional[Callable[[Task], bool]] = None  # 调度器的暂停判断
+
+    def set_tasks(self, tasks: List[Task]):
+        self.beginResetModel()
+        self.tasks = tasks
+        self.rows_by_id = {task.id: row for row, task in enumerate(tasks)}
+        self.endResetModel()
+
+    def update_task(self, task_id: str):
+        row = self.rows_by_id.get(task_id)
+        if row is not None:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+
+    def update_next_runs(self, next_runs: Dict[str, Optional[datetime]], full: bool = False):
+        if full:
+            self.next_runs = {}
+        for task_id, next_run in next_runs.items():
+            if next_run is None:
+                self.next_runs.pop(task_id, None)
+            else:
+                self.next_runs[task_id] = next_run
+
+        if full or len(next_runs) > 64:
+            self.refresh_column(self.NEXT_RUN_COLUMN)
+        else:
+            self.refresh_rows([self.rows_by_id[task_id] for task_id in next_runs if task_id in self.rows_by_id],
+                              self.NEXT_RUN_COLUMN)
+
+    def next_run_at(self, task: Task, now: Optional[datetime] = None) -> Optional[datetime]:
+        # 优先使用调度器发布的时间，调度器尚未登记时按规则推算
+        if task.status != TaskStatus.ENABLED:
+            return None
+        next_run = self.next_runs.get(task.id)
+        if next_run is not None:
+            return next_run
+        return task.get_next_run_datetime(now)
+
+    def next_run_text(self, task: Task) -> str:
+        if task.status == TaskStatus.ENABLED and self.is_suspended and self.is_suspended(task):
+            return "已暂停"
+        next_run = self.next_runs.get(task.id)
+        if task.status != TaskStatus.ENABLED or next_run is None:
+            return task.get_next_run_time()
+
+        if self.countdown_enabled:
+            remaining = int((next_run - datetime.now()).total_seconds())
+            if remaining <= 0:
+                return "即将执行"
+            days, remaining = divmod(remaining, 86400)
+            hours, remaining = divmod(remaining, 3600)
+            minutes, seconds = divmod(remaining, 60)
+            countdown = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+            return f"{days}天 {countdown} 后" if days else f"{countdown} 后"
+        return next_run.strftime("%Y-%m-%d %H:%M:%S")
+
+    def refresh_rows(self, rows: List[int], column: int):
+        # 逐个单元格通知；视图只会重绘其中位于视口内的部分
+        for row in rows:
+            cell = self.index(row, column)
+            self.dataChanged.emit(cell, cell)
+
+    def task_at(self, row: int) -> Optional[Task]:
+        if 0 <= row < len(self.tasks):
+            return self.tasks[row]
+        return None
+
+    def refresh_column(self, column: int):
+        if self.tasks:
+            self.dataChanged.emit(self.index(0, column), self.index(len(self.tasks) - 1, column))
+
+    def refresh_all(self):
+        if self.tasks:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.tasks) - 1, len(self.COLUMNS) - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.tasks)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self.tasks[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display_text(task, index.column())
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self.background(task)
+        if role == Qt.ItemDataRole.UserRole:
+            return task.id
+        return None
+
+    def background(self, task: Task) -> QColor:
+        if task.status != TaskStatus.ENABLED:
+            return QColor(255, 200, 200)
+        if self.is_suspended and self.is_suspended(task):
+            return QColor(255, 240, 190)
+        return QColor(200, 255, 200)
+
+    def display_text(self, task: Task, column: int) -> str:
+        if column == 0:
+            return task.name
+        if column == 1:
+            return task.task_type.value
+        if column == 2:
+            # 只对提醒任务显示弹窗类型
+            return task.popup_type if task.task_type == TaskType.NOTIFICATION else "-"
+        if column == 3:
+            return task.get_schedule_description()
+        if column == 4:
+            return task.status.value
+        if column == 5:
+            return task.last_execution.strftime("%Y-%m-%d %H:%M:%S") if task.last_execution else "从未执行"
+        if column == self.NEXT_RUN_COLUMN:
+            return self.next_run_text(task)
+        return ""
+
+    # 拖拽排序：模型只负责编码行号，实际的重新排序由 TaskManager 完成
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable |
+                Qt.ItemFlag.ItemIsDragEnabled)
+
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+
+    def mimeTypes(self):
+        return [self.MIME_TYPE]
+
+    def mimeData(self, indexes):
+        rows = sorted({index.row() for index in indexes if index.isValid()})
+        mime_data = QMimeData()
+        mime_data.setData(self.MIME_TYPE, QByteArray(json.dumps(rows).encode("utf-8")))
+        return mime_data
+
+    def dropMimeData(self, data, action, row, column, parent):
+        if action != Qt.DropAction.MoveAction or not data.hasFormat(self.MIME_TYPE):
+            return False
+        if row < 0:
+            row = parent.row() if parent.isValid() else len(self.tasks)
+        rows = json.loads(bytes(data.data(self.MIME_TYPE)).decode("utf-8"))
+        self.task_moved.emit(rows, row)
+        return True
+
+
+class TaskFilterProxyModel(QSortFilterProxyModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.search_index = TaskSearchIndex()
+        self.search_text = ""
+        self.search_rows: Optional[Set[int]] = None
+        # 每次过滤条件或任务列表变化时预先算出的匹配行号，filterAcceptsRow 只做集合查找；None 表示不过滤
+        self.accepted_rows: Optional[Set[int]] = None
+        self.status_filter: Optional[TaskStatus] = None
+        self.type_filter: Optional[TaskType] = None
+        self.schedule_type_filter: Optional[str] = None
+        self.due_within_minutes = 0
+        self.due_before: Optional[datetime] = None
+        self.now: Optional[datetime] = None
+
+    def setSourceModel(self, source_model):
+        # 先于代理模型自身的处理连接，代理重新过滤时匹配的行号集合已经更新
+        source_model.modelReset.connect(self.on_source_reset)
+        source_model.dataChanged.connect(self.on_source_changed)
+        super().setSourceModel(source_model)
+
+    def set_filters(self, search_text: str = "", status: Optional[TaskStatus] = None,
+                    task_type: Optional[TaskType] = None, schedule_type: Optional[str] = None,
+                    due_within_minutes: int = 0):
+        self.search_text = search_text
+        self.status_filter = status
+        self.type_filter = task_type
+        self.schedule_type_filter = schedule_type
+        self.due_within_minutes = due_within_minutes
+        self.now = datetime.now()
+        self.due_before = self.now + timedelta(minutes=due_within_minutes) if due_within_minutes > 0 else None
+        self.update_accepted_rows()
+        self.invalidateFilter()
+
+    def has_field_filters(self) -> bool:
+        return (self.status_filter is not None or self.type_filter is not None
+                or self.schedule_type_filter is not None or self.due_before is not None)
+
+    def update_accepted_rows(self):
+        # 索引在任务列表变化后失效，只在真正有搜索关键词时才重建；其余条件只检查搜索命中的行
+        if self.search_text.strip() and not self.search_index.built:
+            self.search_index.build(self.sourceModel().tasks)
+        self.search_rows = self.search_index.search(self.search_text)
+        if not self.has_field_filters():
+            self.accepted_rows = self.search_rows
+            return
+        rows = self.search_rows if self.search_rows is not None else range(self.sourceModel().rowCount())
+        self.accepted_rows = {row for row in rows if self.row_matches(row)}
+
+    def on_source_reset(self):
+        self.search_index.invalidate()
+        self.update_accepted_rows()
+
+    def on_source_changed(self, top_left, bottom_right):
+        # 状态、下次执行时间等变化后只重新判断变化的行；关键词命中的行在搜索索引失效后由 set_filters 重新计算
+        if not self.has_field_filters():
+            return
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            if (self.search_rows is None or row in self.search_rows) and self.row_matches(row):
+                self.accepted_rows.add(row)
+            else:
+                self.accepted_rows.discard(row)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.accepted_rows is None or source_row in self.accepted_rows
+
+    def row_matches(self, source_row: int) -> bool:
+        task = self.sourceModel().task_at(source_row)
+        if task is None:
+            return False
+        if self.status_filter is not None and task.status != self.status_filter:
+            return False
+        if self.type_filter is not None and task.task_type != self.type_filter:
+            return False
+        if self.schedule_type_filter is not None and task.schedule_type != self.schedule_type_filter:
+            return False
+        if self.due_before is not None:
+            # 下次执行时间最贵，放在最后判断
+            try:
+                next_run = self.sourceModel().next_run_at(task, self.now)
+            except Exception:
+                return False
+            if next_run is None or next_run > self.due_before:
+                return False
+        return True
+
+
+class TaskGroup:
+    def __init__(self, row: int, key: str):
+        self.row = row
+        self.key = key
+        self.tasks: List[Task] = []
+        self.summaries: Dict[int, str] = {}  # 列号 -> 汇总文本，组内任务变化时清空
+
+
+class TaskGroupModel(QAbstractItemModel):
+    # 分组视图：在过滤后的任务上按分组或标签归类，顶层为可折叠的汇总行，子行的显示内容复用 TaskTableModel。
+    # 按标签归类时一个任务可以出现在多个标签下
+    UNGROUPED = {"group": "未分组", "tag": "无标签"}
+
+    def __init__(self, task_model: TaskTableModel, proxy: QSortFilterProxyModel, parent=None):
+        super().__init__(parent)
+        self.task_model = task_model
+        self.proxy = proxy
+        self.group_by = "group"
+        self.groups: List[TaskGroup] = []
+        self.positions: Dict[str, List[tuple]] = {}  # 任务ID -> [(分组, 子行)]
+        task_model.dataChanged.connect(self.on_source_changed)
+
+    def keys_of(self, task: Task) -> List[str]:
+        if self.group_by == "tag":
+            return task.tags or [self.UNGROUPED["tag"]]
+        return [task.group or self.UNGROUPED["group"]]
+
+    def rebuild(self):
+        self.beginResetModel()
+        groups: Dict[str, TaskGroup] = {}
+        for row in range(self.proxy.rowCount()):
+            task = self.task_model.task_at(self.proxy.mapToSource(self.proxy.index(row, 0)).row())
+            if task is None:
+                continue
+            for key in self.keys_of(task):
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = TaskGroup(0, key)
+                group.tasks.append(task)
+        # 未分组的排在最后
+        self.groups = sorted(groups.values(), key=lambda group: (group.key in self.UNGROUPED.values(), group.key))
+        self.positions = {}
+        for row, group in enumerate(self.groups):
+            group.row = row
+            for child, task in enumerate(group.tasks):
+                self.positions.setdefault(task.id, []).append((group, child))
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self.groups = []
+        self.positions = {}
+        self.endResetModel()
+
+    def on_source_changed(self, top_left, bottom_right):
+        # 任务行更新（如下次执行时间）时同步刷新对应的子行和所在分组的汇总行
+        last_column = len(TaskTableModel.COLUMNS) - 1
+        changed_groups = {}
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            task = self.task_model.task_at(row)
+            if task is None:
+                continue
+            for group, child in self.positions.get(task.id, []):
+                rows = changed_groups.setdefault(group.row, [group, child, child])
+                rows[1], rows[2] = min(rows[1], child), max(rows[2], child)
+        for group, first, last in changed_groups.values():
+            group.summaries.clear()
+            parent = self.createIndex(group.row, 0)
+            self.dataChanged.emit(self.index(first, top_left.column(), parent),
+                                  self.index(last, bottom_right.column(), parent))
+            self.dataChanged.emit(self.createIndex(group.row, 0), self.createIndex(group.row, last_column))
+
+    def refresh_rows(self, indexes: List[QModelIndex], column: int):
+        # 倒计时刷新：只通知给定的（视口内可见的）汇总行和子行，汇总行的该列缓存随之失效
+        for index in indexes:
+            group = self.group_at(index)
+            if group is not None:
+                group.summaries.pop(column, None)
+            cell = index.siblingAtColumn(column)
+            self.dataChanged.emit(cell, cell)
+
+    def group_at(self, index) -> Optional[TaskGroup]:
+        if index.isValid() and index.internalPointer() is None:
+            return self.groups[index.row()]
+        return None
+
+    def task_at(self, index) -> Optional[Task]:
+        if not index.isValid():
+            return None
+        group = index.internalPointer()
+        if group is None or index.row() >= len(group.tasks):
+            return None
+        return group.tasks[index.row()]
+
+    def tasks_at(self, index) -> List[Task]:
+        group = self.group_at(index)
+        if group is not None:
+            return list(group.tasks)
+        task = self.task_at(index)
+        return [task] if task else []
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column)
+        return self.createIndex(row, column, self.groups[parent.row()])
+
+    def parent(self, index=None):
+        if index is None:
+            return super().parent()
+        if not index.isValid() or index.internalPointer() is None:
+            return QModelIndex()
+        return self.createIndex(index.internalPointer().row, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.groups)
+        if parent.internalPointer() is None and parent.column() == 0:
+            return len(self.groups[parent.row()].tasks)
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(TaskTableModel.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        return self.task_model.headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        group = self.group_at(index)
+        if group is not None:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.summary_text(group, index.column())
+            if role == Qt.ItemDataRole.FontRole:
+                font = QFont()
+                font.setBold(True)
+                return font
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return QColor(230, 230, 230)
+            return None
+
+        task = self.task_at(index)
+        if task is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.task_model.display_text(task, index.column())
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self.task_model.background(task)
+        if role == Qt.ItemDataRole.UserRole:
+            return task.id
+        return None
+
+    def summary_text(self, group: TaskGroup, column: int) -> str:
+        # 汇总行每次重绘都会调用，结果按列缓存，直到组内任务变化或倒计时刷新
+        text = group.summaries.get(column)
+        if text is None:
+            text = group.summaries[column] = self.compute_summary(group, column)
+        return text
+
+    def compute_summary(self, group: TaskGroup, column: int) -> str:
+        # 汇总行：任务数、各类型数量、启用/禁用数量、最近一次执行和最早的下次执行
+        tasks = group.tasks
+        if column == 0:
+            return f"{group.key}（{len(tasks)} 个任务）"
+        if column == 1:
+            cmd_count = sum(1 for task in tasks if task.task_type == TaskType.CMD)
+            return f"CMD {cmd_count} / 提醒 {len(tasks) - cmd_count}"
+        if column == 4:
+            enabled = sum(1 for task in tasks if task.status == TaskStatus.ENABLED)
+            return f"启用 {enabled} / 禁用 {len(tasks) - enabled}"
+        if column == 5:
+            executions = [task.last_execution for task in tasks if task.last_execution]
+            return max(executions).strftime("%Y-%m-%d %H:%M:%S") if executions else "从未执行"
+        if column == TaskTableModel.NEXT_RUN_COLUMN:
+            now = datetime.now()
+            next_runs = []
+            for task in tasks:
+                try:
+                    next_run = self.task_model.next_run_at(task, now)
+                except Exception:
+                    next_run = None
+                if next_run is not None:
+                    next_runs.append(next_run)
+            return min(next_runs).strftime("%Y-%m-%d %H:%M:%S") if next_runs else "-"
+        return ""
+
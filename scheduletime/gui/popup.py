@@ -0,0 +1,46 @@
+from PyQt6.QtWidgets import QApplication, QDialog, QVBoxLayout, QLabel, QPushButton
+from PyQt6.QtCore import Qt, QTimer
+
+
+class PopupDialog(QDialog):
+    def __init__(self, title: str, content: str, timeout: int = 3000):
+        super().__init__()
+        self.title = title
+        self.content = content
+        self.timeout = timeout
+        self.setup_ui()
+
+    def setup_ui(self):
+        self.setWindowTitle(self.title)
+        self.setModal(False)  # 非模态窗口
+        self.setWindowFlags(Qt.WindowType.Tool | Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
+
+        layout = QVBoxLayout()
+
+        # 标题
+        title_label = QLabel(self.title)
+        title_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #333;")
+        layout.addWidget(title_label)
+
+        # 内容
+        content_label = QLabel(self.content)
+        content_label.setWordWrap(True)
+        layout.addWidget(content_label)
+
+        # 确认按钮
+        confirm_button = QPushButton("确认")
+        confirm_button.clicked.connect(self.accept)
+        layout.addWidget(confirm_button)
+
+        self.setLayout(layout)
+
+        # 设置窗口大小和位置 - 居中显示
+        self.resize(300, 150)
+        screen_geometry = QApplication.primaryScreen().availableGeometry()
+        x = (screen_geometry.width() - self.width()) // 2
+        y = (screen_geometry.height() - self.height()) // 2
+        self.move(x, y)
+
+        # 自动关闭
+        if self.timeout > 0:
+            QTimer.singleShot(self.timeout, self.accept)
@@ -0,0 +1,70 @@
+import getpass
+import hashlib
+import os
+
+from PyQt6.QtCore import QObject, QDir, QLockFile, pyqtSignal
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+
+
+class SingleInstance(QObject):
+    # 同一数据目录只允许运行一个实例：QLockFile 决定谁是主实例，主实例监听 QLocalServer；
+    # 再次启动时连接主实例发送消息（如显示主窗口）后退出，不会出现两个调度器同时触发任务
+    CONNECT_TIMEOUT_MS = 1000
+    CONNECT_RETRIES = 5
+
+    message_received = pyqtSignal(str)
+
+    def __init__(self, data_dir: str = ".", parent=None):
+        super().__init__(parent)
+        try:
+            user = getpass.getuser()
+        except Exception:
+            user = ""
+        key = hashlib.sha1(f"{user}:{os.path.abspath(data_dir)}".encode("utf-8")).hexdigest()[:16]
+        self.server_name = f"scheduletime-{key}"
+        self.lock_file = QLockFile(os.path.join(QDir.tempPath(), f"{self.server_name}.lock"))
+        self.lock_file.setStaleLockTime(0)  # 只按持有进程是否存活判断锁是否失效
+        self.server = None
+
+    def acquire(self, message: str = "show") -> bool:
+        # 返回 True 表示当前进程成为主实例；否则已把消息发给主实例，调用方应直接退出
+        if self.lock_file.tryLock(100):
+            QLocalServer.removeServer(self.server_name)  # 清理上次异常退出留下的套接字
+            self.server = QLocalServer(self)
+            self.server.newConnection.connect(self.on_new_connection)
+            self.server.listen(self.server_name)
+            return True
+
+        # 主实例可能还在启动中，尚未开始监听，稍后重试
+        for _ in range(self.CONNECT_RETRIES):
+            if self.send(message):
+                break
+        return False
+
+    def send(self, message: str) -> bool:
+        socket = QLocalSocket()
+        socket.connectToServer(self.server_name)
+        if not socket.waitForConnected(self.CONNECT_TIMEOUT_MS):
+            return False
+        socket.write((message + "\n").encode("utf-8"))
+        socket.waitForBytesWritten(self.CONNECT_TIMEOUT_MS)
+        socket.disconnectFromServer()
+        return True
+
+    def on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda socket=socket: self.read_message(socket))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def read_message(self, socket: QLocalSocket):
+        while socket.canReadLine():
+            message = bytes(socket.readLine()).decode("utf-8", errors="replace").strip()
+            if message:
+                self.message_received.emit(message)
+
+    def release(self):
+        if self.server is not None:
+            self.server.close()
+            self.server = None
+        self.lock_file.unlock()
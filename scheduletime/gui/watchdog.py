@@ -0,0 +1,101 @@
+import sys
+import time
+import threading
+import traceback
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+class EventLoopWatchdog(QObject):
+    # 事件循环看门狗：界面线程每隔 HEARTBEAT_MS 更新一次心跳，后台线程发现心跳超过阈值未更新时，
+    # 抓取界面线程当时的调用栈；事件循环恢复后补上卡顿时长，写入 log_path 并发出 stall_detected
+    HEARTBEAT_MS = 100
+    MAX_STALLS = 50
+
+    stall_detected = pyqtSignal(object)
+
+    def __init__(self, threshold_ms: int = 500, log_path: Optional[str] = "diagnostics.log", parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000
+        self.log_path = log_path
+        self.main_thread_id = threading.main_thread().ident
+        self.last_beat = time.monotonic()
+        self.pending: Optional[Dict[str, Any]] = None  # 已抓取调用栈、尚未恢复的卡顿
+        self.stalls = deque(maxlen=self.MAX_STALLS)
+        self.lock = threading.Lock()
+        self.running = False
+        self.thread: Optional[threading.Thread] = None
+
+        self.heartbeat_timer = QTimer(self)
+        self.heartbeat_timer.setInterval(self.HEARTBEAT_MS)
+        self.heartbeat_timer.timeout.connect(self.beat)
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.last_beat = time.monotonic()
+        self.heartbeat_timer.start()
+        self.thread = threading.Thread(target=self.monitor, name="event-loop-watchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self.heartbeat_timer.stop()
+
+    def beat(self):
+        now = time.monotonic()
+        with self.lock:
+            stall, self.pending = self.pending, None
+            blocked = now - self.last_beat
+            self.last_beat = now
+        if stall is None:
+            return
+        stall["duration_ms"] = round(blocked * 1000)
+        with self.lock:
+            self.stalls.append(stall)
+        self.write_log(stall)
+        self.stall_detected.emit(stall)
+
+    def monitor(self):
+        interval = min(self.threshold / 2, self.HEARTBEAT_MS / 1000)
+        while self.running:
+            time.sleep(interval)
+            with self.lock:
+                blocked = time.monotonic() - self.last_beat
+                if self.pending is not None or blocked < self.threshold + self.HEARTBEAT_MS / 1000:
+                    continue
+                self.pending = {"detected_at": datetime.now().isoformat(timespec="seconds"),
+                                "duration_ms": None, "stack": self.capture_stack()}
+
+    def capture_stack(self) -> str:
+        frame = sys._current_frames().get(self.main_thread_id)
+        if frame is None:
+            return ""
+        return "".join(traceback.format_stack(frame))
+
+    def recent_stalls(self) -> List[Dict[str, Any]]:
+        with self.lock:
+            return list(self.stalls)
+
+    def log_exception(self, context: str):
+        # 界面线程中捕获后不再向上抛出的异常也写入诊断日志，在 except 块中调用
+        if not self.log_path:
+            return
+        try:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(f"{datetime.now().isoformat(timespec='seconds')} - {context}:\n{traceback.format_exc()}\n")
+        except Exception:
+            pass
+
+    def write_log(self, stall: Dict[str, Any]):
+        if not self.log_path:
+            return
+        try:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(f"{stall['detected_at']} - 界面线程阻塞 {stall['duration_ms']} ms，调用栈:\n{stall['stack']}\n")
+        except Exception:
+            pass
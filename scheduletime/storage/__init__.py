@@ -0,0 +1,8 @@
+from .task_store import TaskStore, TaskChanges
+from .settings_store import SettingsStore
+from .history_store import HistoryStore
+from .output_store import OutputStore
+from .run_journal import RunJournal
+from .file_watcher import TaskFileWatcher
+
+__all__ = ["TaskStore", "TaskChanges", "SettingsStore", "HistoryStore", "OutputStore", "RunJournal", "TaskFileWatcher"]
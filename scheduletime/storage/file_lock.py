@@ -0,0 +1,33 @@
+import os
+
+
+class FileLock:
+    # 跨进程的排他文件锁：POSIX 上使用 fcntl.flock，Windows 上使用 msvcrt.locking。
+    # 只对同样加锁的进程有效，外部编辑器的修改由 TaskStore 的合并处理
+    def __init__(self, path: str):
+        self.path = path
+        self.handle = None
+
+    def __enter__(self) -> 'FileLock':
+        self.handle = open(self.path, "a+")
+        if os.name == "nt":
+            import msvcrt
+            self.handle.seek(0)
+            msvcrt.locking(self.handle.fileno(), msvcrt.LK_LOCK, 1)  # 最多重试约 10 秒
+        else:
+            import fcntl
+            fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if os.name == "nt":
+                import msvcrt
+                self.handle.seek(0)
+                msvcrt.locking(self.handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            self.handle.close()
+            self.handle = None
@@ -0,0 +1,57 @@
+import os
+
+from PyQt6.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+
+class TaskFileWatcher(QObject):
+    # 监视任务文件：QFileSystemWatcher 通知变化，同时定时轮询兜底（如网络磁盘上收不到通知）。
+    # 短时间内的多次通知合并为一次 changed 信号，文件是否真的变化由 TaskStore 按修改时间和大小判断
+    DEBOUNCE_MS = 300
+    POLL_INTERVAL_MS = 5000
+
+    changed = pyqtSignal()
+
+    def __init__(self, path: str, parent=None):
+        super().__init__(parent)
+        self.path = os.path.abspath(path)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.on_changed)
+        self.watcher.directoryChanged.connect(self.on_changed)
+
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self.emit_changed)
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(self.POLL_INTERVAL_MS)
+        self.poll_timer.timeout.connect(self.emit_changed)
+
+    def start(self):
+        self.watch_paths()
+        self.poll_timer.start()
+
+    def stop(self):
+        self.poll_timer.stop()
+        self.debounce_timer.stop()
+        paths = self.watcher.files() + self.watcher.directories()
+        if paths:
+            self.watcher.removePaths(paths)
+
+    def watch_paths(self):
+        # 编辑器和本程序都通过重命名替换文件，替换后原文件的监视会失效，需要重新添加；
+        # 同时监视所在目录，文件被删除后重新创建也能收到通知
+        paths = [os.path.dirname(self.path)]
+        if os.path.exists(self.path):
+            paths.append(self.path)
+        watched = set(self.watcher.files() + self.watcher.directories())
+        missing = [path for path in paths if path not in watched]
+        if missing:
+            self.watcher.addPaths(missing)
+
+    def on_changed(self, path: str):
+        self.debounce_timer.start()
+
+    def emit_changed(self):
+        self.watch_paths()
+        self.changed.emit()
@@ -0,0 +1,80 @@
+import json
+import os
+import statistics
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+
+class HistoryStore:
+    # 执行历史：每次执行结束追加一行 JSON（history.jsonl），不需要重写整个文件
+    DURATION_SAMPLES = 20  # 每个任务保留的耗时样本数
+    DURATION_TAIL_BYTES = 1024 * 1024  # 第一次统计耗时只读取文件末尾的这部分
+
+    def __init__(self, path: str = "history.jsonl"):
+        self.path = path
+        # 各任务最近的执行耗时；记住已读取到的文件位置，之后只解析新追加的行
+        self.duration_samples: Dict[str, deque] = {}
+        self.duration_offset: Optional[int] = None
+
+    def append(self, record: Dict[str, Any]):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def load(self, task_id: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        # 按时间顺序返回记录，limit 只保留最近的若干条；损坏的行直接跳过
+        records = []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if task_id is None or record.get("task_id") == task_id:
+                        records.append(record)
+        except FileNotFoundError:
+            return []
+        return records[-limit:] if limit else records
+
+    def durations(self, recent: int = DURATION_SAMPLES) -> Dict[str, float]:
+        # 每个任务最近 recent 次（不超过 DURATION_SAMPLES）执行耗时（秒）的中位数，用于负载预测
+        self.update_durations()
+        return {task_id: statistics.median(list(values)[-recent:])
+                for task_id, values in self.duration_samples.items()}
+
+    def update_durations(self):
+        try:
+            with open(self.path, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                offset = self.duration_offset
+                if offset is None or offset > size:
+                    # 第一次统计或文件被截断：从末尾开始读，跳过被截断的第一行
+                    self.duration_samples = {}
+                    offset = max(0, size - self.DURATION_TAIL_BYTES)
+                    if offset:
+                        f.seek(offset - 1)
+                        offset += len(f.readline()) - 1
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # 还没写完的最后一行，下次再读
+                    offset += len(line)
+                    self.add_duration(line)
+        except FileNotFoundError:
+            self.duration_samples = {}
+            offset = None
+        self.duration_offset = offset
+
+    def add_duration(self, line: bytes):
+        try:
+            record = json.loads(line)
+            started = datetime.fromisoformat(record["started_at"])
+            finished = datetime.fromisoformat(record["finished_at"])
+        except (KeyError, TypeError, ValueError):
+            return
+        task_id = record.get("task_id")
+        values = self.duration_samples.get(task_id)
+        if values is None:
+            values = self.duration_samples[task_id] = deque(maxlen=self.DURATION_SAMPLES)
+        values.append(max(0.0, (finished - started).total_seconds()))
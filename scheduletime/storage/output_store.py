@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import threading
+import zlib
+from typing import Dict, List, Any, Optional
+
+
+class OutputStore:
+    # 命令输出存储：每个任务一个目录，输出按内容哈希压缩保存，相同的输出只保存一份；
+    # index.jsonl 记录每次执行引用的输出，查看时只读取索引和选中的那一份输出
+    CODECS = ("zlib", "lzma")
+
+    def __init__(self, root: str = "outputs", max_runs: int = 50, max_bytes: int = 5 * 1024 * 1024,
+                 compression: str = "zlib"):
+        self.root = root
+        self.max_runs = max_runs  # 每个任务保留的执行次数，0 表示不限
+        self.max_bytes = max_bytes  # 每个任务的输出占用的磁盘空间（压缩后），0 表示不限
+        self.compression = compression if compression in self.CODECS else "zlib"
+        self.lock = threading.Lock()  # 工作线程并行写入同一任务的索引时加锁
+
+    def task_dir(self, task_id: str) -> str:
+        return os.path.join(self.root, task_id)
+
+    def index_path(self, task_id: str) -> str:
+        return os.path.join(self.task_dir(task_id), "index.jsonl")
+
+    def blob_path(self, task_id: str, digest: str, codec: str) -> str:
+        return os.path.join(self.task_dir(task_id), "blobs", f"{digest}.{codec}")
+
+    def save(self, task_id: str, run_id: str, finished_at: Optional[str], returncode: Optional[int],
+             stdout: str, stderr: str, max_runs: int = 0, max_bytes: int = 0) -> Dict[str, Any]:
+        # max_runs/max_bytes 为任务自己的保留设置，0 表示使用默认值
+        with self.lock:
+            os.makedirs(self.task_dir(task_id), exist_ok=True)
+            record = {
+                "run_id": run_id,
+                "finished_at": finished_at,
+                "returncode": returncode,
+                "stdout": self.write_blob(task_id, stdout),
+                "stderr": self.write_blob(task_id, stderr)
+            }
+            with open(self.index_path(task_id), "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.enforce_retention(task_id, max_runs or self.max_runs, max_bytes or self.max_bytes)
+            return record
+
+    def write_blob(self, task_id: str, text: str) -> Optional[Dict[str, Any]]:
+        # 返回输出的引用：哈希、压缩方式、原始大小和压缩后大小；空输出不保存
+        if not text:
+            return None
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        blob_dir = os.path.join(self.task_dir(task_id), "blobs")
+        os.makedirs(blob_dir, exist_ok=True)
+
+        for codec in self.CODECS:
+            path = self.blob_path(task_id, digest, codec)
+            if os.path.exists(path):
+                return {"hash": digest, "codec": codec, "size": len(data), "stored": os.path.getsize(path)}
+
+        codec = self.compression
+        if codec == "lzma":
+            import lzma
+            compressed = lzma.compress(data)
+        else:
+            compressed = zlib.compress(data, 6)
+        path = self.blob_path(task_id, digest, codec)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(compressed)
+        os.replace(temp_path, path)
+        return {"hash": digest, "codec": codec, "size": len(data), "stored": len(compressed)}
+
+    def list_runs(self, task_id: str) -> List[Dict[str, Any]]:
+        # 只读取索引，按执行先后顺序返回
+        records = []
+        try:
+            with open(self.index_path(task_id), "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            return []
+        return records
+
+    def read(self, task_id: str, ref: Optional[Dict[str, Any]]) -> str:
+        if not ref:
+            return ""
+        try:
+            with open(self.blob_path(task_id, ref["hash"], ref["codec"]), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return ""
+        if ref["codec"] == "lzma":
+            import lzma
+            data = lzma.decompress(data)
+        else:
+            data = zlib.decompress(data)
+        return data.decode("utf-8", errors="replace")
+
+    def enforce_retention(self, task_id: str, max_runs: int, max_bytes: int):
+        # 从最新的执行往前保留，超出次数或磁盘占用后丢弃更早的记录，并删除不再被引用的输出
+        records = self.list_runs(task_id)
+        kept = []
+        referenced: Dict[str, int] = {}
+        total = 0
+        for record in reversed(records):
+            refs = [ref for ref in (record.get("stdout"), record.get("stderr")) if ref]
+            added = sum(ref["stored"] for ref in refs if ref["hash"] not in referenced)
+            if max_runs and len(kept) >= max_runs:
+                break
+            if max_bytes and kept and total + added > max_bytes:
+                break
+            total += added
+            for ref in refs:
+                referenced[ref["hash"]] = ref["stored"]
+            kept.append(record)
+
+        if len(kept) == len(records):
+            return
+        kept.reverse()
+        temp_path = self.index_path(task_id) + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for record in kept:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(temp_path, self.index_path(task_id))
+
+        blob_dir = os.path.join(self.task_dir(task_id), "blobs")
+        if not os.path.isdir(blob_dir):
+            return
+        for name in os.listdir(blob_dir):
+            if name.split(".", 1)[0] not in referenced:
+                try:
+                    os.remove(os.path.join(blob_dir, name))
+                except OSError:
+                    pass
+
+    def remove_task(self, task_id: str):
+        import shutil
+
+        with self.lock:
+            shutil.rmtree(self.task_dir(task_id), ignore_errors=True)
+
+    def task_usage(self, task_id: str) -> int:
+        # 任务输出占用的磁盘空间（字节）
+        blob_dir = os.path.join(self.task_dir(task_id), "blobs")
+        try:
+            return sum(entry.stat().st_size for entry in os.scandir(blob_dir))
+        except FileNotFoundError:
+            return 0
@@ -0,0 +1,90 @@
+import json
+import os
+import threading
+from typing import Dict, List, Any
+
+
+class RunJournal:
+    # 执行预写日志（runs.wal）：命令启动前写入“开始”记录，结束后写入“结束”记录，每条都 fsync。
+    # 程序异常退出后，只有开始记录而没有结束记录的执行就是被中断的执行。
+    # 已结束的记录超过 COMPACT_LINES 条时重写文件，只保留仍在执行和尚未确认的中断记录，
+    # 文件大小只与同时执行的数量有关，启动时恢复的耗时不随执行历史增长
+    COMPACT_LINES = 200
+
+    def __init__(self, path: str = "runs.wal"):
+        self.path = path
+        self.lock = threading.Lock()
+        self.open_runs: Dict[str, Dict[str, Any]] = {}
+        # recover 找到的中断记录：调用方写入执行历史并处理完成后 acknowledge，之前压缩时一直保留
+        self.unacknowledged: Dict[str, Dict[str, Any]] = {}
+        self.line_count = 0
+
+    def append(self, record: Dict[str, Any]):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.line_count += 1
+
+    def start(self, run_id: str, task_id: str, task_name: str, started_at: str):
+        record = {"event": "start", "run_id": run_id, "task_id": task_id,
+                  "task_name": task_name, "started_at": started_at}
+        with self.lock:
+            self.append(record)
+            self.open_runs[run_id] = record
+
+    def finish(self, run_id: str, finished_at: str):
+        with self.lock:
+            self.append({"event": "finish", "run_id": run_id, "finished_at": finished_at})
+            self.open_runs.pop(run_id, None)
+            if self.line_count > self.COMPACT_LINES:
+                self.compact()
+
+    def compact(self):
+        # 先写临时文件并 fsync，再原子替换，替换过程中断也不会丢失仍在执行的记录
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for record in list(self.unacknowledged.values()) + list(self.open_runs.values()):
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        if os.name != "nt":
+            directory = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_RDONLY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+        self.line_count = len(self.unacknowledged) + len(self.open_runs)
+
+    def recover(self) -> List[Dict[str, Any]]:
+        # 启动时调用：返回上次运行中没有结束记录的执行。这里不修改日志文件，
+        # 调用方把它们写入执行历史后再 acknowledge，期间程序再次崩溃也不会丢失
+        orphans: Dict[str, Dict[str, Any]] = {}
+        line_count = 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line_count += 1
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # 写入一半时断电留下的残缺行
+                    if record.get("event") == "start":
+                        orphans[record["run_id"]] = record
+                    elif record.get("event") == "finish":
+                        orphans.pop(record.get("run_id"), None)
+        except FileNotFoundError:
+            return []
+
+        with self.lock:
+            self.unacknowledged = dict(orphans)
+            self.line_count += line_count
+        return list(orphans.values())
+
+    def acknowledge(self, run_ids: List[str]):
+        # 中断的执行已写入执行历史（并按恢复策略处理）后调用，压缩时不再保留
+        with self.lock:
+            for run_id in run_ids:
+                self.unacknowledged.pop(run_id, None)
+            self.compact()
@@ -0,0 +1,22 @@
+import json
+from typing import Dict, Any
+
+
+class SettingsStore:
+    # 应用设置（资源池等）的 JSON 文件存储，与任务数据分开保存
+    def __init__(self, path: str = "settings.json"):
+        self.path = path
+
+    def load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+                return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            return {}
+
+    def save(self, settings: Dict[str, Any]):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(settings, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,162 @@
+import json
+import os
+from typing import Dict, List, Any, Optional, Tuple
+
+from ..core.task import Task
+from .file_lock import FileLock
+
+
+def merge_task_dicts(base: Dict[str, Dict[str, Any]], ours: List[Dict[str, Any]],
+                     theirs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # 按任务ID三方合并：base 为上次读写时的文件内容，ours 为程序中的任务，theirs 为当前文件内容。
+    # 只有一方修改的字段采用修改方的值，双方都修改的字段以程序中的为准；
+    # 一方删除而另一方没有修改的任务被删除，一方删除而另一方修改过的任务保留修改后的内容
+    theirs_by_id = {data["id"]: data for data in theirs if "id" in data}
+    ours_ids = set()
+    merged = []
+
+    for data in ours:
+        task_id = data["id"]
+        ours_ids.add(task_id)
+        base_data = base.get(task_id)
+        their_data = theirs_by_id.get(task_id)
+        if their_data is None:
+            if base_data is not None and data == base_data:
+                continue  # 外部删除了这个任务，程序中没有修改
+            merged.append(data)
+            continue
+        result = dict(data)
+        for key, value in their_data.items():
+            if base_data is None or data.get(key) == base_data.get(key):
+                result[key] = value
+        merged.append(result)
+
+    for task_id, their_data in theirs_by_id.items():
+        if task_id in ours_ids:
+            continue
+        base_data = base.get(task_id)
+        if base_data is not None and their_data == base_data:
+            continue  # 程序中删除了这个任务，外部没有修改
+        merged.append(their_data)
+    return merged
+
+
+class TaskChanges:
+    # 重新读取任务文件后与程序中任务的差异；updated 只包含定时或内容发生变化的任务，
+    # 只有执行记录（上次执行时间、执行次数）变化的任务放在 runtime_updated 中
+    RUNTIME_FIELDS = ("last_execution", "execution_count")
+
+    def __init__(self):
+        self.added: List[Task] = []
+        self.updated: List[Task] = []
+        self.runtime_updated: List[Task] = []
+        self.removed: List[Task] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.runtime_updated or self.removed)
+
+
+class TaskStore:
+    # 任务数据的 JSON 文件存储。写入时加文件锁并通过临时文件原子替换；
+    # 如果文件在上次读写之后被外部修改（其他进程或编辑器），先与外部内容合并再写入
+    def __init__(self, path: str = "tasks.json"):
+        self.path = path
+        self.lock_path = path + ".lock"
+        self.base: Dict[str, Dict[str, Any]] = {}
+        self.fingerprint: Optional[Tuple[int, int]] = None
+
+    def file_fingerprint(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def read_dicts(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    def load(self) -> List[Task]:
+        with FileLock(self.lock_path):
+            data = self.read_dicts()
+            self.fingerprint = self.file_fingerprint()
+        tasks = [Task.from_dict(task_data) for task_data in data]
+        # 合并基准按当前格式保存，旧版本文件中缺少的字段不会被误认为是修改
+        self.base = {task.id: task.to_dict() for task in tasks}
+        return tasks
+
+    def save(self, tasks: List[Task]) -> Optional[List[Task]]:
+        # 返回 None 表示直接写入；文件被外部修改过时返回合并后的任务列表，
+        # 程序中已有的任务对象会原地更新，调用方需要用返回的列表替换原来的列表
+        ours = [task.to_dict() for task in tasks]
+        merged_tasks = None
+        with FileLock(self.lock_path):
+            fingerprint = self.file_fingerprint()
+            if fingerprint is not None and fingerprint != self.fingerprint:
+                try:
+                    theirs = [Task.from_dict(task_data).to_dict() for task_data in self.read_dicts()]
+                except (ValueError, TypeError, AttributeError):
+                    theirs = None  # 外部写入了无法解析的内容，以程序中的任务为准
+                if theirs is not None:
+                    ours = merge_task_dicts(self.base, ours, theirs)
+                    merged_tasks = self.apply_merged(tasks, ours)
+
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(ours, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            self.fingerprint = self.file_fingerprint()
+        self.base = {task_data["id"]: task_data for task_data in ours}
+        return merged_tasks
+
+    def reload(self, tasks: List[Task]) -> Optional[Tuple[List[Task], TaskChanges]]:
+        # 文件被外部修改时重新读取，与程序中的任务合并并按任务ID计算差异；
+        # 文件没有变化（包括程序自己刚写入的内容）时不解析，返回 None
+        with FileLock(self.lock_path):
+            fingerprint = self.file_fingerprint()
+            if fingerprint is None or fingerprint == self.fingerprint:
+                return None
+            try:
+                theirs = [Task.from_dict(task_data).to_dict() for task_data in self.read_dicts()]
+            except (ValueError, TypeError, AttributeError, KeyError):
+                return None  # 外部程序可能还没写完，等下一次变化再读取
+            self.fingerprint = fingerprint
+
+        ours = {task.id: task.to_dict() for task in tasks}
+        merged = merge_task_dicts(self.base, list(ours.values()), theirs)
+        self.base = {task_data["id"]: task_data for task_data in theirs}
+
+        changes = TaskChanges()
+        merged_ids = {task_data["id"] for task_data in merged}
+        changes.removed = [task for task in tasks if task.id not in merged_ids]
+        result = self.apply_merged(tasks, merged)
+        for task, task_data in zip(result, merged):
+            old_data = ours.get(task.id)
+            if old_data is None:
+                changes.added.append(task)
+            elif old_data != task_data:
+                changed = {key for key in task_data if task_data.get(key) != old_data.get(key)}
+                if changed - set(TaskChanges.RUNTIME_FIELDS):
+                    changes.updated.append(task)
+                else:
+                    changes.runtime_updated.append(task)
+        return result, changes
+
+    @staticmethod
+    def apply_merged(tasks: List[Task], merged: List[Dict[str, Any]]) -> List[Task]:
+        # 保留已有任务对象（调度器和执行中的任务仍引用它们），只更新内容发生变化的任务
+        existing = {task.id: task for task in tasks}
+        result = []
+        for task_data in merged:
+            task = existing.get(task_data["id"])
+            if task is None:
+                task = Task.from_dict(task_data)
+            elif task.to_dict() != task_data:
+                task.__dict__.update(Task.from_dict(task_data).__dict__)
+            result.append(task)
+        return result
@@ -0,0 +1,76 @@
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import schedule
+
+from scheduletime.core import SimulatedClock
+from scheduletime.core.clock import ClockScheduler
+
+
+def replay(job_factory, start, end):
+    # 在模拟时钟上跳到每次触发时间，返回 (start, end] 内的全部触发
+    clock = SimulatedClock(start)
+    scheduler = ClockScheduler(clock)
+    fires = []
+    job = job_factory(scheduler).do(lambda: fires.append(clock.now()))
+    while scheduler.next_run is not None and scheduler.next_run <= end:
+        clock.advance_to(scheduler.next_run)
+        scheduler.run_pending()
+    return fires, job
+
+
+def test_monthly_day_skips_short_months():
+    fires, _ = replay(lambda s: s.every().monthly(31).at("08:00"), datetime(2023, 1, 1), datetime(2023, 12, 31, 23, 0))
+    assert [fire.month for fire in fires] == [1, 3, 5, 7, 8, 10, 12]
+    assert all(fire.day == 31 and fire.hour == 8 for fire in fires)
+
+
+def test_leap_day_fires_only_in_leap_years():
+    fires, _ = replay(lambda s: s.every().monthly(29).at("23:59"), datetime(2023, 1, 1), datetime(2025, 1, 1))
+    february = [fire for fire in fires if fire.month == 2]
+    assert february == [datetime(2024, 2, 29, 23, 59)]
+    assert len(fires) == 23
+
+
+def test_monthly_registered_after_todays_time_waits_a_month():
+    fires, _ = replay(lambda s: s.every().monthly(15).at("09:00"), datetime(2024, 1, 15, 10, 0),
+                      datetime(2024, 2, 16))
+    assert fires == [datetime(2024, 2, 15, 9, 0)]
+
+
+def test_start_date_delays_first_fire_and_keeps_phase():
+    fires, _ = replay(lambda s: s.every(7200).seconds.between(date(2024, 1, 3), None),
+                      datetime(2024, 1, 1, 0, 30), datetime(2024, 1, 3, 6, 0))
+    assert fires[0] == datetime(2024, 1, 3, 0, 30)
+    assert all((fire - fires[0]) % timedelta(hours=2) == timedelta(0) for fire in fires)
+
+
+def test_end_date_cancels_job_after_last_fire():
+    fires, job = replay(lambda s: s.every().day.at("12:00").between(None, date(2024, 2, 29)),
+                        datetime(2024, 2, 26), datetime(2024, 3, 10))
+    assert fires[-1] == datetime(2024, 2, 29, 12, 0)
+    assert len(fires) == 4
+    assert job.next_run is None and job not in job.scheduler.jobs
+
+
+def test_job_ending_before_first_fire_is_not_registered():
+    clock = SimulatedClock(datetime(2024, 3, 1, 13, 0))
+    scheduler = ClockScheduler(clock)
+    job = scheduler.every().day.at("12:00").between(None, date(2024, 3, 1)).do(lambda: None)
+    assert job.next_run is None
+    assert scheduler.jobs == []
+    assert scheduler.next_run is None
+
+
+def test_cancel_job_return_value_is_respected():
+    clock = SimulatedClock(datetime(2024, 1, 1))
+    scheduler = ClockScheduler(clock)
+    scheduler.every().hour.do(lambda: schedule.CancelJob)
+    clock.advance_to(datetime(2024, 1, 1, 1, 0))
+    scheduler.run_pending()
+    assert scheduler.jobs == []
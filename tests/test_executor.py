@@ -0,0 +1,118 @@
+import os
+import sys
+import time
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from scheduletime.core import Task, TaskExecutor, OverlapPolicy, ResourcePool
+
+
+@pytest.fixture
+def app():
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+
+@pytest.fixture
+def executor(app):
+    executor = TaskExecutor()
+    executor.run_finished.connect(executor.complete)
+    yield executor
+    executor.shutdown()
+
+
+def wait_idle(app, executor, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while executor.active_count() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    assert executor.active_count() == 0
+
+
+def make_task(command, policy=OverlapPolicy.SKIP, max_overlap=1):
+    task = Task()
+    task.id = "overlap-test"
+    task.cmd_command = command
+    task.overlap_policy = policy
+    task.max_overlap = max_overlap
+    return task
+
+
+def test_skip_policy_drops_overlapping_fire(app, executor):
+    task = make_task("sleep 0.3", OverlapPolicy.SKIP)
+    assert executor.submit(task) is not None
+    assert executor.submit(task) is None
+    wait_idle(app, executor)
+
+
+def test_queue_policy_runs_fires_in_order(app, executor):
+    task = make_task("sleep 0.2", OverlapPolicy.QUEUE, max_overlap=1)
+    first = executor.submit(task)
+    queued = executor.submit(task)
+    assert queued is not None and queued.state == "queued"
+    assert executor.submit(task) is None  # 队列已满
+    assert executor.in_flight(task.id) == 2
+    wait_idle(app, executor)
+    assert first.started_at < queued.started_at
+    assert queued.returncode == 0
+
+
+def test_parallel_policy_limits_concurrency(app, executor):
+    task = make_task("sleep 0.3", OverlapPolicy.PARALLEL, max_overlap=2)
+    assert executor.submit(task) is not None
+    assert executor.submit(task) is not None
+    assert executor.submit(task) is None
+    wait_idle(app, executor)
+
+
+def test_cancel_policy_replaces_running_fire(app, executor):
+    task = make_task("sleep 5", OverlapPolicy.CANCEL)
+    old = executor.submit(task)
+    deadline = time.monotonic() + 5
+    while old.process is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    task.cmd_command = "echo new"
+    new = executor.submit(task)
+    wait_idle(app, executor)
+    assert old.cancelled
+    assert new.stdout.strip() == "new"
+
+
+def test_resource_pool_limits_concurrency_across_tasks(app, executor):
+    executor.set_resource_pools([ResourcePool("db", max_concurrency=1)])
+    first, second = make_task("sleep 0.2"), make_task("sleep 0.2")
+    second.id = "overlap-test-2"
+    first.resource_pool = second.resource_pool = "db"
+    first_run = executor.submit(first)
+    second_run = executor.submit(second)
+    assert first_run.state == "running"
+    assert second_run.state == "waiting"
+    wait_idle(app, executor)
+    assert second_run.started_at >= first_run.finished_at
+    assert executor.resource_pools["db"].running == 0
+    assert executor.resource_pools["db"].wait_count == 2
+
+
+def test_cancel_between_check_and_popen_does_not_start_command(app, executor, tmp_path):
+    # 在启动检查与 Popen 之间取消（这里借助执行日志的回调制造这个时间窗口），命令不能再启动
+    marker = tmp_path / "started"
+    task = make_task(f"touch {marker}")
+    class CancellingJournal:
+        def start(self, run_id, *args):
+            executor.cancel(executor.active_runs[run_id])
+
+        def finish(self, *args):
+            pass
+
+    executor.journal = CancellingJournal()
+    run = executor.submit(task)
+    wait_idle(app, executor)
+    assert run.cancelled
+    assert run.process is None
+    assert not marker.exists()
@@ -0,0 +1,95 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from PyQt6.QtCore import QDate, QTime
+
+from scheduletime.core import Task, TaskType, TaskStatus
+from scheduletime.core.forecast import ForecastBuilder, quantize_duration
+from scheduletime.core.jitter import JitterSettings
+
+START = datetime(2030, 3, 1, 8, 0, 0)
+
+
+def make_task(task_id, schedule_type="interval", interval=60, cmd=False):
+    task = Task()
+    task.id = task_id
+    task.schedule_type = schedule_type
+    task.interval_seconds = interval
+    task.daily_time = QTime(9, 30)
+    task.start_date = QDate(2030, 1, 1)
+    task.end_date = QDate(2030, 12, 31)
+    if cmd:
+        task.task_type = TaskType.CMD
+    return task
+
+
+def naive_forecast(tasks, first_runs, minutes, durations):
+    # 逐次展开、逐秒累计占用，作为前缀和实现的对照
+    horizon = minutes * 60
+    run_counts = [0] * minutes
+    busy = [0] * minutes
+    for task in tasks:
+        offset = int((first_runs[task.id] - START).total_seconds())
+        duration = quantize_duration(durations[task.id]) if task.task_type == TaskType.CMD else 0
+        for second in range(offset, horizon, task.interval_seconds):
+            run_counts[second // 60] += 1
+            for busy_second in range(second, min(second + duration, horizon)):
+                busy[busy_second // 60] += 1
+    return run_counts, busy
+
+
+def test_quantize_duration():
+    assert quantize_duration(0) == 1
+    assert quantize_duration(42.1) == 43
+    assert quantize_duration(61) == 70
+    assert quantize_duration(601) == 660
+
+
+@pytest.mark.parametrize("count", [1, 400])
+def test_interval_groups_match_naive_expansion(count):
+    # count 较大时走周期分组的前缀和路径，较小时逐次展开，两者都要与逐秒计算一致
+    tasks = [make_task(f"t{i}", interval=90, cmd=True) for i in range(count)]
+    first_runs = {task.id: START + timedelta(seconds=7 + (i * 37) % 200) for i, task in enumerate(tasks)}
+    durations = {task.id: 75.0 for task in tasks}
+    forecast = ForecastBuilder().build(tasks, START, 2, first_runs, durations)
+    run_counts, busy = naive_forecast(tasks, first_runs, 120, durations)
+    assert forecast.run_counts == run_counts
+    assert forecast.busy_seconds == pytest.approx(busy)
+
+
+def test_daily_and_monthly_runs_are_expanded():
+    daily = make_task("daily", "daily")
+    monthly = make_task("monthly", "monthly")
+    monthly.monthly_day = 31
+    forecast = ForecastBuilder().build([daily, monthly], START, 24 * 62)
+    fires = [forecast.minute_at(minute) for minute, count in enumerate(forecast.run_counts) for _ in range(count)]
+    assert sum(1 for fire in fires if fire.time() == datetime(2030, 1, 1, 9, 30).time()) == forecast.total_runs
+    # 3 月 1 日 9:30 起 62 天内每天一次；每月 31 日只有 3 月 31 日
+    assert forecast.total_runs == 62 + 1
+
+
+def test_skips_disabled_out_of_window_and_event_tasks():
+    disabled = make_task("disabled")
+    disabled.status = TaskStatus.DISABLED
+    expired = make_task("expired")
+    expired.end_date = QDate(2030, 2, 1)
+    event = make_task("event", "file_change")
+    forecast = ForecastBuilder().build([disabled, expired, event], START, 1)
+    assert forecast.total_runs == 0
+    assert forecast.task_count == 0
+    assert forecast.skipped_count == 1
+
+
+def test_upcoming_runs_are_ordered_and_limited():
+    tasks = [make_task("fast", interval=60), make_task("slow", interval=150)]
+    runs = ForecastBuilder(JitterSettings(spread_intervals=False)).upcoming_runs(tasks, START, 1, limit=10)
+    assert len(runs) == 10
+    assert [fire for fire, _ in runs] == sorted(fire for fire, _ in runs)
+    assert runs[0] == (START + timedelta(seconds=60), tasks[0])
@@ -0,0 +1,50 @@
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from scheduletime.core import Task, TaskGraph
+
+
+def make_task(task_id, depends_on=()):
+    task = Task()
+    task.id = task_id
+    task.depends_on = list(depends_on)
+    return task
+
+
+def test_find_cycle_returns_none_for_dag():
+    assert TaskGraph.find_cycle({"a": ["b", "c"], "b": ["c"], "c": []}) is None
+
+
+def test_find_cycle_returns_closed_path():
+    cycle = TaskGraph.find_cycle({"a": ["b"], "b": ["c"], "c": ["a"]})
+    assert cycle[0] == cycle[-1]
+    assert set(cycle) == {"a", "b", "c"}
+
+
+def test_find_cycle_detects_self_loop_and_ignores_unknown_ids():
+    assert TaskGraph.find_cycle({"a": ["missing"]}) is None
+    assert TaskGraph.find_cycle({"a": ["a"]}) == ["a", "a"]
+
+
+def test_find_cycle_handles_deep_chains_without_recursion():
+    size = 5000
+    chain = {str(i): [str(i + 1)] for i in range(size)}
+    chain[str(size)] = []
+    assert TaskGraph.find_cycle(chain) is None
+    chain[str(size)] = ["0"]
+    assert len(TaskGraph.find_cycle(chain)) == size + 2
+
+
+def test_build_breaks_cycles_and_triggers_downstream():
+    graph = TaskGraph()
+    graph.build([make_task("a", ["c"]), make_task("b", ["a"]), make_task("c", ["b"]), make_task("d", ["a", "b"])])
+    assert TaskGraph.find_cycle(graph.upstreams) is None
+
+    ready = [task.id for task in graph.on_task_succeeded("a")]
+    assert "d" not in ready
+    ready += [task.id for task in graph.on_task_succeeded("b")]
+    assert "d" in ready
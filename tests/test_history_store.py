@@ -0,0 +1,63 @@
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from scheduletime.storage import HistoryStore
+
+
+def record(task_id, seconds):
+    started = datetime(2030, 1, 1, 12, 0, 0)
+    return {"task_id": task_id, "started_at": started.isoformat(),
+            "finished_at": (started + timedelta(seconds=seconds)).isoformat()}
+
+
+def test_durations_use_median_of_recent_runs(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.jsonl"))
+    for seconds in [100, 1, 2, 3]:
+        store.append(record("a", seconds))
+    store.append(record("b", 7))
+    assert store.durations(recent=3) == {"a": 2.0, "b": 7.0}
+
+
+def test_durations_read_only_new_lines(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.jsonl"))
+    store.append(record("a", 10))
+    assert store.durations() == {"a": 10.0}
+    offset = store.duration_offset
+
+    with open(store.path, "a", encoding="utf-8") as f:
+        f.write("not json\n")
+        f.write(json.dumps(record("a", 30)) + "\n")
+        f.write(json.dumps(record("a", 99))[:10])  # 还没写完的行
+    assert store.durations() == {"a": 20.0}
+    assert store.duration_offset > offset
+    assert store.duration_offset < os.path.getsize(store.path)
+
+
+def test_samples_are_bounded_and_first_read_uses_tail(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.jsonl"))
+    store.DURATION_TAIL_BYTES = 2000
+    for i in range(200):
+        store.append(record(f"old-{i}", 1))
+    for i in range(30):
+        store.append(record("recent", i))
+    durations = store.durations()
+    assert "old-0" not in durations
+    assert len(store.duration_samples["recent"]) == HistoryStore.DURATION_SAMPLES
+    assert durations["recent"] == 19.5
+
+
+def test_truncated_file_is_reread(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.jsonl"))
+    store.append(record("a", 10))
+    store.append(record("a", 20))
+    store.durations()
+    os.remove(store.path)
+    assert store.durations() == {}
+    store.append(record("b", 5))
+    assert store.durations() == {"b": 5.0}
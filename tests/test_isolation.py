@@ -0,0 +1,59 @@
+import os
+import signal
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from scheduletime.core import Task, FailureKind
+from scheduletime.core.isolation import classify_failure, terminating_signal
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="资源限制信号只在 POSIX 系统上出现")
+
+
+def make_task(cpu=0, memory=0, files=0):
+    task = Task()
+    task.id = "isolation-test"
+    task.isolated = True
+    task.cpu_limit_seconds = cpu
+    task.memory_limit_mb = memory
+    task.open_files_limit = files
+    return task
+
+
+def test_terminating_signal_decodes_shell_and_popen_codes():
+    assert terminating_signal(-9) == 9
+    assert terminating_signal(128 + 24) == 24
+    assert terminating_signal(1) is None
+
+
+def test_success_error_and_plain_exit_code():
+    task = make_task()
+    assert classify_failure(task, 0, "", None, False) is None
+    assert classify_failure(task, None, "", "not found", False) == FailureKind.ERROR
+    assert classify_failure(task, 3, "", None, False) == FailureKind.EXIT_CODE
+
+
+def test_cancelled_run_is_never_a_limit_failure():
+    task = make_task(cpu=5, memory=64)
+    assert classify_failure(task, -signal.SIGKILL, "", None, True) == FailureKind.CANCELLED
+    assert classify_failure(task, -signal.SIGXCPU, "", None, True) == FailureKind.CANCELLED
+
+
+def test_cpu_limit_only_on_sigxcpu():
+    task = make_task(cpu=5)
+    assert classify_failure(task, -signal.SIGXCPU, "", None, False) == FailureKind.CPU_LIMIT
+    assert classify_failure(task, 128 + signal.SIGXCPU, "", None, False) == FailureKind.CPU_LIMIT
+    assert classify_failure(task, -signal.SIGKILL, "", None, False) == FailureKind.EXIT_CODE
+    assert classify_failure(make_task(), -signal.SIGXCPU, "", None, False) == FailureKind.EXIT_CODE
+
+
+def test_memory_and_files_limits():
+    assert classify_failure(make_task(memory=64), 1, "MemoryError", None, False) == FailureKind.MEMORY_LIMIT
+    assert classify_failure(make_task(memory=64), -signal.SIGSEGV, "", None, False) == FailureKind.MEMORY_LIMIT
+    assert classify_failure(make_task(files=16), 1, "OSError: Too many open files", None,
+                            False) == FailureKind.FILES_LIMIT
+    assert classify_failure(make_task(), 1, "MemoryError", None, False) == FailureKind.EXIT_CODE
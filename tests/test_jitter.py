@@ -0,0 +1,65 @@
+import os
+import sys
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from PyQt6.QtCore import QTime
+
+from scheduletime.core import Task
+from scheduletime.core.jitter import JitterSettings, stable_fraction
+
+
+def make_task(task_id, schedule_type="daily", hour=9, interval=60):
+    task = Task()
+    task.id = task_id
+    task.schedule_type = schedule_type
+    task.daily_time = QTime(hour, 0)
+    task.interval_seconds = interval
+    return task
+
+
+def test_offsets_are_stable_across_instances():
+    task = make_task("jitter-a")
+    first = JitterSettings(window_seconds=600).offset_for(task)
+    second = JitterSettings(window_seconds=600).offset_for(task)
+    assert first == second
+    assert 0 <= first < 600
+
+
+def test_salt_changes_offsets():
+    tasks = [make_task(f"jitter-{i}") for i in range(20)]
+    plain = [JitterSettings(600).offset_for(task) for task in tasks]
+    salted = [JitterSettings(600, salt="x").offset_for(task) for task in tasks]
+    assert plain != salted
+
+
+def test_offsets_spread_across_window():
+    offsets = {JitterSettings(600).offset_for(make_task(f"jitter-{i}")) for i in range(200)}
+    assert len(offsets) > 150
+
+
+def test_offset_never_crosses_midnight_and_respects_task_override():
+    late = make_task("jitter-late", hour=23)
+    assert JitterSettings(7200).offset_for(late) < 3600
+    late.jitter_seconds = 0
+    assert JitterSettings(7200).offset_for(late) == 0
+    assert JitterSettings(600).offset_for(make_task("jitter-interval", "interval")) == 0
+
+
+def test_interval_phase_is_deterministic():
+    task = make_task("jitter-phase", "interval", interval=300)
+    now = datetime(2030, 1, 1, 12, 0, 0)
+    settings = JitterSettings(spread_intervals=True)
+    first = settings.first_interval_run(task, now)
+    assert first == settings.first_interval_run(task, now)
+    assert 0 < (first - now).total_seconds() <= 300
+    phase = stable_fraction(task.id) * 300
+    assert abs((first.timestamp() - phase) % 300) < 1e-3 or abs((first.timestamp() - phase) % 300 - 300) < 1e-3
+
+
+def test_interval_without_spread_or_window_uses_default():
+    task = make_task("jitter-default", "interval")
+    assert JitterSettings(0, spread_intervals=False).first_interval_run(task) is None
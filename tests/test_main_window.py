@@ -0,0 +1,200 @@
+"""主窗口测试：尽量通过真实的信号和批量操作入口驱动，而不是直接调用内部方法"""
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+
+@pytest.fixture
+def slot_errors(monkeypatch):
+    # PyQt6 在槽函数抛出异常且未设置 sys.excepthook 时直接终止进程，这里改为收集异常
+    errors = []
+    monkeypatch.setattr(sys, "excepthook", lambda *exc_info: errors.append(exc_info[1]))
+    return errors
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    # TaskManager 使用当前目录下的 tasks.json 等文件，切换到临时目录避免覆盖真实数据
+    monkeypatch.chdir(tmp_path)
+    from scheduletime.gui.main_window import TaskManager
+
+    window = TaskManager()
+    yield window
+    window.quit_application()
+    window.scheduler.stop()
+    app.processEvents()
+
+
+def test_refresh_button_click(manager, slot_errors):
+    manager.refresh_button.click()
+    assert slot_errors == []
+    assert manager.status_label.text() == "任务已刷新"
+
+
+def test_filter_combos_change(manager, slot_errors):
+    for combo in (manager.status_filter_combo, manager.type_filter_combo, manager.schedule_filter_combo):
+        combo.setCurrentIndex(1)
+        combo.setCurrentIndex(0)
+    assert slot_errors == []
+    assert manager.status_label.text().startswith("显示")
+
+
+def test_due_filter_keeps_debounce_interval(manager, slot_errors):
+    manager.due_filter_spin.setValue(5)
+    manager.search_edit.setText("备份")
+    assert slot_errors == []
+    assert manager.filter_timer.interval() == 200
+    assert manager.filter_timer.isActive()
+
+
+def test_bulk_move_to_group_updates_search(manager):
+    from scheduletime.core import Task
+
+    tasks = []
+    for i in range(3):
+        task = Task()
+        task.id = f"group-test-{i}"
+        task.name = f"分组测试 {i}"
+        tasks.append(task)
+    manager.tasks = tasks
+    manager.refresh_tasks()
+    manager.search_edit.setText("zzgroup")
+    manager.filter_tasks()
+    assert manager.task_proxy.rowCount() == 0
+
+    for task in tasks[:2]:
+        task.group = "zzgroup"
+    manager.apply_bulk(tasks[:2], [], "已移动")
+    manager.filter_tasks()
+    assert manager.task_proxy.rowCount() == 2
+
+
+def test_recovery_rerun_respects_pause(manager, monkeypatch):
+    from scheduletime.core import Task, TaskType, RecoveryPolicy
+
+    task = Task()
+    task.id = "recover-test"
+    task.name = "恢复测试"
+    task.task_type = TaskType.CMD
+    task.cmd_command = "echo recovered"
+    task.recovery_policy = RecoveryPolicy.RERUN
+    manager.tasks = [task]
+    executed = []
+    monkeypatch.setattr(manager, "execute_task", executed.append)
+    manager.interrupted_runs = [{"run_id": "orphan", "task_id": task.id, "task_name": task.name, "started_at": None}]
+    manager.journal_recovered = False
+    manager.scheduler.pause()
+
+    manager.recover_interrupted_runs()
+    assert executed == []
+    assert manager.scheduler.missed == {task.id: 1}
+
+
+def test_journal_attached_before_scheduler_starts(manager):
+    # 托盘模式下调度线程可能在任务加载之前就触发执行，执行日志必须在启动调度器之前挂上
+    assert manager.executor.journal is manager.journal
+
+
+def test_fires_coalesce_task_file_writes(manager, monkeypatch):
+    from scheduletime.core import Task
+
+    task = Task()
+    task.id = "save-test"
+    task.name = "保存测试"
+    manager.tasks = [task]
+    manager.refresh_tasks()
+    writes = []
+    save = manager.store.save
+    monkeypatch.setattr(manager.store, "save", lambda tasks: writes.append(len(tasks)) or save(tasks))
+    monkeypatch.setattr(manager, "execute_notification_task", lambda task: None)
+
+    for _ in range(5):
+        manager.execute_task(task)
+    assert writes == []
+    assert manager.save_timer.isActive()
+    assert task.execution_count == 5
+
+    manager.quit_application()
+    assert writes == [1]
+    assert not manager.save_timer.isActive()
+
+
+def test_single_task_edits_do_not_reschedule_everything(manager, monkeypatch):
+    from PyQt6.QtWidgets import QDialog
+    from scheduletime.core import Task
+    from scheduletime.gui import dialogs
+
+    existing = Task()
+    existing.id = "existing"
+    existing.schedule_type = "interval"
+    manager.tasks = [existing]
+    manager.on_tasks_changed()
+    manager.refresh_tasks()
+    existing_job = manager.scheduler.scheduled_jobs[existing.id]
+
+    created = Task()
+    created.id = "created"
+    created.schedule_type = "interval"
+
+    class FakeDialog:
+        def __init__(self, task=None, **kwargs):
+            self.task = task or created
+
+        def exec(self):
+            return QDialog.DialogCode.Accepted
+
+        def get_task_data(self):
+            self.task.interval_seconds = 120
+            return self.task
+
+    monkeypatch.setattr(dialogs, "TaskEditDialog", FakeDialog)
+    monkeypatch.setattr(manager.scheduler, "reschedule_all", lambda: pytest.fail("不应整体重新调度"))
+
+    manager.new_task()
+    assert "created" in manager.scheduler.scheduled_jobs
+    assert manager.scheduler.scheduled_jobs[existing.id] is existing_job
+    assert manager.task_model.rowCount() == 2
+
+    row = [task.id for task in manager.tasks].index("created")
+    manager.edit_task_on_double_click(manager.task_proxy.index(row, 0))
+    assert manager.scheduler.scheduled_jobs["created"].interval == 120
+    assert manager.scheduler.scheduled_jobs[existing.id] is existing_job
+
+
+def test_countdown_refreshes_visible_group_rows(manager):
+    from scheduletime.core import Task
+    from scheduletime.gui.models import TaskTableModel
+
+    tasks = []
+    for i in range(300):
+        task = Task()
+        task.id = f"countdown-{i}"
+        task.group = "a" if i < 200 else "b"
+        tasks.append(task)
+    manager.tasks = tasks
+    manager.refresh_tasks()
+    manager.show()
+    manager.group_view_combo.setCurrentIndex(manager.group_view_combo.findData("group"))
+    manager.group_tree.expand(manager.group_model.index(0, 0))
+
+    changed = []
+    manager.group_model.dataChanged.connect(
+        lambda top_left, bottom_right: changed.append((manager.group_model.task_at(top_left), top_left.column())))
+    manager.refresh_next_run_times()
+
+    assert changed and all(column == TaskTableModel.NEXT_RUN_COLUMN for _, column in changed)
+    assert changed[0][0] is None  # 第一个分组的汇总行
+    refreshed = [task for task, _ in changed if task is not None]
+    assert refreshed[0] is tasks[0]
+    assert 0 < len(refreshed) < 200
+
@@ -0,0 +1,120 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from scheduletime.core import Task, TaskStatus
+from scheduletime.gui.models import TaskTableModel, TaskFilterProxyModel, TaskGroupModel
+
+
+@pytest.fixture
+def app():
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+
+def make_tasks(count, group="备份"):
+    tasks = []
+    for i in range(count):
+        task = Task()
+        task.id = f"model-{i}"
+        task.name = f"任务 {i}"
+        task.group = group
+        task.schedule_type = "daily"
+        tasks.append(task)
+    return tasks
+
+
+@pytest.fixture
+def models(app):
+    task_model = TaskTableModel()
+    proxy = TaskFilterProxyModel()
+    proxy.setSourceModel(task_model)
+    group_model = TaskGroupModel(task_model, proxy)
+    return task_model, proxy, group_model
+
+
+def test_group_summary_is_cached_until_tasks_change(models):
+    task_model, proxy, group_model = models
+    tasks = make_tasks(3)
+    task_model.set_tasks(tasks)
+    task_model.update_next_runs({task.id: datetime(2030, 1, 2, 3, 4, 5) for task in tasks}, True)
+    group_model.rebuild()
+
+    calls = []
+    compute = group_model.compute_summary
+    group_model.compute_summary = lambda group, column: calls.append(column) or compute(group, column)
+    cell = group_model.index(0, TaskTableModel.NEXT_RUN_COLUMN)
+    assert group_model.data(cell) == "2030-01-02 03:04:05"
+    assert group_model.data(cell) == "2030-01-02 03:04:05"
+    assert calls == [TaskTableModel.NEXT_RUN_COLUMN]
+
+    # 调度器发布新的执行时间（apply_changes 之后）使所在分组的缓存失效
+    task_model.update_next_runs({tasks[1].id: datetime(2030, 1, 1, 0, 0, 0)})
+    assert group_model.data(cell) == "2030-01-01 00:00:00"
+    assert len(calls) == 2
+
+
+def test_refresh_rows_invalidates_only_given_groups(models):
+    task_model, proxy, group_model = models
+    tasks = make_tasks(2, "a") + make_tasks(1, "b")
+    tasks[2].id = "model-b"
+    task_model.set_tasks(tasks)
+    group_model.rebuild()
+    column = TaskTableModel.NEXT_RUN_COLUMN
+    for row in range(group_model.rowCount()):
+        group_model.data(group_model.index(row, column))
+
+    changed = []
+    group_model.dataChanged.connect(lambda top_left, bottom_right: changed.append((top_left.row(), top_left.column())))
+    group_model.refresh_rows([group_model.index(0, 0)], column)
+    assert column not in group_model.groups[0].summaries
+    assert column in group_model.groups[1].summaries
+    assert changed == [(0, column)]
+
+
+def test_filter_precomputes_matching_rows(models):
+    task_model, proxy, _ = models
+    tasks = make_tasks(6)
+    for task in tasks[3:]:
+        task.status = TaskStatus.DISABLED
+    tasks[4].name = "夜间同步"
+    task_model.set_tasks(tasks)
+
+    proxy.set_filters(search_text="同步", status=TaskStatus.DISABLED)
+    assert proxy.accepted_rows == {4}
+    assert proxy.rowCount() == 1
+
+    # 重新过滤只做集合查找，不再逐行判断任务字段
+    proxy.row_matches = lambda row: pytest.fail("filterAcceptsRow 不应逐行判断")
+    proxy.invalidateFilter()
+    assert proxy.rowCount() == 1
+
+
+def test_filter_follows_changed_rows_and_resets(models):
+    task_model, proxy, _ = models
+    tasks = make_tasks(4)
+    task_model.set_tasks(tasks)
+    proxy.set_filters(status=TaskStatus.ENABLED)
+    assert proxy.rowCount() == 4
+
+    tasks[1].status = TaskStatus.DISABLED
+    task_model.update_task(tasks[1].id)
+    assert proxy.accepted_rows == {0, 2, 3}
+    assert proxy.rowCount() == 3
+
+    task_model.set_tasks(tasks[:2])
+    assert proxy.accepted_rows == {0}
+    assert proxy.rowCount() == 1
+
+    proxy.set_filters()
+    assert proxy.accepted_rows is None
+    assert proxy.rowCount() == 2
+
@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from scheduletime.storage import OutputStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return OutputStore(str(tmp_path / "outputs"), max_runs=0, max_bytes=0)
+
+
+def blob_names(store, task_id):
+    return sorted(os.listdir(os.path.join(store.task_dir(task_id), "blobs")))
+
+
+def test_identical_output_is_stored_once(store):
+    first = store.save("t", "r1", None, 0, "same output\n" * 100, "")
+    second = store.save("t", "r2", None, 0, "same output\n" * 100, "")
+    assert first["stdout"]["hash"] == second["stdout"]["hash"]
+    assert first["stderr"] is None
+    assert len(blob_names(store, "t")) == 1
+    assert [record["run_id"] for record in store.list_runs("t")] == ["r1", "r2"]
+    assert store.read("t", second["stdout"]) == "same output\n" * 100
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_round_trip_with_each_codec(tmp_path, codec):
+    store = OutputStore(str(tmp_path), compression=codec)
+    record = store.save("t", "r1", None, 1, "输出", "错误")
+    assert record["stdout"]["codec"] == codec
+    assert store.read("t", record["stdout"]) == "输出"
+    assert store.read("t", record["stderr"]) == "错误"
+
+
+def test_max_runs_drops_oldest_and_unreferenced_blobs(store):
+    for i in range(5):
+        store.save("t", f"r{i}", None, 0, f"output {i}", "", max_runs=2)
+    assert [record["run_id"] for record in store.list_runs("t")] == ["r3", "r4"]
+    assert len(blob_names(store, "t")) == 2
+
+
+def test_shared_blob_survives_while_referenced(store):
+    store.save("t", "r1", None, 0, "shared", "", max_runs=2)
+    store.save("t", "r2", None, 0, "other", "", max_runs=2)
+    record = store.save("t", "r3", None, 0, "shared", "", max_runs=2)
+    assert [run["run_id"] for run in store.list_runs("t")] == ["r2", "r3"]
+    assert store.read("t", record["stdout"]) == "shared"
+
+
+def test_max_bytes_keeps_at_least_latest_run(store):
+    payload = os.urandom(4096).hex()
+    for i in range(3):
+        store.save("t", f"r{i}", None, 0, payload + str(i), "", max_bytes=100)
+    assert [record["run_id"] for record in store.list_runs("t")] == ["r2"]
+    assert store.task_usage("t") > 100
+
+
+def test_remove_task_and_missing_blob(store):
+    record = store.save("t", "r1", None, 0, "text", "")
+    store.remove_task("t")
+    assert store.list_runs("t") == []
+    assert store.read("t", record["stdout"]) == ""
+    assert store.task_usage("t") == 0
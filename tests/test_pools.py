@@ -0,0 +1,63 @@
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from scheduletime.core import ResourcePool
+
+
+def test_concurrency_limit_blocks_until_release():
+    pool = ResourcePool("db", max_concurrency=2)
+    assert pool.try_acquire() == 0
+    assert pool.try_acquire() == 0
+    assert pool.try_acquire() is None
+    pool.release()
+    assert pool.try_acquire() == 0
+    assert pool.running == 2
+
+
+def test_release_never_goes_negative():
+    pool = ResourcePool("db")
+    pool.release()
+    assert pool.running == 0
+
+
+def test_rate_limit_allows_burst_then_reports_delay():
+    pool = ResourcePool("api", max_concurrency=10, rate_per_minute=60, burst=2)
+    pool.refilled_at = 100.0
+    assert pool.try_acquire(now=100.0) == 0
+    assert pool.try_acquire(now=100.0) == 0
+    assert pool.try_acquire(now=100.0) == pytest.approx(1.0)
+    # 一秒后补充一个令牌
+    assert pool.try_acquire(now=101.0) == 0
+    assert pool.running == 3
+
+
+def test_refill_is_capped_at_burst():
+    pool = ResourcePool("api", max_concurrency=10, rate_per_minute=60, burst=2)
+    pool.tokens = 0.0
+    pool.refilled_at = 0.0
+    pool.refill(3600.0)
+    assert pool.tokens == 2.0
+
+
+def test_configure_keeps_running_count_and_stats():
+    pool = ResourcePool("db", max_concurrency=1, burst=5)
+    pool.try_acquire()
+    pool.record_wait(2.0)
+    pool.record_wait(4.0)
+    pool.configure(ResourcePool("db", max_concurrency=3, rate_per_minute=30, burst=2))
+    assert (pool.max_concurrency, pool.rate_per_minute, pool.burst) == (3, 30, 2)
+    assert pool.tokens == 2.0
+    assert pool.running == 1
+    assert pool.average_wait == 3.0 and pool.max_wait == 4.0
+
+
+def test_from_dict_clamps_invalid_values():
+    pool = ResourcePool.from_dict({"name": "db", "max_concurrency": 0, "rate_per_minute": -5, "burst": 0})
+    assert (pool.max_concurrency, pool.rate_per_minute, pool.burst) == (1, 0.0, 1)
+    assert ResourcePool.from_dict(pool.to_dict()).to_dict() == pool.to_dict()
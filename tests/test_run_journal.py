@@ -0,0 +1,52 @@
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from scheduletime.storage import RunJournal
+
+
+def read_records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_recover_skips_torn_lines(tmp_path):
+    path = str(tmp_path / "runs.wal")
+    journal = RunJournal(path)
+    journal.start("a", "task-1", "甲", "2024-01-01T00:00:00")
+    journal.start("b", "task-2", "乙", "2024-01-01T00:00:01")
+    journal.finish("a", "2024-01-01T00:00:02")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"event": "start", "run_id": "c", "task_')  # 写入一半时断电
+
+    orphans = RunJournal(path).recover()
+    assert [record["run_id"] for record in orphans] == ["b"]
+
+
+def test_recover_keeps_orphans_until_acknowledged(tmp_path):
+    path = str(tmp_path / "runs.wal")
+    RunJournal(path).start("orphan", "task-1", "甲", "")
+
+    journal = RunJournal(path)
+    assert [record["run_id"] for record in journal.recover()] == ["orphan"]
+    # 恢复本身不修改日志：此时崩溃，下次启动仍能找到中断的执行
+    assert [record["run_id"] for record in RunJournal(path).recover()] == ["orphan"]
+
+    # 新的执行触发压缩时，尚未确认的中断记录仍然保留
+    journal.COMPACT_LINES = 2
+    for i in range(3):
+        journal.start(f"run-{i}", "task-2", "乙", "")
+        journal.finish(f"run-{i}", "")
+    assert [record["run_id"] for record in read_records(path)] == ["orphan"]
+
+    journal.acknowledge(["orphan"])
+    assert read_records(path) == []
+    assert RunJournal(path).recover() == []
+
+
+def test_recover_missing_file(tmp_path):
+    assert RunJournal(str(tmp_path / "missing.wal")).recover() == []
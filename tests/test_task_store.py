@@ -0,0 +1,73 @@
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from scheduletime.core import Task
+from scheduletime.storage import TaskStore
+from scheduletime.storage.task_store import merge_task_dicts
+
+
+def by_id(merged):
+    return {data["id"]: data for data in merged}
+
+
+def test_one_sided_edits_are_kept():
+    base = {"a": {"id": "a", "name": "A", "command": "x"}}
+    ours = [{"id": "a", "name": "A2", "command": "x"}]
+    theirs = [{"id": "a", "name": "A", "command": "y"}]
+    assert merge_task_dicts(base, ours, theirs) == [{"id": "a", "name": "A2", "command": "y"}]
+
+
+def test_conflicting_field_prefers_ours():
+    base = {"a": {"id": "a", "name": "A"}}
+    merged = merge_task_dicts(base, [{"id": "a", "name": "ours"}], [{"id": "a", "name": "theirs"}])
+    assert merged == [{"id": "a", "name": "ours"}]
+
+
+def test_additions_on_both_sides_are_kept():
+    merged = merge_task_dicts({}, [{"id": "a"}], [{"id": "b"}])
+    assert set(by_id(merged)) == {"a", "b"}
+
+
+def test_deletions_without_edits_win():
+    base = {"a": {"id": "a", "name": "A"}, "b": {"id": "b", "name": "B"}}
+    # 外部删除 a、程序删除 b，双方都没有修改被删除的任务
+    merged = merge_task_dicts(base, [{"id": "a", "name": "A"}], [{"id": "b", "name": "B"}])
+    assert merged == []
+
+
+def test_edit_beats_delete_on_either_side():
+    base = {"a": {"id": "a", "name": "A"}, "b": {"id": "b", "name": "B"}}
+    merged = merge_task_dicts(base, [{"id": "a", "name": "A2"}], [{"id": "b", "name": "B2"}])
+    assert by_id(merged) == {"a": {"id": "a", "name": "A2"}, "b": {"id": "b", "name": "B2"}}
+
+
+def make_task(task_id, name):
+    task = Task()
+    task.id = task_id
+    task.name = name
+    return task
+
+
+def test_save_merges_external_edit_into_existing_objects(tmp_path):
+    store = TaskStore(str(tmp_path / "tasks.json"))
+    first, second = make_task("a", "A"), make_task("b", "B")
+    assert store.save([first, second]) is None
+
+    with open(store.path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data[1]["name"] = "B external"
+    with open(store.path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.utime(store.path, ns=(0, 0))
+
+    first.name = "A local"
+    merged = store.save([first, second])
+    assert merged is not None
+    assert merged[0] is first and merged[1] is second
+    assert (first.name, second.name) == ("A local", "B external")
+    assert [task.name for task in TaskStore(store.path).load()] == ["A local", "B external"]
@@ -0,0 +1,66 @@
+import os
+import sys
+import threading
+from datetime import datetime
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from PyQt6.QtCore import QDate
+
+from scheduletime.core import Task, SimulatedClock
+from scheduletime.core.triggers import EventTriggerManager
+
+
+@pytest.fixture
+def app():
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+
+def make_process_task(task_id="process-test"):
+    task = Task()
+    task.id = task_id
+    task.schedule_type = "process_exit"
+    task.watch_process = "no-such-process-for-tests"
+    return task
+
+
+def live_watchers():
+    return [thread for thread in threading.enumerate() if thread.name == "process-trigger" and thread.is_alive()]
+
+
+def test_quick_remove_and_readd_keeps_one_watcher(app):
+    manager = EventTriggerManager()
+    manager.PROCESS_POLL_SECONDS = 0.05
+    task = make_process_task()
+    try:
+        manager.set_tasks([task])
+        first = manager.process_thread
+        manager.set_tasks([])
+        manager.set_tasks([task])
+        first.join(timeout=2.0)
+        assert not first.is_alive()
+        assert live_watchers() == [manager.process_thread]
+    finally:
+        manager.stop()
+        thread = manager.process_thread
+    assert thread is None
+
+
+def test_date_window_uses_injected_clock(app):
+    clock = SimulatedClock(datetime(2030, 6, 15, 12, 0))
+    manager = EventTriggerManager(clock=clock)
+    task = make_process_task()
+    task.start_date = QDate(2030, 6, 1)
+    task.end_date = QDate(2030, 6, 30)
+    assert manager.config_of(task) is not None
+
+    clock.advance_to(datetime(2030, 7, 1, 0, 0))
+    assert manager.config_of(task) is None
+    manager.stop()